@@ -0,0 +1,165 @@
+"""스크래핑용 부분 HTML 파싱 (lxml)
+
+페이지 전체를 BeautifulSoup 트리로 만들지 않고
+- HTMLPullParser에 페이지를 조금씩 넣다가 대상 요소가 닫히면 바로 멈추고
+- 미리 컴파일한 XPath로 그 요소 안에서만 값을 읽는다.
+
+텍스트 추출은 기존 BeautifulSoup 코드와 같은 결과가 되도록 맞췄다.
+- text_of(): get_text(strip=True) (텍스트 노드별 strip 후 연결, 주석 제외)
+- raw_text_of(): .text
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from lxml import etree
+
+FEED_CHUNK_SIZE = 16 * 1024
+
+
+def has_class_xpath(class_name: str) -> str:
+    """CSS '.class_name'에 해당하는 XPath 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+_TEXT_NODES = etree.XPath(".//text()")
+
+
+def text_of(element: Optional[etree._Element]) -> str:
+    if element is None:
+        return ""
+    return "".join(text.strip() for text in _TEXT_NODES(element))
+
+
+def raw_text_of(element: Optional[etree._Element]) -> str:
+    if element is None:
+        return ""
+    return "".join(_TEXT_NODES(element))
+
+
+def _has_class(element: etree._Element, class_name: str) -> bool:
+    return class_name in (element.get("class") or "").split()
+
+
+def find_element(
+    html: str,
+    class_name: str,
+    tag: Optional[str] = None,
+    fallback_to_root: bool = False,
+) -> Optional[etree._Element]:
+    """
+    class_name 클래스를 가진 첫 요소 (요소가 닫히는 순간 파싱 중단)
+
+    Args:
+        tag: 태그 이름 제한 (없으면 모든 태그)
+        fallback_to_root: 못 찾으면 None 대신 전체 문서 루트 반환
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag=tag)
+    for start in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + FEED_CHUNK_SIZE])
+        for _, element in parser.read_events():
+            if _has_class(element, class_name):
+                return element
+
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        return None
+    for _, element in parser.read_events():
+        if _has_class(element, class_name):
+            return element
+    return root if fallback_to_root else None
+
+
+def select(element: Optional[etree._Element], xpath: etree.XPath) -> List[etree._Element]:
+    if element is None:
+        return []
+    return xpath(element)
+
+
+def select_one(element: Optional[etree._Element], xpath: etree.XPath) -> Optional[etree._Element]:
+    found = select(element, xpath)
+    return found[0] if found else None
+
+
+# ---------------------------------------------------------------------------
+# 페이지별 파서
+# ---------------------------------------------------------------------------
+
+# 네이버 금융 시가총액 (table.type_2 tr / td)
+_MARKET_SUM_ROWS = etree.XPath(".//tr")
+_ROW_CELLS = etree.XPath(".//td")
+
+
+def parse_naver_market_sum(html: str, limit: int = 5) -> List[dict]:
+    """시가총액 표 상위 limit개 종목 (name, price, change, change_rate)"""
+    table = find_element(html, "type_2", tag="table")
+    result: List[dict] = []
+    for row in select(table, _MARKET_SUM_ROWS):
+        cols = _ROW_CELLS(row)
+        if len(cols) < 10:
+            continue
+
+        name = text_of(cols[1])
+        if not name:
+            continue
+
+        result.append({
+            "name": name,
+            "price": text_of(cols[2]),
+            "change": text_of(cols[3]),
+            "change_rate": text_of(cols[4]),
+        })
+        if len(result) >= limit:
+            break
+    return result
+
+
+# KoreaGoldX 시세 표 (div.tabulator-row / div.tabulator-cell[tabulator-field])
+_TABULATOR_ROWS = etree.XPath(f".//div[{has_class_xpath('tabulator-row')}]")
+_TABULATOR_CELLS = etree.XPath(f".//div[{has_class_xpath('tabulator-cell')}][@tabulator-field]")
+
+
+def iter_tabulator_rows(html: str) -> List[dict]:
+    """tabulator 표의 행별 {필드명: 셀 요소}"""
+    container = find_element(html, "tabulator-table", tag="div", fallback_to_root=True)
+    rows = []
+    for row in select(container, _TABULATOR_ROWS):
+        cells = {}
+        for cell in _TABULATOR_CELLS(row):
+            cells.setdefault(cell.get("tabulator-field"), cell)
+        rows.append(cells)
+    return rows
+
+
+# 동행복권 회차 결과 (.win_result 안의 회차/추첨일/당첨번호)
+_WIN_DRAW_NO = etree.XPath(".//h4//strong")
+_WIN_DESC = etree.XPath(f".//*[{has_class_xpath('desc')}]")
+_WIN_NUMBERS = etree.XPath(
+    f".//*[{has_class_xpath('num')} and {has_class_xpath('win')}]//*[{has_class_xpath('ball_645')}]"
+)
+_WIN_BONUS = etree.XPath(
+    f".//*[{has_class_xpath('num')} and {has_class_xpath('bonus')}]//*[{has_class_xpath('ball_645')}]"
+)
+
+
+def parse_lotto_win_result(html: str) -> Optional[dict]:
+    """
+    회차 결과 영역 원문 값 (숫자 변환/검증은 호출 쪽에서)
+
+    Returns:
+        {'draw_no_text', 'desc', 'numbers', 'bonus'} 또는 .win_result가 없으면 None
+    """
+    section = find_element(html, "win_result")
+    if section is None:
+        return None
+
+    draw_no = select_one(section, _WIN_DRAW_NO)
+    desc = select_one(section, _WIN_DESC)
+    bonus = select_one(section, _WIN_BONUS)
+    return {
+        "draw_no_text": raw_text_of(draw_no) if draw_no is not None else None,
+        "desc": raw_text_of(desc) if desc is not None else None,
+        "numbers": [raw_text_of(el).strip() for el in _WIN_NUMBERS(section)],
+        "bonus": raw_text_of(bonus).strip() if bonus is not None else None,
+    }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date as date_type, datetime
 import logging
 import re
@@ -7,10 +8,13 @@ import time
 from typing import Any, Dict, List, Optional
 
 import httpx
-from bs4 import BeautifulSoup
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from backend.app.collectors.html_extract import iter_tabulator_rows, raw_text_of
 from backend.app.db.models import KoreaMetalDaily
+from backend.app.utils.circuit_breaker import OPEN, breaker_for_url
+from backend.app.utils.http_clients import client_for_url
 
 logger = logging.getLogger(__name__)
 
@@ -40,14 +44,20 @@ def _get_with_retry(
     retries: int = 3,
     backoff: float = 1.5,
 ) -> Optional[httpx.Response]:
+    breaker = breaker_for_url(url)
+    if not breaker.allow():
+        logger.warning("KoreaGoldX HTTP 건너뜀 (회로 차단) %s", url)
+        return None
+
     for attempt in range(1, retries + 1):
         try:
-            with httpx.Client(timeout=timeout) as client:
-                resp = client.get(url)
-                resp.raise_for_status()
-                return resp
+            resp = client_for_url(url).get(url, timeout=timeout)
+            resp.raise_for_status()
+            breaker.record_success()
+            return resp
         except Exception as exc:
-            if attempt >= retries:
+            breaker.record_exception(exc)
+            if attempt >= retries or breaker.state == OPEN:
                 logger.error("KoreaGoldX HTTP 실패 %s attempt %s/%s: %s", url, attempt, retries, exc)
                 return None
             wait = backoff * attempt
@@ -62,14 +72,20 @@ def _post_with_retry(
     retries: int = 3,
     backoff: float = 1.5,
 ) -> Optional[httpx.Response]:
+    breaker = breaker_for_url(url)
+    if not breaker.allow():
+        logger.warning("KoreaGoldX HTTP 건너뜀 (회로 차단) %s", url)
+        return None
+
     for attempt in range(1, retries + 1):
         try:
-            with httpx.Client(timeout=timeout) as client:
-                resp = client.post(url, json=json_body)
-                resp.raise_for_status()
-                return resp
+            resp = client_for_url(url).post(url, json=json_body, timeout=timeout)
+            resp.raise_for_status()
+            breaker.record_success()
+            return resp
         except Exception as exc:
-            if attempt >= retries:
+            breaker.record_exception(exc)
+            if attempt >= retries or breaker.state == OPEN:
                 logger.error("KoreaGoldX HTTP 실패 %s attempt %s/%s: %s", url, attempt, retries, exc)
                 return None
             wait = backoff * attempt
@@ -106,26 +122,23 @@ def _parse_date(text: str) -> Optional[date_type]:
 
 
 def parse_koreagoldx(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "lxml")
-    rows = soup.select("div.tabulator-row")
     data = []
-    for row in rows:
-        get = lambda f: row.select_one(f'div.tabulator-cell[tabulator-field="{f}"]')
-        date_cell = get("date")
-        s_pure = get("s_pure")
-        p_pure = get("p_pure")
-        p_18k = get("p_18k")
-        p_14k = get("p_14k")
-
-        if not date_cell or not s_pure or not p_pure:
+    for cells in iter_tabulator_rows(html):
+        date_cell = cells.get("date")
+        s_pure = cells.get("s_pure")
+        p_pure = cells.get("p_pure")
+        p_18k = cells.get("p_18k")
+        p_14k = cells.get("p_14k")
+
+        if date_cell is None or s_pure is None or p_pure is None:
             continue
 
         data.append({
-            "date": date_cell.text.strip(),
-            "buy_3_75g": _to_int(s_pure.text),
-            "sell_3_75g": _to_int(p_pure.text),
-            "sell_18k": _to_int(p_18k.text) if p_18k else None,
-            "sell_14k": _to_int(p_14k.text) if p_14k else None,
+            "date": raw_text_of(date_cell).strip(),
+            "buy_3_75g": _to_int(raw_text_of(s_pure)),
+            "sell_3_75g": _to_int(raw_text_of(p_pure)),
+            "sell_18k": _to_int(raw_text_of(p_18k)) if p_18k is not None else None,
+            "sell_14k": _to_int(raw_text_of(p_14k)) if p_14k is not None else None,
         })
     return data
 
@@ -145,18 +158,52 @@ def _subtract_months(d: date_type, months: int) -> date_type:
     return date_type(year, month, day)
 
 
-def fetch_koreagoldx_latest(metal: str) -> Optional[Dict[str, Any]]:
+FULL_WINDOW_MONTHS = 5   # 저장된 시세가 없을 때 첫 조회 구간
+FETCH_WORKERS = len(KOREAGOLDX_TYPES)
+
+# srchDt는 화면의 기간 버튼 값 → 실제 구간은 dataDateStart/End로 지정하고 가장 가까운 버튼 값을 함께 보낸다
+SRCH_DT_LABELS = ((31, "1M"), (92, "3M"), (153, "5M"))
+
+
+def _srch_dt_label(start: date_type, end: date_type) -> str:
+    days = (end - start).days
+    for max_days, label in SRCH_DT_LABELS:
+        if days <= max_days:
+            return label
+    return SRCH_DT_LABELS[-1][1]
+
+
+def _parse_dt(text: str) -> Optional[datetime]:
+    cleaned = (text or "").strip()
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(cleaned, fmt)
+        except Exception:
+            continue
+    return None
+
+
+def fetch_koreagoldx_rows(
+    metal: str,
+    start: Optional[date_type] = None,
+    end: Optional[date_type] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    start~end 구간의 일별 시세 (날짜 오름차순, 같은 날짜가 여러 건이면 가장 늦은 시각)
+
+    start가 없으면 최근 5개월. 요청 실패/응답 오류는 None, 결과가 비면 [].
+    """
     type_code = KOREAGOLDX_TYPES.get(metal)
     if not type_code:
         return None
 
-    today = date_type.today()
-    start = _subtract_months(today, 5)
+    end = end or date_type.today()
+    start = start or _subtract_months(end, FULL_WINDOW_MONTHS)
     payload = {
-        "srchDt": "5M",
+        "srchDt": _srch_dt_label(start, end),
         "type": type_code,
         "dataDateStart": start.strftime("%Y.%m.%d"),
-        "dataDateEnd": today.strftime("%Y.%m.%d"),
+        "dataDateEnd": end.strftime("%Y.%m.%d"),
     }
 
     resp = _post_with_retry(KOREAGOLDX_API_URL, payload)
@@ -172,102 +219,141 @@ def fetch_koreagoldx_latest(metal: str) -> Optional[Dict[str, Any]]:
     rows = data.get("list") or []
     if not rows:
         logger.warning("KoreaGoldX API 결과 없음: %s", metal)
-        return None
+        return []
 
-    def _parse_dt(text: str) -> Optional[datetime]:
-        cleaned = (text or "").strip()
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(cleaned, fmt)
-            except Exception:
-                continue
-        return None
+    buy_field, sell_field, sell_18k_field, sell_14k_field = KOREAGOLDX_FIELDS.get(
+        metal, ("s_pure", "p_pure", "p_18k", "p_14k")
+    )
 
-    latest = None
-    latest_dt = None
+    by_date: Dict[date_type, tuple] = {}
     for row in rows:
         dt = _parse_dt(str(row.get("date", "")))
-        if dt and (latest_dt is None or dt > latest_dt):
-            latest = row
-            latest_dt = dt
+        if dt is None:
+            continue
+        # 구간 밖 행은 무시 (서버가 srchDt 기준으로 더 넓게 줄 수 있음)
+        if not (start <= dt.date() <= end):
+            continue
+        current = by_date.get(dt.date())
+        if current is None or dt > current[0]:
+            by_date[dt.date()] = (dt, row)
+
+    result = []
+    for day in sorted(by_date):
+        row = by_date[day][1]
+        result.append({
+            "date": day.isoformat(),
+            "buy_3_75g": _to_int_value(row.get(buy_field)) if buy_field else None,
+            "sell_3_75g": _to_int_value(row.get(sell_field)) if sell_field else None,
+            "sell_18k": _to_int_value(row.get(sell_18k_field)) if sell_18k_field else None,
+            "sell_14k": _to_int_value(row.get(sell_14k_field)) if sell_14k_field else None,
+            "source_url": KOREAGOLDX_API_URL,
+        })
+    return result
+
 
-    if not latest:
+def fetch_koreagoldx_latest(metal: str) -> Optional[Dict[str, Any]]:
+    rows = fetch_koreagoldx_rows(metal)
+    if not rows:
         return None
+    return rows[-1]
 
-    date_text = latest.get("date")
-    parsed_date = latest_dt.date() if latest_dt else _parse_date(str(date_text))
-    buy_field, sell_field, sell_18k_field, sell_14k_field = KOREAGOLDX_FIELDS.get(
-        metal, ("s_pure", "p_pure", "p_18k", "p_14k")
+
+def _latest_stored_dates(db: Session) -> Dict[str, date_type]:
+    """금속별 마지막 저장 날짜 (쿼리 1회)"""
+    rows = (
+        db.query(KoreaMetalDaily.metal, func.max(KoreaMetalDaily.date))
+        .filter(KoreaMetalDaily.date.isnot(None))
+        .group_by(KoreaMetalDaily.metal)
+        .all()
     )
-    return {
-        "date": parsed_date.isoformat() if parsed_date else str(date_text),
-        "buy_3_75g": _to_int_value(latest.get(buy_field)) if buy_field else None,
-        "sell_3_75g": _to_int_value(latest.get(sell_field)) if sell_field else None,
-        "sell_18k": _to_int_value(latest.get(sell_18k_field)) if sell_18k_field else None,
-        "sell_14k": _to_int_value(latest.get(sell_14k_field)) if sell_14k_field else None,
-        "source_url": KOREAGOLDX_API_URL,
-    }
+    return {metal: latest for metal, latest in rows if latest}
+
+
+def _fetch_all_metals(windows: Dict[str, date_type], today: date_type) -> Dict[str, List[Dict[str, Any]]]:
+    """금속별 구간을 동시에 조회 (호스트 공유 클라이언트의 연결 풀 재사용)"""
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_koreagoldx_rows, metal, start, today): metal
+            for metal, start in windows.items()
+        }
+        for future in as_completed(futures):
+            metal = futures[future]
+            try:
+                rows = future.result()
+            except Exception as exc:
+                logger.error("KoreaGoldX 조회 실패 %s: %s", metal, exc)
+                continue
+            if rows:
+                results[metal] = rows
+    return results
+
+
+_VALUE_FIELDS = ("buy_3_75g", "sell_3_75g", "sell_18k", "sell_14k", "source_url")
 
 
 def collect_korea_metal_daily(db: Session) -> List[KoreaMetalDaily]:
-    collected: List[KoreaMetalDaily] = []
+    """
+    국내 금/은/백금 일별 시세 수집
 
-    for metal in KOREAGOLDX_URLS.keys():
-        latest = fetch_koreagoldx_latest(metal)
-        if not latest:
-            continue
+    - 금속별 마지막 저장 날짜부터 오늘까지만 요청 (마지막 날은 장중 값이 바뀔 수 있어 다시 받음)
+    - 세 금속을 연결 풀 하나로 동시에 조회
+    - 받은 날짜 전체를 upsert (기존 행 1회 조회 → 바뀐 행만 갱신, 없는 날짜는 일괄 추가)
 
-        date_text = latest.get("date")
-        parsed_date = _parse_date(date_text)
+    Returns:
+        새로 추가되었거나 값이 바뀐 행
+    """
+    today = date_type.today()
+    latest_dates = _latest_stored_dates(db)
+    windows = {
+        metal: min(latest_dates.get(metal) or _subtract_months(today, FULL_WINDOW_MONTHS), today)
+        for metal in KOREAGOLDX_URLS.keys()
+    }
+
+    fetched = _fetch_all_metals(windows, today)
+    if not fetched:
+        return []
 
-        existing = (
-            db.query(KoreaMetalDaily)
-            .filter(KoreaMetalDaily.metal == metal)
-            .order_by(KoreaMetalDaily.date.desc(), KoreaMetalDaily.id.desc())
-            .first()
+    existing_rows = (
+        db.query(KoreaMetalDaily)
+        .filter(
+            KoreaMetalDaily.metal.in_(list(fetched.keys())),
+            KoreaMetalDaily.date >= min(windows[metal] for metal in fetched),
         )
+        .all()
+    )
+    existing = {(row.metal, row.date): row for row in existing_rows}
 
-        def _matches(row: KoreaMetalDaily) -> bool:
-            if parsed_date:
-                return row.date == parsed_date
-            return row.date is None and row.date_text == date_text
-
-        def _apply(row: KoreaMetalDaily) -> None:
-            row.date = parsed_date
-            row.date_text = date_text
-            row.buy_3_75g = latest.get("buy_3_75g")
-            row.sell_3_75g = latest.get("sell_3_75g")
-            row.sell_18k = latest.get("sell_18k")
-            row.sell_14k = latest.get("sell_14k")
-            row.source_url = latest.get("source_url")
-
-        if existing and _matches(existing):
-            before = (
-                existing.buy_3_75g,
-                existing.sell_3_75g,
-                existing.sell_18k,
-                existing.sell_14k,
-                existing.source_url,
-            )
-            _apply(existing)
-            after = (
-                existing.buy_3_75g,
-                existing.sell_3_75g,
-                existing.sell_18k,
-                existing.sell_14k,
-                existing.source_url,
-            )
+    collected: List[KoreaMetalDaily] = []
+    new_rows: List[KoreaMetalDaily] = []
+    for metal in KOREAGOLDX_URLS.keys():
+        for item in fetched.get(metal, []):
+            parsed_date = _parse_date(item["date"])
+            row = existing.get((metal, parsed_date))
+            if row is None:
+                row = KoreaMetalDaily(metal=metal, date=parsed_date, date_text=item["date"])
+                for field in _VALUE_FIELDS:
+                    setattr(row, field, item.get(field))
+                new_rows.append(row)
+                continue
+
+            before = tuple(getattr(row, field) for field in _VALUE_FIELDS)
+            after = tuple(item.get(field) for field in _VALUE_FIELDS)
             if before != after:
-                collected.append(existing)
-        else:
-            row = KoreaMetalDaily(metal=metal)
-            _apply(row)
-            db.add(row)
-            collected.append(row)
+                for field, value in zip(_VALUE_FIELDS, after):
+                    setattr(row, field, value)
+                row.date_text = item["date"]
+                collected.append(row)
+
+    if new_rows:
+        db.add_all(new_rows)
+        collected.extend(new_rows)
 
     if collected:
         db.commit()
-        for row in collected:
-            db.refresh(row)
+        logger.info(
+            "KoreaGoldX 시세 저장: 신규 %s건, 갱신 %s건",
+            len(new_rows), len(collected) - len(new_rows),
+        )
 
     return collected
@@ -2,13 +2,16 @@
 import json
 import html
 import re
-import requests
-from bs4 import BeautifulSoup
+import httpx
 import time
 import logging
+from pathlib import Path
 from typing import Optional, Dict, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from backend.app.collectors.html_extract import parse_lotto_win_result
 from backend.app.config import settings
+from backend.app.utils.circuit_breaker import breaker_for_url, is_failure_status
+from backend.app.utils.http_clients import client_for_url
 
 BASE_URL = "https://www.dhlottery.co.kr/common.do?method=getLottoNumber&drwNo={}"
 LATEST_URL = "https://dhlottery.co.kr/gameResult.do?method=byWin"
@@ -16,6 +19,50 @@ RESULT_URL = "https://www.dhlottery.co.kr/gameResult.do?method=byWin&drwNo={}"
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Referer': 'https://www.dhlottery.co.kr/'
+}
+
+# 최신 회차 워터마크 (마지막으로 확인된 최신 회차 + 캐시 만료 시각)
+LATEST_STATE_PATH = Path("logs") / "lotto_latest_state.json"
+
+KST = timezone(timedelta(hours=9))
+FIRST_DRAW_AT = datetime(2002, 12, 7, 20, 45, tzinfo=KST)  # 1회 추첨 (매주 토요일 20:45)
+DRAW_INTERVAL = timedelta(days=7)
+LATE_DRAW_RECHECK = timedelta(minutes=10)  # 추첨 직후 결과 미반영 시 재확인 간격
+
+
+def expected_latest_draw_no(now: datetime) -> int:
+    """현재 시각(KST) 기준 추첨이 끝났어야 하는 마지막 회차"""
+    if now < FIRST_DRAW_AT:
+        return 0
+    return (now - FIRST_DRAW_AT) // DRAW_INTERVAL + 1
+
+
+def next_draw_at(now: datetime) -> datetime:
+    """다음 추첨 시각 (토요일 20:45 KST)"""
+    return FIRST_DRAW_AT + DRAW_INTERVAL * expected_latest_draw_no(now)
+
+
+def _load_latest_state() -> Dict:
+    if not LATEST_STATE_PATH.exists():
+        return {}
+    try:
+        return json.loads(LATEST_STATE_PATH.read_text())
+    except Exception:
+        return {}
+
+
+def _save_latest_state(state: Dict) -> None:
+    try:
+        LATEST_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        LATEST_STATE_PATH.write_text(json.dumps(state))
+    except Exception as e:
+        logger.warning(f"최신 회차 워터마크 저장 실패: {e}")
+
 class LottoAPIClient:
     def __init__(self, delay: float = 0.3):
         """
@@ -23,46 +70,135 @@ class LottoAPIClient:
             delay: API 호출 간 딜레이 (초) - 사이트 부하 방지
         """
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Referer': 'https://www.dhlottery.co.kr/'
-        })
+        self.headers = dict(DEFAULT_HEADERS)
+
+    def _get(self, url: str, headers: Optional[Dict] = None, follow_redirects: bool = True, **kwargs) -> httpx.Response:
+        """호스트별 공유 클라이언트로 GET (연결 재사용, 스레드 간 공유 가능)"""
+        merged = {**self.headers, **headers} if headers else self.headers
+        return client_for_url(url).get(url, headers=merged, follow_redirects=follow_redirects, **kwargs)
     
-    def get_latest_draw_no(self) -> int:
+    def get_latest_draw_no(self, known_latest: Optional[int] = None, use_cache: bool = True) -> int:
         """
         최신 회차 번호 가져오기
 
         방법:
-        1. 회차 추정 (2002년 12월 시작, 주 1회)
-        2. 추정 회차부터 순차 확인 (HTML 파싱)
-        3. 실패 시 역순 탐색
+        1. 캐시된 워터마크가 다음 추첨(토 20:45 KST) 전까지 유효하면 그대로 반환
+        2. 워터마크(DB 최대 회차/마지막 확인 회차)부터 지수 탐색 + 이진 탐색 (O(log n) 요청)
+        3. 차단/실패 시 네이버 뉴스 기반 추정
+
+        Args:
+            known_latest: 이미 존재가 확인된 회차 (보통 DB 최대 회차)
+            use_cache: False면 캐시를 무시하고 다시 확인
         """
-        # 로또는 2002년 12월 7일 1회 시작, 매주 토요일
-        start_date = datetime(2002, 12, 7)
-        now = datetime.now()
-        weeks_passed = (now - start_date).days // 7
-        estimated = weeks_passed + 1  # 추정 회차
-
-        logger.info(f"로또 회차 추정: {estimated}회 (시작일로부터 {weeks_passed}주 경과)")
-
-        # JSON API 시도 (역순 탐색)
-        for draw_no in range(estimated, max(estimated - 20, 1), -1):
-            data, blocked = self._get_json(BASE_URL.format(draw_no))
-            if blocked:
-                logger.error("로또 API 접근 차단 감지 (redirect). 최신 회차 확인 불가")
-                return self._get_latest_draw_no_from_naver()
-            if not data:
-                continue
-            if data.get("returnValue") == "success":
-                logger.info(f"✅ 최신 회차: {draw_no}회 (JSON API)")
-                return draw_no
-            time.sleep(0.2)
+        now = datetime.now(KST)
+        expected = expected_latest_draw_no(now)
+        state = _load_latest_state()
+        cached = state.get("latest_draw_no") or 0
 
-        logger.error("최신 회차 확인 실패 (JSON API)")
-        return self._get_latest_draw_no_from_naver()
+        if use_cache and cached and cached >= (known_latest or 0):
+            try:
+                valid_until = datetime.fromisoformat(state["valid_until"])
+            except Exception:
+                valid_until = None
+            if valid_until and now < valid_until:
+                logger.info(f"최신 회차 캐시 사용: {cached}회 (~{valid_until:%m-%d %H:%M})")
+                return cached
+
+        watermark = min(max(known_latest or 0, cached), expected)
+        logger.info(f"최신 회차 탐색: 워터마크 {watermark}회, 일정상 최신 {expected}회")
+
+        latest = self._search_latest_draw_no(watermark, expected)
+        if latest is None:
+            naver_latest = self._get_latest_draw_no_from_naver()
+            return naver_latest or watermark
+
+        # 일정상 최신 회차까지 반영됐으면 다음 추첨까지, 아직이면 잠시 후 재확인
+        if latest >= expected:
+            valid_until = next_draw_at(now)
+        else:
+            valid_until = now + LATE_DRAW_RECHECK
+        _save_latest_state({
+            "latest_draw_no": latest,
+            "checked_at": now.isoformat(),
+            "valid_until": valid_until.isoformat(),
+        })
+        logger.info(f"✅ 최신 회차: {latest}회 (JSON API)")
+        return latest
+
+    def _draw_exists(self, draw_no: int) -> Optional[bool]:
+        """회차 존재 여부 (차단/응답 없음이면 None)"""
+        data, blocked = self._get_json(BASE_URL.format(draw_no))
+        if blocked:
+            logger.error("로또 API 접근 차단 감지 (redirect). 최신 회차 확인 불가")
+            return None
+        if not data:
+            return None
+        if data.get("returnValue") == "success":
+            return True
+        if data.get("returnValue") == "fail":
+            return False
+        return None
+
+    def _search_latest_draw_no(self, watermark: int, expected: int) -> Optional[int]:
+        """
+        지수 탐색(galloping) + 이진 탐색으로 최신 회차 확인
+
+        - watermark > 0: 존재가 확인된 회차에서 1, 2, 4, ... 칸씩 앞으로 탐색
+        - watermark == 0: 일정상 최신 회차에서 1, 2, 4, ... 칸씩 뒤로 탐색
+        - expected + 1 회차는 아직 추첨 전이므로 상한(미존재)으로 둔다
+
+        Returns:
+            최신 회차, 차단/실패 시 None
+        """
+        upper = expected + 1  # 미존재가 보장된 회차
+        probes = 0
+
+        def probe(draw_no: int) -> Optional[bool]:
+            nonlocal probes
+            if probes:
+                time.sleep(0.2)
+            probes += 1
+            return self._draw_exists(draw_no)
+
+        if watermark > 0:
+            lo, hi, step = watermark, upper, 1
+            while lo + step < upper:
+                found = probe(lo + step)
+                if found is None:
+                    return None
+                if not found:
+                    hi = lo + step
+                    break
+                lo += step
+                step *= 2
+        else:
+            hi, step = upper, 1
+            while True:
+                draw_no = max(1, upper - step)
+                found = probe(draw_no)
+                if found is None:
+                    return None
+                if found:
+                    lo = draw_no
+                    break
+                if draw_no == 1:
+                    logger.error("최신 회차 확인 실패 (JSON API)")
+                    return None
+                hi = draw_no
+                step *= 2
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            found = probe(mid)
+            if found is None:
+                return None
+            if found:
+                lo = mid
+            else:
+                hi = mid
+
+        logger.info(f"최신 회차 탐색 완료: {lo}회 (요청 {probes}회)")
+        return lo
 
     def _fetch_draw_html(self, draw_no: int) -> Optional[Dict]:
         """
@@ -74,46 +210,44 @@ class LottoAPIClient:
         Returns:
             회차 정보 dict 또는 None
         """
+        url = RESULT_URL.format(draw_no)
+        breaker = breaker_for_url(url)
+        if not breaker.allow():
+            return None
+
         try:
-            url = RESULT_URL.format(draw_no)
-            res = self.session.get(url, timeout=10)
+            res = self._get(url, timeout=10)
             res.raise_for_status()
+            breaker.record_success()
 
-            soup = BeautifulSoup(res.text, "html.parser")
-
-            # 회차 확인
-            draw_no_elem = soup.select_one(".win_result h4 strong")
-            if not draw_no_elem:
+            # 회차 결과 영역(.win_result)만 부분 파싱
+            section = parse_lotto_win_result(res.text)
+            if not section or section["draw_no_text"] is None:
                 return None
 
             # 추첨일 찾기
-            date_text = soup.select_one(".win_result .desc")
-            if not date_text:
+            if section["desc"] is None:
                 return None
 
-            date_match = re.search(r"(\d{4})\. (\d{2})\. (\d{2})", date_text.text)
+            date_match = re.search(r"(\d{4})\. (\d{2})\. (\d{2})", section["desc"])
             if not date_match:
                 return None
 
             draw_date = f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
 
             # 당첨번호 찾기
-            number_elems = soup.select(".win_result .num.win .ball_645")
-            bonus_elem = soup.select_one(".win_result .num.bonus .ball_645")
-
-            if len(number_elems) != 6 or not bonus_elem:
+            if len(section["numbers"]) != 6 or section["bonus"] is None:
                 return None
 
             # 번호 추출
             numbers = []
-            for elem in number_elems:
-                num_text = elem.text.strip()
+            for num_text in section["numbers"]:
                 try:
                     numbers.append(int(num_text))
                 except ValueError:
                     return None
 
-            bonus_text = bonus_elem.text.strip()
+            bonus_text = section["bonus"]
             try:
                 bonus = int(bonus_text)
             except ValueError:
@@ -132,6 +266,8 @@ class LottoAPIClient:
             }
 
         except Exception as e:
+            if isinstance(e, httpx.HTTPError):
+                breaker.record_exception(e)
             logger.debug(f"HTML 파싱 실패 (회차 {draw_no}): {e}")
             return None
 
@@ -147,11 +283,26 @@ class LottoAPIClient:
             return None
 
     def _get_json(self, url: str) -> tuple[Optional[Dict], bool]:
-        """JSON API 요청. redirect면 차단으로 간주. 차단 시 프록시로 재시도."""
+        """
+        JSON API 요청. redirect면 차단으로 간주. 차단 시 프록시로 재시도.
+
+        회로가 열려 있으면(최근 차단/장애 반복) 요청 없이 차단으로 반환해
+        호출부가 바로 대체 경로(네이버)로 넘어가게 한다.
+        """
+        breaker = breaker_for_url(url)
+        if not breaker.allow():
+            logger.info(f"로또 API 회로 차단 중 ({breaker.name}) → 대체 경로 사용")
+            return None, True
+
         try:
-            res = self.session.get(url, timeout=10, allow_redirects=False)
+            res = self._get(url, timeout=10, follow_redirects=False)
             if res.status_code in (301, 302, 303, 307, 308):
+                breaker.record_failure(f"redirect {res.status_code}")
                 return self._get_json_via_proxy(url), True
+            if is_failure_status(res.status_code):
+                breaker.record_failure(f"status {res.status_code}")
+            else:
+                breaker.record_success()
             try:
                 data = res.json()
                 return data, False
@@ -159,6 +310,7 @@ class LottoAPIClient:
                 # HTML/텍스트 응답일 수 있어 프록시 시도
                 return self._get_json_via_proxy(url), False
         except Exception as e:
+            breaker.record_exception(e)
             logger.warning(f"로또 JSON API 요청 실패: {e}")
             return self._get_json_via_proxy(url), False
 
@@ -171,7 +323,18 @@ class LottoAPIClient:
                 f"https://r.jina.ai/https://{url_no_scheme}",
             ]
             for proxy_url in proxy_urls:
-                res = self.session.get(proxy_url, timeout=15)
+                breaker = breaker_for_url(proxy_url)
+                if not breaker.allow():
+                    return None
+                try:
+                    res = self._get(proxy_url, timeout=15)
+                except httpx.HTTPError as e:
+                    breaker.record_exception(e)
+                    raise
+                if is_failure_status(res.status_code):
+                    breaker.record_failure(f"status {res.status_code}")
+                else:
+                    breaker.record_success()
                 if res.status_code != 200:
                     continue
                 data = self._extract_json_from_text(res.text)
@@ -195,7 +358,7 @@ class LottoAPIClient:
             "sort": "date",
         }
         try:
-            res = self.session.get(
+            res = self._get(
                 "https://openapi.naver.com/v1/search/news.json",
                 headers=headers,
                 params=params,
@@ -327,7 +490,7 @@ class LottoAPIClient:
                     logger.info(f"회차 {draw_no} 데이터 없음 (API 응답: fail)")
                     return None
 
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.warning(f"회차 {draw_no} JSON API 요청 실패: {e}")
 
             # 방법 2: HTML 파싱 시도
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta, timezone
 import time
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 import httpx
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
+from backend.app.collectors.html_extract import parse_naver_market_sum
 from backend.app.config import settings
 from backend.app.db.models import MarketDaily
+from backend.app.utils.circuit_breaker import OPEN, breaker_for_url
+from backend.app.utils.http_clients import client_for_url
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +53,21 @@ def _get_with_retry(
     retries: int = 3,
     backoff: float = 1.5,
 ) -> Optional[httpx.Response]:
-    """httpx GET 래퍼: 커넥션 리셋 등 일시 오류를 재시도."""
+    """httpx GET 래퍼: 커넥션 리셋 등 일시 오류를 재시도 (회로 차단 중인 호스트는 즉시 None)."""
+    breaker = breaker_for_url(url)
+    if not breaker.allow():
+        logger.warning("HTTP GET 건너뜀 (회로 차단: %s) %s", breaker.name, url)
+        return None
+
     for attempt in range(1, retries + 1):
         try:
-            with httpx.Client(timeout=timeout) as client:
-                resp = client.get(url, params=params)
-                resp.raise_for_status()
-                return resp
+            resp = client_for_url(url).get(url, params=params, timeout=timeout)
+            resp.raise_for_status()
+            breaker.record_success()
+            return resp
         except Exception as e:
-            if attempt >= retries:
+            breaker.record_exception(e)
+            if attempt >= retries or breaker.state == OPEN:
                 logger.error(
                     "HTTP GET 실패 (종료) %s attempt %s/%s: %s",
                     url,
@@ -138,10 +147,9 @@ def fetch_exchange_rates_naver() -> Dict[str, Dict[str, Any]]:
         try:
             url = f"{NAVER_EXCHANGE_RATE_URL}/{info['code']}"
 
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp.raise_for_status()
-                data = resp.json()
+            resp = client_for_url(url).get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10.0)
+            resp.raise_for_status()
+            data = resp.json()
 
             # 네이버 API 응답은 exchangeInfo 내부에 데이터가 있음
             exchange_info = data.get("exchangeInfo", {})
@@ -247,17 +255,17 @@ def fetch_metals_from_metalprice() -> Tuple[Optional[float], Optional[float], Op
         return None, None, None
 
     try:
-        with httpx.Client(timeout=10) as client:
-            resp = client.get(
-                METALPRICE_BASE_URL,
-                params={
-                    "api_key": settings.METALPRICE_API_KEY,
-                    "base": "USD",
-                    "currencies": "XAU,XAG",  # 금, 은만 (구리는 유료)
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = client_for_url(METALPRICE_BASE_URL).get(
+            METALPRICE_BASE_URL,
+            params={
+                "api_key": settings.METALPRICE_API_KEY,
+                "base": "USD",
+                "currencies": "XAU,XAG",  # 금, 은만 (구리는 유료)
+            },
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
     except Exception:
         return None, None, None
 
@@ -350,6 +358,184 @@ def fetch_all_metals_from_metalsdev() -> Dict[str, Optional[float]]:
     return result
 
 
+# 네이버 지수/해외주식 시세 API
+NAVER_INDEX_URL = "https://api.stock.naver.com/index/{code}/basic"
+NAVER_STOCK_URL = "https://api.stock.naver.com/stock/{code}/basic"
+NAVER_DOMESTIC_INDEX_URL = "https://m.stock.naver.com/api/index/{code}/basic"
+
+QUOTE_DEADLINE = 8.0   # 묶음 전체 제한 시간 (초과한 종목은 빼고 반환)
+QUOTE_MAX_WORKERS = 8
+
+# compareToPreviousPrice.name → 등락 부호
+_DIRECTION_SIGNS = {
+    "RISING": 1,
+    "UPPER_LIMIT": 1,
+    "FALLING": -1,
+    "LOWER_LIMIT": -1,
+}
+
+
+def _unsigned(value: Any) -> str:
+    """'1,234.5' / '-0.52' 같은 값에서 쉼표/부호를 뗀 문자열 (부호는 방향 필드로 통일)"""
+    return str(value if value is not None else "0").replace(",", "").strip().lstrip("+-") or "0"
+
+
+def _parse_naver_quote(data: Dict[str, Any]) -> Dict[str, Any]:
+    """네이버 시세 응답 → 부호를 정리한 공통 형식"""
+    price_info = data.get("compareToPreviousPrice") or {}
+    return {
+        "close_price": str(data.get("closePrice", "0")).replace(",", ""),
+        "fluctuation": _unsigned(data.get("fluctuationsRatio")),
+        "compare_price": _unsigned(data.get("compareToPreviousClosePrice")),
+        "sign": _DIRECTION_SIGNS.get(price_info.get("name", ""), 0),
+    }
+
+
+def _signed_rate(quote: Dict[str, Any]) -> str:
+    """등락률 표시 문자열 ('+1.23%', '-0.52%', '0.00%')"""
+    prefix = {1: "+", -1: "-"}.get(quote["sign"], "")
+    return f"{prefix}{quote['fluctuation']}%"
+
+
+def fetch_quotes_by_url(
+    targets: List[Tuple[str, str]],
+    deadline: float = QUOTE_DEADLINE,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 시세 URL을 호스트별 공유(keep-alive) 클라이언트로 동시에 조회
+
+    Args:
+        targets: [(key, url), ...]
+        deadline: 전체 제한 시간 (초) - 넘긴 요청은 결과에서 빠진다
+
+    Returns:
+        {key: _parse_naver_quote() 결과} (실패/시간 초과 key는 없음)
+    """
+    allowed = []
+    for key, url in targets:
+        breaker = breaker_for_url(url)
+        if breaker.allow():
+            allowed.append((key, url))
+        else:
+            logger.warning("시세 조회 건너뜀 (회로 차단: %s) %s", breaker.name, key)
+    if not allowed:
+        return {}
+
+    def _fetch(url: str) -> Dict[str, Any]:
+        breaker = breaker_for_url(url)
+        try:
+            resp = client_for_url(url).get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=deadline)
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception as e:
+            breaker.record_exception(e)
+            raise
+        breaker.record_success()
+        return _parse_naver_quote(data)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    executor = ThreadPoolExecutor(max_workers=min(len(allowed), QUOTE_MAX_WORKERS))
+    try:
+        futures = {executor.submit(_fetch, url): key for key, url in allowed}
+        done, pending = wait(futures, timeout=deadline)
+        for future in done:
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.warning("시세 조회 실패 %s: %s", key, e)
+        if pending:
+            logger.warning(
+                "시세 조회 시간 초과 (%.1fs): %s",
+                deadline,
+                ", ".join(sorted(futures[f] for f in pending)),
+            )
+    finally:
+        # 시간 초과로 남은 요청은 기다리지 않음 (요청 timeout=deadline이라 곧 끝남)
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def fetch_naver_quotes(
+    items: List[Tuple[str, str]],
+    url_template: str = NAVER_INDEX_URL,
+    deadline: float = QUOTE_DEADLINE,
+) -> List[Dict[str, Any]]:
+    """
+    (code, name) 목록의 시세를 동시에 조회 (입력 순서 유지, 실패한 종목은 제외)
+
+    Returns:
+        [{"code", "name", "close_price", "fluctuation", "compare_price", "sign"}, ...]
+    """
+    quotes = fetch_quotes_by_url(
+        [(code, url_template.format(code=code)) for code, _ in items],
+        deadline=deadline,
+    )
+    return [
+        {"code": code, "name": name, **quotes[code]}
+        for code, name in items
+        if code in quotes
+    ]
+
+
+def _index_summary(quote: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """지수 시세 → MarketDaily용 {"index", "change", "change_pct"} (없으면 {})"""
+    if not quote:
+        return {}
+    try:
+        sign = quote["sign"]
+        return {
+            "index": float(quote["close_price"]),
+            "change": sign * float(quote["compare_price"]),
+            "change_pct": sign * float(quote["fluctuation"]),
+        }
+    except (TypeError, ValueError) as e:
+        logger.error(f"지수 시세 변환 실패: {e}")
+        return {}
+
+
+# MarketDaily에 저장하는 주요 지수 (key → 조회 URL)
+MAJOR_INDEX_URLS = {
+    "kospi": NAVER_DOMESTIC_INDEX_URL.format(code="KOSPI"),
+    "kosdaq": NAVER_DOMESTIC_INDEX_URL.format(code="KOSDAQ"),
+    "nasdaq100": NAVER_INDEX_URL.format(code=".NDX"),
+    "sp500": NAVER_INDEX_URL.format(code=".INX"),
+}
+
+
+def fetch_major_indices() -> Dict[str, Dict[str, Any]]:
+    """KOSPI/KOSDAQ/나스닥100/S&P500 지수를 한 번에 조회"""
+    quotes = fetch_quotes_by_url(list(MAJOR_INDEX_URLS.items()))
+    return {key: _index_summary(quotes.get(key)) for key in MAJOR_INDEX_URLS}
+
+
+def _fetch_major_index(key: str, label: str) -> Dict[str, Any]:
+    quotes = fetch_quotes_by_url([(key, MAJOR_INDEX_URLS[key])])
+    if key not in quotes:
+        logger.error(f"{label} 지수 수집 실패")
+    return _index_summary(quotes.get(key))
+
+
+def fetch_kospi_index() -> Dict[str, Any]:
+    """네이버 모바일 API에서 KOSPI 지수 가져오기"""
+    return _fetch_major_index("kospi", "KOSPI")
+
+
+def fetch_kosdaq_index() -> Dict[str, Any]:
+    """네이버 모바일 API에서 KOSDAQ 지수 가져오기"""
+    return _fetch_major_index("kosdaq", "KOSDAQ")
+
+
+def fetch_sp500_index() -> Dict[str, Any]:
+    """네이버 API에서 S&P500 지수 가져오기"""
+    return _fetch_major_index("sp500", "S&P500")
+
+
+def fetch_nasdaq100_index() -> Dict[str, Any]:
+    """네이버 API에서 나스닥 100 지수 가져오기"""
+    return _fetch_major_index("nasdaq100", "나스닥100")
+
+
 def fetch_kospi_top5() -> List[Dict[str, Any]]:
     """네이버 모바일 API에서 KOSPI 시가총액 상위 5종목을 가져옵니다.
 
@@ -358,10 +544,9 @@ def fetch_kospi_top5() -> List[Dict[str, Any]]:
     url = "https://m.stock.naver.com/api/stocks/marketValue/KOSPI?page=1&pageSize=5"
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
+        resp = client_for_url(url).get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10.0)
+        resp.raise_for_status()
+        data = resp.json()
     except Exception as e:
         logger.warning(f"KOSPI TOP5 모바일 API 실패: {e}")
         return _fetch_kospi_top5_fallback()
@@ -409,111 +594,8 @@ def _fetch_kospi_top5_fallback() -> List[Dict[str, Any]]:
         return []
     html = resp.text
 
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.select("table.type_2 tr")
-
-    top5: List[Dict[str, Any]] = []
-    for row in rows:
-        cols = row.select("td")
-        if len(cols) < 10:
-            continue
-
-        name = cols[1].get_text(strip=True)
-        price = cols[2].get_text(strip=True)
-        change = cols[3].get_text(strip=True)
-        change_rate = cols[4].get_text(strip=True)
-
-        if not name:
-            continue
-
-        top5.append(
-            {
-                "name": name,
-                "price": price,
-                "change": change,
-                "change_rate": change_rate,
-            }
-        )
-
-        if len(top5) >= 5:
-            break
-
-    return top5
-
-
-def fetch_kospi_index() -> Dict[str, Any]:
-    """네이버 모바일 API에서 KOSPI 지수 가져오기"""
-    url = "https://m.stock.naver.com/api/index/KOSPI/basic"
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
-
-        close_price = data.get("closePrice", "0").replace(",", "")
-        fluctuation = data.get("fluctuationsRatio", "0")
-        compare_price = data.get("compareToPreviousClosePrice", "0").replace(",", "")
-        price_info = data.get("compareToPreviousPrice", {})
-        is_rising = price_info.get("name") == "RISING"
-
-        return {
-            "index": float(close_price),
-            "change": float(compare_price) if is_rising else -float(compare_price),
-            "change_pct": float(fluctuation) if is_rising else -float(fluctuation),
-        }
-    except Exception as e:
-        logger.error(f"KOSPI 지수 수집 실패: {e}", exc_info=True)
-        return {}
-
-
-def fetch_kosdaq_index() -> Dict[str, Any]:
-    """네이버 모바일 API에서 KOSDAQ 지수 가져오기"""
-    url = "https://m.stock.naver.com/api/index/KOSDAQ/basic"
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
-
-        close_price = data.get("closePrice", "0").replace(",", "")
-        fluctuation = data.get("fluctuationsRatio", "0")
-        compare_price = data.get("compareToPreviousClosePrice", "0").replace(",", "")
-        price_info = data.get("compareToPreviousPrice", {})
-        is_rising = price_info.get("name") == "RISING"
-
-        return {
-            "index": float(close_price),
-            "change": float(compare_price) if is_rising else -float(compare_price),
-            "change_pct": float(fluctuation) if is_rising else -float(fluctuation),
-        }
-    except Exception as e:
-        logger.error(f"KOSDAQ 지수 수집 실패: {e}", exc_info=True)
-        return {}
-
-
-def fetch_sp500_index() -> Dict[str, Any]:
-    """네이버 API에서 S&P500 지수 가져오기"""
-    url = "https://api.stock.naver.com/index/.INX/basic"
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
-
-        close_price = data.get("closePrice", "0").replace(",", "")
-        fluctuation = data.get("fluctuationsRatio", "0")
-        compare_price = data.get("compareToPreviousClosePrice", "0").replace(",", "")
-        price_info = data.get("compareToPreviousPrice", {})
-        is_rising = price_info.get("name") == "RISING"
-
-        return {
-            "index": float(close_price),
-            "change": float(compare_price) if is_rising else -float(compare_price),
-            "change_pct": float(fluctuation) if is_rising else -float(fluctuation),
-        }
-    except Exception as e:
-        logger.error(f"S&P500 지수 수집 실패: {e}", exc_info=True)
-        return {}
+    # 시가총액 표(table.type_2)만 부분 파싱
+    return parse_naver_market_sum(html, limit=5)
 
 
 def fetch_kosdaq_top5() -> List[Dict[str, Any]]:
@@ -521,10 +603,9 @@ def fetch_kosdaq_top5() -> List[Dict[str, Any]]:
     url = "https://m.stock.naver.com/api/stocks/marketValue/KOSDAQ?page=1&pageSize=5"
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
+        resp = client_for_url(url).get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10.0)
+        resp.raise_for_status()
+        data = resp.json()
     except Exception as e:
         logger.warning(f"KOSDAQ TOP5 모바일 API 실패: {e}")
         return []
@@ -570,37 +651,10 @@ def fetch_us_indices() -> List[Dict[str, Any]]:
         (".SOX", "필라델피아반도체"),
         (".VIX", "VIX공포지수"),
     ]
-
-    results = []
-    for code, name in indices:
-        try:
-            url = f"https://api.stock.naver.com/index/{code}/basic"
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp.raise_for_status()
-                data = resp.json()
-
-            close_price = data.get("closePrice", "0").replace(",", "")
-            fluctuation = data.get("fluctuationsRatio", "0")
-            price_info = data.get("compareToPreviousPrice", {})
-            price_name = price_info.get("name", "")
-
-            if price_name == "RISING":
-                sign = "+"
-            elif price_name == "FALLING":
-                sign = "-"
-            else:
-                sign = ""
-
-            results.append({
-                "name": name,
-                "price": close_price,
-                "change_rate": f"{sign}{fluctuation}%",
-            })
-        except Exception as e:
-            logger.warning(f"미국 지수 {name} 수집 실패: {e}")
-
-    return results
+    return [
+        {"name": q["name"], "price": q["close_price"], "change_rate": _signed_rate(q)}
+        for q in fetch_naver_quotes(indices)
+    ]
 
 
 def fetch_asian_indices() -> List[Dict[str, Any]]:
@@ -610,37 +664,10 @@ def fetch_asian_indices() -> List[Dict[str, Any]]:
         (".HSI", "항셍"),
         (".SSEC", "상해종합"),
     ]
-
-    results = []
-    for code, name in indices:
-        try:
-            url = f"https://api.stock.naver.com/index/{code}/basic"
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp.raise_for_status()
-                data = resp.json()
-
-            close_price = data.get("closePrice", "0").replace(",", "")
-            fluctuation = data.get("fluctuationsRatio", "0")
-            price_info = data.get("compareToPreviousPrice", {})
-            price_name = price_info.get("name", "")
-
-            if price_name == "RISING":
-                sign = "+"
-            elif price_name == "FALLING":
-                sign = "-"
-            else:
-                sign = ""
-
-            results.append({
-                "name": name,
-                "price": close_price,
-                "change_rate": f"{sign}{fluctuation}%",
-            })
-        except Exception as e:
-            logger.warning(f"아시아 지수 {name} 수집 실패: {e}")
-
-    return results
+    return [
+        {"name": q["name"], "price": q["close_price"], "change_rate": _signed_rate(q)}
+        for q in fetch_naver_quotes(indices)
+    ]
 
 
 def fetch_european_indices() -> List[Dict[str, Any]]:
@@ -649,37 +676,10 @@ def fetch_european_indices() -> List[Dict[str, Any]]:
         (".GDAXI", "독일DAX"),
         (".FTSE", "영국FTSE"),
     ]
-
-    results = []
-    for code, name in indices:
-        try:
-            url = f"https://api.stock.naver.com/index/{code}/basic"
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp.raise_for_status()
-                data = resp.json()
-
-            close_price = data.get("closePrice", "0").replace(",", "")
-            fluctuation = data.get("fluctuationsRatio", "0")
-            price_info = data.get("compareToPreviousPrice", {})
-            price_name = price_info.get("name", "")
-
-            if price_name == "RISING":
-                sign = "+"
-            elif price_name == "FALLING":
-                sign = "-"
-            else:
-                sign = ""
-
-            results.append({
-                "name": name,
-                "price": close_price,
-                "change_rate": f"{sign}{fluctuation}%",
-            })
-        except Exception as e:
-            logger.warning(f"유럽 지수 {name} 수집 실패: {e}")
-
-    return results
+    return [
+        {"name": q["name"], "price": q["close_price"], "change_rate": _signed_rate(q)}
+        for q in fetch_naver_quotes(indices)
+    ]
 
 
 def fetch_us_stocks() -> List[Dict[str, Any]]:
@@ -691,62 +691,10 @@ def fetch_us_stocks() -> List[Dict[str, Any]]:
         ("MSFT.O", "마이크로소프트"),
         ("AMZN.O", "아마존"),
     ]
-
-    results = []
-    for code, name in stocks:
-        try:
-            url = f"https://api.stock.naver.com/stock/{code}/basic"
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp.raise_for_status()
-                data = resp.json()
-
-            close_price = data.get("closePrice", "0").replace(",", "")
-            fluctuation = data.get("fluctuationsRatio", "0")
-            price_info = data.get("compareToPreviousPrice", {})
-            price_name = price_info.get("name", "")
-
-            if price_name == "RISING":
-                sign = "+"
-            elif price_name == "FALLING":
-                sign = "-"
-            else:
-                sign = ""
-
-            results.append({
-                "name": name,
-                "price": f"${close_price}",
-                "change_rate": f"{sign}{fluctuation}%",
-            })
-        except Exception as e:
-            logger.warning(f"미국 주식 {name} 수집 실패: {e}")
-
-    return results
-
-
-def fetch_nasdaq100_index() -> Dict[str, Any]:
-    """네이버 API에서 나스닥 100 지수 가져오기"""
-    url = "https://api.stock.naver.com/index/.NDX/basic"
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
-
-        close_price = data.get("closePrice", "0").replace(",", "")
-        fluctuation = data.get("fluctuationsRatio", "0")
-        compare_price = data.get("compareToPreviousClosePrice", "0").replace(",", "")
-        price_info = data.get("compareToPreviousPrice", {})
-        is_rising = price_info.get("name") == "RISING"
-
-        return {
-            "index": float(close_price),
-            "change": float(compare_price) if is_rising else -float(compare_price),
-            "change_pct": float(fluctuation) if is_rising else -float(fluctuation),
-        }
-    except Exception as e:
-        logger.error(f"나스닥100 지수 수집 실패: {e}", exc_info=True)
-        return {}
+    return [
+        {"name": q["name"], "price": f"${q['close_price']}", "change_rate": _signed_rate(q)}
+        for q in fetch_naver_quotes(stocks, url_template=NAVER_STOCK_URL)
+    ]
 
 
 def collect_market_daily(db: Session) -> MarketDaily:
@@ -775,11 +723,12 @@ def collect_market_daily(db: Session) -> MarketDaily:
     kospi_top5 = fetch_kospi_top5()
     kosdaq_top5 = fetch_kosdaq_top5()
 
-    # KOSPI/KOSDAQ/나스닥/S&P500 지수 수집
-    kospi_data = fetch_kospi_index()
-    kosdaq_data = fetch_kosdaq_index()
-    nasdaq_data = fetch_nasdaq100_index()
-    sp500_data = fetch_sp500_index()
+    # KOSPI/KOSDAQ/나스닥/S&P500 지수 수집 (한 번에 동시 조회)
+    major_indices = fetch_major_indices()
+    kospi_data = major_indices["kospi"]
+    kosdaq_data = major_indices["kosdaq"]
+    nasdaq_data = major_indices["nasdaq100"]
+    sp500_data = major_indices["sp500"]
     
     # BTC KRW 계산 (USD * 환율)
     if btc_usd and usd_krw and not btc_krw:
@@ -2,13 +2,13 @@
 from datetime import date, timedelta
 from typing import List, Dict, Any
 
-import httpx
 import re
 from sqlalchemy.orm import Session
 
 from backend.app.config import settings
 from backend.app.db.models import NewsDaily
 from backend.app.utils.filters import is_breaking_news
+from backend.app.utils.http_clients import client_for_url
 
 NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
 
@@ -49,10 +49,9 @@ def fetch_naver_news_raw(
         "sort": sort,
     }
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.get(NAVER_NEWS_URL, headers=headers, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = client_for_url(NAVER_NEWS_URL).get(NAVER_NEWS_URL, headers=headers, params=params, timeout=10.0)
+    resp.raise_for_status()
+    data = resp.json()
 
     return data.get("items", [])
 
@@ -3,21 +3,20 @@ Morning Bot v3.0 - 언론사별 수집 + 핫 점수 시스템
 """
 
 from datetime import date, datetime, timedelta, timezone
-from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any
 from sqlalchemy import func
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
-import httpx
 import re
 
+from backend.app.collectors.news_watermark import PAGE_SIZE, fetch_incremental
 from backend.app.config import settings
 from backend.app.db.models import NewsDaily
-from backend.app.utils.filters import extract_press_from_url, PRESS_BREAKING_CONFIG
-from backend.app.utils.category_keywords import classify_category
+from backend.app.utils.http_clients import client_for_url
 
 NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
+BREAKING_QUERY = "속보"
+STORY_REPEAT_DAYS = 3  # 이 기간 안에 TOP에 든 스토리는 랭킹에서 제외
 KST_TZ = timezone(timedelta(hours=9))
 
 # 20개 언론사
@@ -71,8 +70,8 @@ def check_breaking_tag(title: str) -> bool:
     return False
 
 
-def fetch_naver_news_raw(query: str, display: int = 100) -> List[Dict[str, Any]]:
-    """네이버 뉴스 API 호출"""
+def fetch_naver_news_raw(query: str, display: int = 100, start: int = 1) -> List[Dict[str, Any]]:
+    """네이버 뉴스 API 호출 (start: 1~1000, 최신순 페이지 시작 위치)"""
     
     if not settings.NAVER_CLIENT_ID or not settings.NAVER_CLIENT_SECRET:
         raise RuntimeError("NAVER credentials not set")
@@ -84,11 +83,12 @@ def fetch_naver_news_raw(query: str, display: int = 100) -> List[Dict[str, Any]]
     params = {
         "query": query,
         "display": display,
+        "start": start,
         "sort": "date",
     }
     
     try:
-        resp = httpx.get(NAVER_NEWS_URL, params=params, headers=headers, timeout=10.0)
+        resp = client_for_url(NAVER_NEWS_URL).get(NAVER_NEWS_URL, params=params, headers=headers, timeout=10.0)
         resp.raise_for_status()
         return resp.json().get("items", [])
     except Exception as e:
@@ -96,324 +96,102 @@ def fetch_naver_news_raw(query: str, display: int = 100) -> List[Dict[str, Any]]
         return []
 
 
+def _print_pipeline_report(stats) -> None:
+    print(f"\n⏱️ 단계별 처리:")
+    for line in stats.report():
+        print(line)
+
+
 def collect_by_press(db: Session) -> List[NewsDaily]:
     """언론사별 수집 (20개 × 100개 = 2,000개)"""
-    
-    from backend.app.utils.dedup import remove_duplicate_news
-    
-    today = datetime.now(KST_TZ).date()
+
+    from backend.app.collectors.news_pipeline import query_source, run_pipeline
+    from backend.app.collectors.news_query_planner import plan_press_queries, record_query_yields
+
     now_kst = datetime.now(KST_TZ)
     min_dt = now_kst - timedelta(hours=24)  # 24시간 이내만 허용 (구형 뉴스 필터)
-    created = []
-    stats = {
-        "missing_fields": 0,
-        "bad_pubdate": 0,
-        "old_pubdate": 0,
-        "no_topic_key": 0,
-        "press_filtered": 0,
-        "duplicate_url": 0,
-        "saved": 0,
-    }
-    temp_news_list = []  # 중복 제거 전 임시 리스트
-    
+
     print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print(f"📰 언론사별 뉴스 수집 시작")
     print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    
-    total_fetched = 0
-    total_saved = 0
-    
-    for press in PRESS_LIST:
-        print(f"\n🔍 [{press}] 수집 중...")
-        
-        items = fetch_naver_news_raw(query=press, display=100)
-        total_fetched += len(items)
-        
-        if not items:
-            print(f"  ⚠️ 결과 없음")
-            continue
-        
-        saved_count = 0
-        
-        for item in items:
-            try:
-                # 1. 필수 필드 검증
-                raw_title = item.get("title")
-                url = item.get("originallink") or item.get("link")
-                pub_raw = item.get("pubDate")
-                
-                if not raw_title or not url:
-                    continue
-
-                # 1.5. 발행일 파싱 및 신선도 필터
-                pub_dt = None
-                try:
-                    if pub_raw:
-                        pub_dt = parsedate_to_datetime(pub_raw)
-                        if pub_dt.tzinfo:
-                            pub_dt = pub_dt.astimezone(KST_TZ)
-                        else:
-                            pub_dt = pub_dt.replace(tzinfo=KST_TZ)
-                except Exception:
-                    pub_dt = None
-
-                # pubDate가 없으면 버리고, 48시간 이전 뉴스는 스킵
-                if not pub_dt or pub_dt < min_dt:
-                    continue
-
-                pub_dt_naive = pub_dt.replace(tzinfo=None)
-                item_date = pub_dt.date()
-                
-                # 2. 제목 정제
-                title = raw_title.replace("<b>", "").replace("</b>", "")
-                topic_key = build_topic_key(title)
-                
-                if not topic_key:
-                    continue
-                
-                # 3. 중복 체크 (동일 일자 기준)
-                existing = db.query(NewsDaily)\
-                    .filter(
-                        NewsDaily.date == item_date,
-                        NewsDaily.topic_key == topic_key
-                    )\
-                    .first()
-                
-                if existing:
-                    continue
-                
-                # 4. 언론사 확인
-                source_press = extract_press_from_url(url)
-                if not source_press or source_press not in PRESS_BREAKING_CONFIG:
-                    continue
-                
-                # 5. 카테고리 자동 분류
-                category = classify_category(title)
-                
-                # 6. 속보 태그 확인
-                is_breaking = check_breaking_tag(title)
-                
-                # 7. 저장
-                news = NewsDaily(
-                    date=item_date,
-                    category=category,
-                    title=title,
-                    url=url[:200] if url else "",
-                    source=source_press,
-                    topic_key=topic_key,
-                    is_breaking=is_breaking,
-                    is_top=False,
-                    hot_score=0,
-                    keywords=None,
-                    sentiment=None,
-                    published_at=pub_dt_naive,
-                )
-                
-                temp_news_list.append(news)
-                saved_count += 1
-                
-            except Exception as e:
-                print(f"  ⚠️ 처리 오류: {e}")
-                continue
-        
-        print(f"  ✅ 저장: {saved_count}개")
-        total_saved += saved_count
-    
-    # 중복 제거
-    print(f"\n🔄 중복 제거 중...")
-    print(f"\n🔄 중복 제거 중...")
-    print(f"  - 수집: {len(temp_news_list)}개")
-    unique_news_list = remove_duplicate_news(temp_news_list)
-    print(f"  - 중복 제거 후: {len(unique_news_list)}개")
-    
-    # DB 저장
-    for news in unique_news_list:
-        # DB에 이미 있는지 체크
-        existing = db.query(NewsDaily).filter(
-            NewsDaily.date == news.date,
-            NewsDaily.topic_key == news.topic_key
-        ).first()
-        
-        if not existing:
-            db.add(news)
-            created.append(news)
-    
-    # Commit
-    try:
-        db.commit()
-        for n in created:
-            db.refresh(n)
-    except IntegrityError as e:
-        db.rollback()
-        print(f"  ❌ DB 오류: {e}")
-        created = []
-    
+
+    plan = plan_press_queries(db, PRESS_LIST, default_display=100)
+    print(f"🧭 쿼리 계획: {plan.summary()}")
+
+    def announce(press: str, count: int) -> None:
+        print(f"\n🔍 [{press}] 수집 중... {count}개" if count else f"\n🔍 [{press}] ⚠️ 결과 없음")
+
+    source = query_source(
+        plan.queries, lambda press: fetch_naver_news_raw(query=press, display=plan.display[press]), announce
+    )
+    created, stats = run_pipeline(
+        db, "press", source,
+        min_dt=min_dt,
+        topic_key_of=build_topic_key,
+        breaking_of=check_breaking_tag,
+    )
+    _print_pipeline_report(stats)
+    if not stats.write_failed:
+        record_query_yields(db, plan, stats.by_query)
+
     print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print(f"📊 수집 완료:")
-    print(f"  - API 요청: {len(PRESS_LIST)}회")
-    print(f"  - 받은 뉴스: {total_fetched}개")
-    print(f"  - 저장된 뉴스: {total_saved}개")
+    print(f"  - API 요청: {len(plan.queries)}회")
+    print(f"  - 받은 뉴스: {stats.stage('source').passed}개")
+    print(f"  - 중복 제거 후: {stats.stage('similar').passed}개")
+    print(f"  - 저장된 뉴스: {len(created)}개")
     print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
-    
+
     return created
 
 
 def collect_by_category_keywords(db: Session) -> List[NewsDaily]:
     """카테고리별 키워드 검색으로 뉴스 수집 (경제/문화 보장)"""
 
-    from backend.app.utils.dedup import remove_duplicate_news
+    from backend.app.collectors.news_pipeline import query_source, run_pipeline
+    from backend.app.collectors.news_query_planner import plan_keyword_queries, record_query_yields
 
-    today = datetime.now(KST_TZ).date()
     now_kst = datetime.now(KST_TZ)
     min_dt = now_kst - timedelta(hours=24)
-    created = []
-    temp_news_list = []
 
     print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print(f"🎯 카테고리별 뉴스 수집 시작")
     print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
-    total_fetched = 0
-
-    for category, keywords in CATEGORY_SEARCH_KEYWORDS.items():
-        # 빈 카테고리는 스킵 (society는 기본 분류로 충분)
-        if not keywords:
-            continue
-
-        print(f"\n📂 [{category.upper()}] 카테고리 수집 중...")
-
-        # 각 키워드로 검색 (키워드당 30개씩)
-        for keyword in keywords:
-            items = fetch_naver_news_raw(query=keyword, display=30)
-            total_fetched += len(items)
-
-            if not items:
-                continue
-
-            for item in items:
-                try:
-                    raw_title = item.get("title")
-                    url = item.get("originallink") or item.get("link")
-                    pub_raw = item.get("pubDate")
-
-                    if not raw_title or not url:
-                        continue
-
-                    # 발행일 파싱
-                    pub_dt = None
-                    try:
-                        if pub_raw:
-                            pub_dt = parsedate_to_datetime(pub_raw)
-                            if pub_dt.tzinfo:
-                                pub_dt = pub_dt.astimezone(KST_TZ)
-                            else:
-                                pub_dt = pub_dt.replace(tzinfo=KST_TZ)
-                    except Exception:
-                        pub_dt = None
-
-                    if not pub_dt or pub_dt < min_dt:
-                        continue
-
-                    pub_dt_naive = pub_dt.replace(tzinfo=None)
-                    item_date = pub_dt.date()
-
-                    # 제목 정제
-                    title = raw_title.replace("<b>", "").replace("</b>", "")
-                    topic_key = build_topic_key(title)
-
-                    if not topic_key:
-                        continue
-
-                    # 중복 체크
-                    existing = db.query(NewsDaily)\
-                        .filter(
-                            NewsDaily.date == item_date,
-                            NewsDaily.topic_key == topic_key
-                        )\
-                        .first()
-
-                    if existing:
-                        continue
-
-                    # 언론사 확인
-                    source_press = extract_press_from_url(url)
-                    if not source_press or source_press not in PRESS_BREAKING_CONFIG:
-                        continue
-
-                    # 카테고리 자동 분류 (재확인)
-                    detected_category = classify_category(title)
-
-                    # 속보 태그 확인
-                    is_breaking = check_breaking_tag(title)
-
-                    # 저장
-                    news = NewsDaily(
-                        date=item_date,
-                        category=detected_category,  # 자동 분류된 카테고리 사용
-                        title=title,
-                        url=url[:200] if url else "",
-                        source=source_press,
-                        topic_key=topic_key,
-                        is_breaking=is_breaking,
-                        is_top=False,
-                        hot_score=0,
-                        keywords=None,
-                        sentiment=None,
-                        published_at=pub_dt_naive,
-                    )
-
-                    temp_news_list.append(news)
-
-                except Exception as e:
-                    continue
-
-        print(f"  ✅ {category}: {len([n for n in temp_news_list if n.category == category])}개")
-
-    # 중복 제거
-    print(f"\n🔄 중복 제거 중...")
-    print(f"  - 수집: {len(temp_news_list)}개")
-    unique_news_list = remove_duplicate_news(temp_news_list)
-    print(f"  - 중복 제거 후: {len(unique_news_list)}개")
-
-    # DB 저장 (개별 커밋, 카테고리 업데이트 지원)
-    updated_count = 0
-    for news in unique_news_list:
-        try:
-            # 기존 뉴스 확인
-            existing = db.query(NewsDaily).filter(
-                NewsDaily.date == news.date,
-                NewsDaily.topic_key == news.topic_key
-            ).first()
-
-            if existing:
-                # 이미 존재하면 카테고리가 society이고 새 분류가 더 구체적이면 업데이트
-                if existing.category == "society" and news.category != "society":
-                    existing.category = news.category
-                    db.commit()
-                    updated_count += 1
-            else:
-                # 새 뉴스면 추가
-                db.add(news)
-                db.commit()
-                db.refresh(news)
-                created.append(news)
-        except IntegrityError:
-            # 중복이면 롤백하고 다음으로
-            db.rollback()
-            continue
-        except Exception as e:
-            # 다른 에러도 롤백하고 다음으로
-            db.rollback()
-            print(f"  ⚠️ 저장 실패: {news.title[:30]}... - {e}")
-            continue
-
-    if updated_count > 0:
-        print(f"  🔄 카테고리 업데이트: {updated_count}개")
+    # 빈 카테고리는 스킵 (society는 기본 분류로 충분), 키워드당 기본 30개씩
+    # 카테고리별 목표를 채울 만큼만, 수확량 높은 키워드부터 호출
+    plan = plan_keyword_queries(db, CATEGORY_SEARCH_KEYWORDS, default_display=30)
+    print(f"🧭 쿼리 계획: {plan.summary()}")
+    announced = set()
+
+    def announce(keyword: str, count: int) -> None:
+        category = plan.category[keyword]
+        if category not in announced:
+            announced.add(category)
+            print(f"\n📂 [{category.upper()}] 카테고리 수집 중...")
+
+    source = query_source(
+        plan.queries, lambda keyword: fetch_naver_news_raw(query=keyword, display=plan.display[keyword]), announce
+    )
+    # 이미 있는 주제는 카테고리가 society이고 새 분류가 더 구체적이면 업데이트
+    created, stats = run_pipeline(
+        db, "category", source,
+        min_dt=min_dt,
+        topic_key_of=build_topic_key,
+        breaking_of=check_breaking_tag,
+        update_society=True,
+    )
+    _print_pipeline_report(stats)
+    if not stats.write_failed:
+        record_query_yields(db, plan, stats.by_query)
+
+    if stats.updated > 0:
+        print(f"  🔄 카테고리 업데이트: {stats.updated}개")
 
     print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print(f"📊 카테고리별 수집 완료:")
-    print(f"  - API 요청: {len(CATEGORY_SEARCH_KEYWORDS) * sum(len(k) for k in CATEGORY_SEARCH_KEYWORDS.values())}회")
-    print(f"  - 받은 뉴스: {total_fetched}개")
+    print(f"  - API 요청: {len(plan.queries)}회 (건너뜀 {len(plan.skipped)}회)")
+    print(f"  - 받은 뉴스: {stats.stage('source').passed}개")
     print(f"  - 저장된 뉴스: {len(created)}개")
 
     # 카테고리별 통계
@@ -466,162 +244,132 @@ def filter_repeated_person_names(news_list):
 
 
 def collect_breaking_news(db: Session) -> List[NewsDaily]:
-    """속보 라인 수집 (100개) + 중복 제거"""
+    """
+    속보 라인 증분 수집 + 중복 제거
+
+    지난 수집 이후(pubDate 워터마크) 새로 올라온 기사만 start= 페이지를 넘기며 읽고,
+    저장이 끝나면 워터마크를 앞으로 옮긴다.
+    """
     
-    from backend.app.utils.dedup import remove_duplicate_news
+    from backend.app.collectors.news_pipeline import items_source, run_pipeline
     
-    today = datetime.now(KST_TZ).date()
     now_kst = datetime.now(KST_TZ)
     min_dt = now_kst - timedelta(hours=24)
-    created = []
-    stats = {
-        "missing_fields": 0,
-        "bad_pubdate": 0,
-        "old_pubdate": 0,
-        "no_topic_key": 0,
-        "press_filtered": 0,
-        "duplicate_url": 0,
-        "saved": 0,
-    }
     
     print(f"\n⚡ 속보 라인 수집 중...")
     
-    items = fetch_naver_news_raw(query="속보", display=100)
+    # 워터마크 파일이 없으면 DB의 마지막 속보 시각부터
+    last_published = (
+        db.query(func.max(NewsDaily.published_at))
+        .filter(NewsDaily.is_breaking.is_(True), NewsDaily.published_at >= min_dt.replace(tzinfo=None))
+        .scalar()
+    )
+    fetched = fetch_incremental(
+        BREAKING_QUERY,
+        lambda start: fetch_naver_news_raw(query=BREAKING_QUERY, display=PAGE_SIZE, start=start),
+        floor=min_dt,
+        seed=last_published.replace(tzinfo=KST_TZ) if last_published else None,
+    )
+    items = fetched.items
+    print(
+        f"  📥 새 항목 {len(items)}개 (페이지 {fetched.pages}회"
+        f"{', 워터마크 도달' if fetched.reached_watermark else ''})"
+    )
     
     if not items:
-        print(f"  ⚠️ 결과 없음")
+        fetched.commit()
+        print(f"  ⚠️ 새 속보 없음")
         return []
     
-    # 1단계: 모든 속보를 NewsDaily 객체로 변환 (저장 전)
-    temp_news_list = []
-    
-    for item in items:
-        try:
-            raw_title = item.get("title")
-            url = item.get("originallink") or item.get("link")
-            pub_raw = item.get("pubDate")
-            
-            if not raw_title or not url:
-                stats["missing_fields"] += 1
-                continue
-
-            pub_dt = None
-            try:
-                if pub_raw:
-                    pub_dt = parsedate_to_datetime(pub_raw)
-                    if pub_dt.tzinfo:
-                        pub_dt = pub_dt.astimezone(KST_TZ)
-                    else:
-                        pub_dt = pub_dt.replace(tzinfo=KST_TZ)
-            except Exception:
-                pub_dt = None
-
-            if not pub_dt:
-                stats["bad_pubdate"] += 1
-                continue
-
-            if pub_dt < min_dt:
-                stats["old_pubdate"] += 1
-                continue
-
-            pub_dt_naive = pub_dt.replace(tzinfo=None)
-            item_date = pub_dt.date()
-            
-            title = raw_title.replace("<b>", "").replace("</b>", "")
-            topic_key = build_topic_key(title)
-            
-            if not topic_key:
-                stats["no_topic_key"] += 1
-                continue
-            
-            # 언론사 확인
-            source_press = extract_press_from_url(url)
-            if not source_press or source_press not in PRESS_BREAKING_CONFIG:
-                stats["press_filtered"] += 1
-                continue
-            
-            # 카테고리 분류
-            category = classify_category(title)
-            
-            # NewsDaily 객체 생성 (아직 DB에 저장 안 함)
-            news = NewsDaily(
-                date=item_date,
-                category=category,
-                title=title,
-                url=url[:200] if url else "",
-                source=source_press,
-                topic_key=topic_key,
-                is_breaking=True,
-                is_top=False,
-                hot_score=0,
-                keywords=None,
-                sentiment=None,
-                published_at=pub_dt_naive,
-                created_at=pub_dt_naive,
-            )
-            
-            temp_news_list.append(news)
-            
-        except Exception as e:
-            continue
-    
-    # 2단계: 유사도 기반 중복 제거
-    if temp_news_list:
-        print(f"  📋 수집: {len(temp_news_list)}개")
-        unique_news_list = remove_duplicate_news(temp_news_list)
-        print(f"  ✨ 중복 제거 후: {len(unique_news_list)}개")
-        unique_news_list = filter_repeated_person_names(unique_news_list)
-        print(f"  🎯 인물 필터 후: {len(unique_news_list)}개")
-    else:
-        unique_news_list = []
-    
-    # 3단계: DB에 저장 (topic_key 중복 체크)
-    saved_count = 0
-    
-    for news in unique_news_list:
-        try:
-            # DB에 이미 있는지 확인
-            existing = (
-                db.query(NewsDaily)
-                .filter(
-                    NewsDaily.date == news.date,
-                    NewsDaily.url == news.url,
-                )
-                .first()
-            )
-            
-            if existing:
-                stats["duplicate_url"] += 1
-                continue
-            
-            db.add(news)
-            created.append(news)
-            saved_count += 1
-            stats["saved"] += 1
-            
-        except Exception as e:
-            continue
-    
-    try:
-        db.commit()
-        for n in created:
-            db.refresh(n)
-    except IntegrityError:
-        db.rollback()
-        created = []
-    
-    print(f"  ✅ 속보 저장: {saved_count}개")
+    # 파싱 → 필터 → 분류 → 중복 제거(유사도 + 인물 필터) → (date, url) 기준 저장
+    created, stats = run_pipeline(
+        db, "breaking", items_source(BREAKING_QUERY, items),
+        min_dt=min_dt,
+        topic_key_of=build_topic_key,
+        breaking_of=check_breaking_tag,
+        force_breaking=True,
+        skip_existing_topics=False,
+        post_filters=(filter_repeated_person_names,),
+        conflict="url",
+    )
+    if not stats.write_failed:
+        # 저장이 rollback되면 워터마크를 그대로 둬서 다음 실행이 같은 구간을 다시 읽음
+        fetched.commit()
+
+    dropped = stats.dropped()
+    print(f"  📋 수집: {stats.stage('enrich').passed}개")
+    print(f"  ✨ 중복 제거 후: {stats.stage('similar').passed}개")
+    print(f"  ✅ 속보 저장: {len(created)}개")
     print(
-        f"  📌 스킵 사유: missing={stats['missing_fields']} "
-        f"bad_pub={stats['bad_pubdate']} old_pub={stats['old_pubdate']} "
-        f"no_topic={stats['no_topic_key']} press={stats['press_filtered']} "
-        f"dup_url={stats['duplicate_url']}"
+        f"  📌 스킵 사유: missing={dropped['missing_fields']} "
+        f"bad_pub={dropped['bad_pubdate']} old_pub={dropped['old_pubdate']} "
+        f"no_topic={dropped['no_topic_key']} press={dropped['press_filtered']} "
+        f"dup_url={dropped['duplicate_url']}"
     )
+    _print_pipeline_report(stats)
     print("")
     
     return created
 
 
+MAJOR_PRESS = ["연합뉴스", "YTN", "KBS", "SBS", "매일경제", "한국경제"]
+
+
+def score_news(news, duplicate_count: int, press_count: int, now: datetime) -> int:
+    """
+    핫 점수 (NewsDaily / NewsCandidate 공통)
+
+    Args:
+        duplicate_count: 오늘 같은 topic_key 기사 수
+        press_count: 오늘 같은 topic_key를 보도한 언론사 수
+    """
+    score = 0
+
+    # 1. 중복 주제 개수 (최대 100점)
+    score += duplicate_count * 10
+
+    # 2. 보도 언론사 개수 (최대 50점)
+    score += press_count * 5
+
+    # 3. 속보 태그 (30점)
+    if news.is_breaking:
+        score += 30
+
+    # 4. 최신도 (최대 10점)
+    # created_at이 타임존 정보가 없으면 KST로 간주 (저장 전 후보는 발행 시각 기준)
+    created_at = news.created_at or news.published_at
+    if created_at is not None:
+        created_at = created_at if created_at.tzinfo else created_at.replace(tzinfo=KST_TZ)
+        hours_old = (now - created_at).total_seconds() / 3600
+        if hours_old < 1:
+            score += 10
+        elif hours_old < 3:
+            score += 5
+        elif hours_old < 6:
+            score += 2
+
+    # 5. 주요 언론사 보너스 (5점)
+    if any(press in (news.source or "") for press in MAJOR_PRESS):
+        score += 5
+
+    return score
+
+
+def topic_counts(db: Session, day: date) -> Dict[str, tuple]:
+    """day의 topic_key별 (기사 수, 언론사 수) - 한 번의 GROUP BY"""
+    rows = (
+        db.query(
+            NewsDaily.topic_key,
+            func.count(NewsDaily.id),
+            func.count(func.distinct(NewsDaily.source)),
+        )
+        .filter(NewsDaily.date == day, NewsDaily.topic_key.isnot(None))
+        .group_by(NewsDaily.topic_key)
+        .all()
+    )
+    return {topic_key: (count, presses) for topic_key, count, presses in rows}
+
+
 def calculate_hot_score(news_id: int, db: Session) -> int:
     """핫 점수 계산"""
 
@@ -629,65 +377,42 @@ def calculate_hot_score(news_id: int, db: Session) -> int:
     if not news:
         return 0
 
-    score = 0
     # KST 기준 날짜/시간 (타임존 안전)
     today = datetime.now(KST_TZ).date()
     now = datetime.now(KST_TZ)
-    
-    # 1. 중복 주제 개수 (최대 100점)
+
     duplicate_count = db.query(NewsDaily)\
         .filter(
             NewsDaily.topic_key == news.topic_key,
             NewsDaily.date == today
         )\
         .count()
-    score += duplicate_count * 10
-    
-    # 2. 보도 언론사 개수 (최대 50점)
     press_count = db.query(func.count(func.distinct(NewsDaily.source)))\
         .filter(
             NewsDaily.topic_key == news.topic_key,
             NewsDaily.date == today
         )\
         .scalar()
-    score += press_count * 5
-    
-    # 3. 속보 태그 (30점)
-    if news.is_breaking:
-        score += 30
-    
-    # 4. 최신도 (최대 10점)
-    # created_at이 타임존 정보가 없으면 KST로 간주
-    created_at = news.created_at if news.created_at.tzinfo else news.created_at.replace(tzinfo=KST_TZ)
-    hours_old = (now - created_at).total_seconds() / 3600
-    if hours_old < 1:
-        score += 10
-    elif hours_old < 3:
-        score += 5
-    elif hours_old < 6:
-        score += 2
-    
-    # 5. 주요 언론사 보너스 (5점)
-    major_press = ["연합뉴스", "YTN", "KBS", "SBS", "매일경제", "한국경제"]
-    if any(press in news.source for press in major_press):
-        score += 5
-    
-    return score
+
+    return score_news(news, duplicate_count, press_count, now)
 
 
 def update_hot_scores(db: Session):
-    """모든 오늘 뉴스의 핫 점수 업데이트"""
+    """모든 오늘 뉴스의 핫 점수 업데이트 (topic_key별 집계는 한 번만 조회)"""
     
     print(f"\n🔥 핫 점수 계산 중...")
 
     # KST 기준 오늘 날짜 (타임존 안전)
     today = datetime.now(KST_TZ).date()
+    now = datetime.now(KST_TZ)
+    counts = topic_counts(db, today)
     news_list = db.query(NewsDaily)\
         .filter(NewsDaily.date == today)\
         .all()
     
     for news in news_list:
-        news.hot_score = calculate_hot_score(news.id, db)
+        duplicate_count, press_count = counts.get(news.topic_key, (0, 0))
+        news.hot_score = score_news(news, duplicate_count, press_count, now)
     
     db.commit()
     
@@ -698,6 +423,7 @@ def select_top_news(db: Session, category: str, limit: int = 10) -> List[NewsDai
     """카테고리별 TOP 선정"""
 
     from backend.app.utils.dedup import remove_duplicate_news
+    from backend.app.utils.story_index import mark_ranked, one_per_story, ranked_recently
 
     # KST 기준 오늘 날짜 (타임존 안전)
     today = datetime.now(KST_TZ).date()
@@ -715,11 +441,14 @@ def select_top_news(db: Session, category: str, limit: int = 10) -> List[NewsDai
         .limit(candidate_limit)\
         .all()
 
+    # 최근 며칠 안에 이미 TOP에 든 스토리는 빼고, 스토리당 1건만
+    candidates, _ = one_per_story(db, candidates, seen=ranked_recently(today, STORY_REPEAT_DAYS))
     top_news = remove_duplicate_news(candidates)[:limit]
     
     # is_top 플래그 업데이트
     for news in top_news:
         news.is_top = True
+    mark_ranked(db, top_news, today)
     
     db.commit()
     
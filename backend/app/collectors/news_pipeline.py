@@ -0,0 +1,456 @@
+"""뉴스 수집 파이프라인 (제너레이터 단계 연결)
+
+source → parse → filter → enrich → dedup → writer
+
+- 각 단계는 이전 단계의 이터레이터를 받아 항목을 하나씩 넘기는 제너레이터
+  (API 응답 한 페이지 이상을 리스트로 쌓지 않는다)
+- 유사도 중복 제거만 전체 후보를 봐야 해서 모으는데, 그 앞에서 URL/topic_key/DB 확인으로
+  걸러진 생존 후보만 담는다
+- 단계별 통과/제외 사유/소요 시간을 PipelineStats에 집계
+- 항목은 writer가 NewsDaily 행으로 바꾸기 전까지 __slots__ 레코드(NewsCandidate)로 다닌다
+
+언론사별 / 카테고리 키워드 / 속보 수집은 source와 옵션만 다르고 같은 단계를 쓴다.
+"""
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.app.collectors.news_watermark import item_url, parse_pub_date
+from backend.app.db.models import NewsDaily
+from backend.app.utils.category_keywords import classify_category
+from backend.app.utils.filters import PRESS_BREAKING_CONFIG, extract_press_from_url
+
+WRITE_BATCH_SIZE = 100   # writer가 한 번에 조회/저장하는 행 수
+EXISTS_CHUNK_SIZE = 200  # dedup 단계 DB 존재 확인 묶음 크기
+URL_MAX_LENGTH = 200
+
+# (source 라벨, API 원본 item)
+RawItem = Tuple[str, Dict]
+
+
+class NewsCandidate:
+    """저장 전 뉴스 후보 (ORM 객체 대신 쓰는 가벼운 레코드)"""
+
+    __slots__ = (
+        "query", "title", "url", "source", "category", "topic_key",
+        "is_breaking", "published_at", "created_at", "hot_score", "date",
+    )
+
+    def __init__(self, query: str, title: str, url: str, published_at: datetime):
+        self.query = query
+        self.title = title
+        self.url = url
+        self.published_at = published_at  # KST aware
+        self.date = published_at.date()
+        self.source = None
+        self.category = None
+        self.topic_key = None
+        self.is_breaking = False
+        self.created_at = None
+        self.hot_score = 0
+
+    def to_row(self) -> NewsDaily:
+        published = self.published_at.replace(tzinfo=None)
+        row = NewsDaily(
+            date=self.date,
+            category=self.category,
+            title=self.title,
+            url=self.url,
+            source=self.source,
+            topic_key=self.topic_key,
+            is_breaking=self.is_breaking,
+            is_top=False,
+            hot_score=self.hot_score,
+            keywords=None,
+            sentiment=None,
+            published_at=published,
+        )
+        if self.created_at is not None:
+            # None을 넣으면 컬럼 기본값(utcnow) 대신 NULL이 저장되므로 있을 때만 지정
+            row.created_at = self.created_at.replace(tzinfo=None)
+        return row
+
+
+class StageStats:
+    __slots__ = ("name", "passed", "dropped", "seconds")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.passed = 0
+        self.dropped: Counter = Counter()
+        self.seconds = 0.0  # 이 단계까지의 누적 시간 (앞 단계 포함)
+
+    def drop(self, reason: str) -> None:
+        self.dropped[reason] += 1
+
+
+class PipelineStats:
+    """단계별 통과 수 / 제외 사유 / 소요 시간"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: Dict[str, StageStats] = {}
+        self.updated = 0  # writer가 갱신한 기존 행 수
+        self.write_failed = False
+        # 쿼리별 단계 통과 수 {query: Counter({"source": n, "filter": n, ..., "write:economy": n})}
+        self.by_query: Dict[str, Counter] = defaultdict(Counter)
+
+    def stage(self, name: str) -> StageStats:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        return stats
+
+    def meter(self, name: str, items: Iterable, query_of: Optional[Callable] = None) -> Iterator:
+        """
+        단계 출력을 세고 next()에 걸린 시간을 누적 (단계는 연결 순서대로 등록)
+
+        query_of: 항목 → 쿼리 (주면 쿼리별 통과 수도 집계)
+        """
+        return self._metered(self.stage(name), iter(items), name, query_of)
+
+    def _metered(self, stats: StageStats, iterator: Iterator, name: str, query_of: Optional[Callable]) -> Iterator:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stats.seconds += time.perf_counter() - started
+                return
+            stats.seconds += time.perf_counter() - started
+            stats.passed += 1
+            if query_of is not None:
+                self.by_query[query_of(item)][name] += 1
+            yield item
+
+    def dropped(self) -> Counter:
+        total: Counter = Counter()
+        for stats in self.stages.values():
+            total.update(stats.dropped)
+        return total
+
+    def report(self) -> List[str]:
+        """단계별 한 줄 요약 (시간은 앞 단계를 뺀 자기 몫)"""
+        lines = []
+        upstream = 0.0
+        for stats in self.stages.values():
+            own = max(stats.seconds - upstream, 0.0)
+            upstream = max(stats.seconds, upstream)
+            reasons = " ".join(f"{k}={v}" for k, v in stats.dropped.items() if v)
+            lines.append(
+                f"  · {stats.name:<7} {stats.passed:>5}개 {own * 1000:>8.1f}ms"
+                + (f"  (제외 {reasons})" if reasons else "")
+            )
+        return lines
+
+
+# ---------------------------------------------------------------------------
+# source
+# ---------------------------------------------------------------------------
+
+def query_source(
+    queries: Sequence[str],
+    fetch: Callable[[str], List[Dict]],
+    announce: Optional[Callable[[str, int], None]] = None,
+) -> Iterator[RawItem]:
+    """쿼리별 API 응답을 차례로 흘려보냄 (한 번에 한 응답만 메모리에)"""
+    for query in queries:
+        items = fetch(query)
+        if announce:
+            announce(query, len(items))
+        for item in items:
+            yield query, item
+
+
+def items_source(query: str, items: Iterable[Dict]) -> Iterator[RawItem]:
+    """이미 받아 둔 항목 (증분 수집 결과 등)"""
+    for item in items:
+        yield query, item
+
+
+# ---------------------------------------------------------------------------
+# parse / filter / enrich
+# ---------------------------------------------------------------------------
+
+def parse_stage(raw: Iterable[RawItem], stats: StageStats) -> Iterator[NewsCandidate]:
+    """필수 필드 + pubDate 파싱 + 제목 정제"""
+    for query, item in raw:
+        raw_title = item.get("title")
+        url = item_url(item)
+        if not raw_title or not url:
+            stats.drop("missing_fields")
+            continue
+
+        pub_dt = parse_pub_date(item.get("pubDate"))
+        if not pub_dt:
+            stats.drop("bad_pubdate")
+            continue
+
+        title = raw_title.replace("<b>", "").replace("</b>", "")
+        yield NewsCandidate(query, title, url, pub_dt)
+
+
+def filter_stage(
+    candidates: Iterable[NewsCandidate],
+    stats: StageStats,
+    min_dt: datetime,
+    topic_key_of: Callable[[str], str],
+) -> Iterator[NewsCandidate]:
+    """신선도 / topic_key / 허용 언론사"""
+    for news in candidates:
+        if news.published_at < min_dt:
+            stats.drop("old_pubdate")
+            continue
+
+        news.topic_key = topic_key_of(news.title)
+        if not news.topic_key:
+            stats.drop("no_topic_key")
+            continue
+
+        news.source = extract_press_from_url(news.url)
+        if not news.source or news.source not in PRESS_BREAKING_CONFIG:
+            stats.drop("press_filtered")
+            continue
+
+        yield news
+
+
+def enrich_stage(
+    candidates: Iterable[NewsCandidate],
+    breaking_of: Callable[[str], bool],
+    force_breaking: bool = False,
+) -> Iterator[NewsCandidate]:
+    """카테고리 분류 + 속보 여부 (속보 라인은 항상 속보, created_at = 발행 시각)"""
+    for news in candidates:
+        news.category = classify_category(news.title)
+        news.url = news.url[:URL_MAX_LENGTH]
+        if force_breaking:
+            news.is_breaking = True
+            news.created_at = news.published_at
+        else:
+            news.is_breaking = breaking_of(news.title)
+        yield news
+
+
+# ---------------------------------------------------------------------------
+# dedup
+# ---------------------------------------------------------------------------
+
+def _existing_topic_pairs(db: Session, chunk: Sequence[NewsCandidate]) -> set:
+    dates = {news.date for news in chunk}
+    keys = {news.topic_key for news in chunk}
+    rows = (
+        db.query(NewsDaily.date, NewsDaily.topic_key)
+        .filter(NewsDaily.date.in_(dates), NewsDaily.topic_key.in_(keys))
+        .all()
+    )
+    return {(row.date, row.topic_key) for row in rows}
+
+
+def unique_stage(
+    candidates: Iterable[NewsCandidate],
+    stats: StageStats,
+    db: Session,
+    skip_existing_topics: bool,
+) -> Iterator[NewsCandidate]:
+    """
+    실행 안 URL/topic_key 중복 + (옵션) DB에 이미 있는 (date, topic_key) 제외
+
+    DB 확인은 EXISTS_CHUNK_SIZE개씩 묶어 한 번에 조회한다.
+    """
+    seen_urls = set()
+    seen_topics = set()
+    chunk: List[NewsCandidate] = []
+
+    def flush() -> Iterator[NewsCandidate]:
+        existing = _existing_topic_pairs(db, chunk) if skip_existing_topics else set()
+        for news in chunk:
+            if (news.date, news.topic_key) in existing:
+                stats.drop("existing_topic")
+                continue
+            yield news
+        chunk.clear()
+
+    for news in candidates:
+        topic = (news.date, news.topic_key)
+        if news.url in seen_urls or topic in seen_topics:
+            stats.drop("same_run")
+            continue
+        seen_urls.add(news.url)
+        seen_topics.add(topic)
+        chunk.append(news)
+        if len(chunk) >= EXISTS_CHUNK_SIZE:
+            yield from flush()
+    if chunk:
+        yield from flush()
+
+
+def similarity_stage(
+    candidates: Iterable[NewsCandidate],
+    stats: StageStats,
+    post_filters: Sequence[Callable[[List], List]] = (),
+) -> Iterator[NewsCandidate]:
+    """제목 유사도 중복 제거 (remove_duplicate_news) - 생존 후보만 모아서 한 번"""
+    from backend.app.utils.dedup import remove_duplicate_news
+
+    pending = list(candidates)
+    unique = remove_duplicate_news(pending)
+    stats.dropped["similar_title"] += len(pending) - len(unique)
+    for post_filter in post_filters:
+        before = len(unique)
+        unique = post_filter(unique)
+        stats.dropped[getattr(post_filter, "__name__", "post_filter")] += before - len(unique)
+    del pending
+    yield from unique
+
+
+# ---------------------------------------------------------------------------
+# writer
+# ---------------------------------------------------------------------------
+
+class BatchWriter:
+    """
+    생존 후보를 WRITE_BATCH_SIZE개씩 NewsDaily로 저장
+
+    conflict:
+        "topic": 같은 (date, topic_key)가 있으면 건너뜀
+        "url":   같은 (date, url)이 있으면 건너뜀 (속보 라인)
+    update_society: topic 충돌 시 기존 society 분류를 새 분류로 갱신
+
+    배치마다 savepoint 안에서 flush하고, 유니크 제약 충돌이 나면 그 배치만 한 행씩 다시 넣는다.
+    """
+
+    def __init__(self, db: Session, stats: StageStats, conflict: str = "topic", update_society: bool = False,
+                 by_query: Optional[Dict[str, Counter]] = None, assign_stories: bool = True):
+        self.db = db
+        self.assign_stories = assign_stories
+        self.stats = stats
+        self.by_query = by_query
+        self.conflict = conflict
+        self.update_society = update_society
+        self.created: List[NewsDaily] = []
+        self.updated = 0
+        self.failed = False
+
+    def _existing(self, batch: Sequence[NewsCandidate]) -> Dict[tuple, NewsDaily]:
+        dates = {news.date for news in batch}
+        if self.conflict == "url":
+            rows = self.db.query(NewsDaily).filter(
+                NewsDaily.date.in_(dates), NewsDaily.url.in_({news.url for news in batch})
+            )
+            return {(row.date, row.url): row for row in rows}
+        rows = self.db.query(NewsDaily).filter(
+            NewsDaily.date.in_(dates), NewsDaily.topic_key.in_({news.topic_key for news in batch})
+        )
+        return {(row.date, row.topic_key): row for row in rows}
+
+    def _key(self, news: NewsCandidate) -> tuple:
+        return (news.date, news.url) if self.conflict == "url" else (news.date, news.topic_key)
+
+    def _write_batch(self, batch: Sequence[NewsCandidate]) -> None:
+        existing = self._existing(batch)
+        rows = []
+        queries = []
+        for news in batch:
+            found = existing.get(self._key(news))
+            if found is None:
+                rows.append(news.to_row())
+                queries.append(news.query)
+                continue
+            if self.update_society and found.category == "society" and news.category != "society":
+                found.category = news.category
+                self.updated += 1
+            self.stats.drop(f"duplicate_{self.conflict}")
+
+        try:
+            with self.db.begin_nested():
+                self.db.add_all(rows)
+        except IntegrityError:
+            # 배치 중 일부만 충돌 → 한 행씩 다시
+            kept = []
+            kept_queries = []
+            for row, query in zip(rows, queries):
+                try:
+                    with self.db.begin_nested():
+                        self.db.add(row)
+                    kept.append(row)
+                    kept_queries.append(query)
+                except IntegrityError:
+                    self.stats.drop(f"duplicate_{self.conflict}")
+            rows, queries = kept, kept_queries
+        if rows and self.assign_stories:
+            from backend.app.utils.story_index import assign_stories
+            assign_stories(self.db, rows)
+        self.created.extend(rows)
+        self.stats.passed += len(rows)
+        if self.by_query is not None:
+            for row, query in zip(rows, queries):
+                self.by_query[query]["write"] += 1
+                self.by_query[query][f"write:{row.category}"] += 1
+
+    def write(self, candidates: Iterable[NewsCandidate]) -> List[NewsDaily]:
+        """전부 저장 후 commit (실패 시 rollback하고 빈 리스트)"""
+        started = time.perf_counter()
+        batch: List[NewsCandidate] = []
+        try:
+            for news in candidates:
+                batch.append(news)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    self._write_batch(batch)
+                    batch = []
+            if batch:
+                self._write_batch(batch)
+            self.db.commit()
+            for row in self.created:
+                self.db.refresh(row)
+        except IntegrityError as e:
+            self.db.rollback()
+            print(f"  ❌ DB 오류: {e}")
+            self.created = []
+            self.failed = True
+            if self.by_query is not None:
+                for counts in self.by_query.values():
+                    for key in [k for k in counts if k.startswith("write")]:
+                        del counts[key]
+        finally:
+            self.stats.seconds += time.perf_counter() - started
+        return self.created
+
+
+# ---------------------------------------------------------------------------
+
+def run_pipeline(
+    db: Session,
+    name: str,
+    source: Iterable[RawItem],
+    *,
+    min_dt: datetime,
+    topic_key_of: Callable[[str], str],
+    breaking_of: Callable[[str], bool],
+    force_breaking: bool = False,
+    skip_existing_topics: bool = True,
+    post_filters: Sequence[Callable[[List], List]] = (),
+    conflict: str = "topic",
+    update_society: bool = False,
+) -> Tuple[List[NewsDaily], PipelineStats]:
+    """source를 전체 단계에 통과시켜 저장하고 (저장된 행, 단계 통계) 반환"""
+    stats = PipelineStats(name)
+    query_of = lambda news: news.query
+    items = stats.meter("source", source, query_of=lambda raw: raw[0])
+    items = stats.meter("parse", parse_stage(items, stats.stage("parse")))
+    items = stats.meter("filter", filter_stage(items, stats.stage("filter"), min_dt, topic_key_of), query_of)
+    items = stats.meter("enrich", enrich_stage(items, breaking_of, force_breaking))
+    items = stats.meter("unique", unique_stage(items, stats.stage("unique"), db, skip_existing_topics), query_of)
+    items = stats.meter("similar", similarity_stage(items, stats.stage("similar"), post_filters), query_of)
+
+    # writer가 이터레이터를 당기는 동안 앞 단계가 실행되므로 write 시간은 전체 누적
+    writer = BatchWriter(db, stats.stage("write"), conflict=conflict, update_society=update_society,
+                         by_query=stats.by_query)
+    created = writer.write(items)
+    stats.updated = writer.updated
+    stats.write_failed = writer.failed
+    return created, stats
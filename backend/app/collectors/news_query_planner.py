@@ -0,0 +1,179 @@
+"""뉴스 검색 쿼리 계획 (쿼리별 수확량 기반)
+
+언론사/카테고리 키워드 쿼리마다 실제로 새로 저장된 기사 수를 지수 감쇠 평균으로
+news_query_stats 테이블에 남기고, 다음 실행에서
+- 수확량 높은 쿼리부터 호출하고
+- 카테고리별 목표 개수를 채울 만큼만 호출하며 (나머지는 건너뜀)
+- 신선한 결과가 페이지를 꽉 채우던 쿼리는 display를 넓힌다.
+
+통계가 부족한 쿼리(MIN_RUNS 미만)는 항상 호출하고,
+EXPLORE_AFTER회 연속 건너뛴 쿼리는 한 번 다시 호출해 통계를 갱신한다.
+통계가 없으면(첫 실행) 기존과 같이 모든 쿼리를 기본 display로 호출한다.
+"""
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from backend.app.db.models import NewsQueryStat
+
+DECAY = 0.3                # 새 관측 가중치 (지수 감쇠 평균)
+MIN_RUNS = 2               # 이보다 적게 호출된 쿼리는 항상 호출
+EXPLORE_AFTER = 6          # 연속으로 이만큼 건너뛰면 다시 호출
+TARGET_PER_CATEGORY = 20   # 카테고리별 실행당 목표 신규 기사 수
+MIN_PRESS_SAVED = 0.5      # 언론사 쿼리 최소 평균 신규 기사 수
+WIDEN_FILL = 0.5           # 신선 항목이 display의 이 비율 이상 차면 display 2배
+NARROW_FILL = 0.25         # 이 비율 미만이면 기본 display로 복귀
+MAX_DISPLAY = 100          # 네이버 검색 API display 최대값
+
+
+class QueryPlan:
+    """이번 실행에서 호출할 쿼리 (순서대로) + 쿼리별 display"""
+
+    def __init__(self, kind: str, default_display: int):
+        self.kind = kind
+        self.default_display = default_display
+        self.queries: List[str] = []
+        self.display: Dict[str, int] = {}
+        self.category: Dict[str, Optional[str]] = {}
+        self.skipped: List[str] = []
+        self.widened: List[str] = []
+
+    def add(self, query: str, display: int, category: Optional[str] = None) -> None:
+        self.queries.append(query)
+        self.display[query] = display
+        self.category[query] = category
+        if display > self.default_display:
+            self.widened.append(query)
+
+    def skip(self, query: str, category: Optional[str] = None) -> None:
+        self.skipped.append(query)
+        self.category[query] = category
+
+    def summary(self) -> str:
+        return (
+            f"호출 {len(self.queries)}개 / 건너뜀 {len(self.skipped)}개"
+            + (f" / display 확대 {len(self.widened)}개" if self.widened else "")
+        )
+
+
+def _load_stats(db: Session, kind: str) -> Dict[str, NewsQueryStat]:
+    rows = db.query(NewsQueryStat).filter(NewsQueryStat.kind == kind).all()
+    return {row.query: row for row in rows}
+
+
+def _needs_sample(row: Optional[NewsQueryStat]) -> bool:
+    """통계가 부족하거나 오래 건너뛴 쿼리"""
+    return row is None or (row.runs or 0) < MIN_RUNS or (row.skipped_runs or 0) + 1 >= EXPLORE_AFTER
+
+
+def _display_for(row: Optional[NewsQueryStat], default: int) -> int:
+    """
+    신선한 결과로 페이지가 차던 쿼리는 display 확대 (뒤에 더 있을 가능성)
+
+    확대/복귀 기준을 나눠(WIDEN_FILL / NARROW_FILL) 실행마다 오가지 않게 한다.
+    """
+    if row is None or not row.display:
+        return default
+    fill = row.avg_fill or 0.0
+    if fill >= WIDEN_FILL:
+        return min(max(row.display, default) * 2, MAX_DISPLAY)
+    if fill < NARROW_FILL:
+        return default
+    return max(row.display, default)
+
+
+def plan_press_queries(db: Session, presses: Sequence[str], default_display: int = 100) -> QueryPlan:
+    """언론사 쿼리: 평균 신규 기사 수 순, 거의 못 건지는 언론사는 건너뜀"""
+    stats = _load_stats(db, "press")
+    plan = QueryPlan("press", default_display)
+    ordered = list(dict.fromkeys(presses))  # 중복 쿼리는 같은 결과 → 한 번만
+    ordered.sort(key=lambda press: -(stats[press].avg_saved or 0.0) if press in stats else float("-inf"))
+    for press in ordered:
+        row = stats.get(press)
+        if _needs_sample(row) or (row.avg_saved or 0.0) >= MIN_PRESS_SAVED:
+            plan.add(press, _display_for(row, default_display))
+        else:
+            plan.skip(press)
+    return plan
+
+
+def plan_keyword_queries(
+    db: Session,
+    keywords_by_category: Mapping[str, Sequence[str]],
+    default_display: int = 30,
+    target: int = TARGET_PER_CATEGORY,
+) -> QueryPlan:
+    """
+    카테고리 키워드 쿼리: 카테고리별로 목표 카테고리 적중(avg_hits)이 높은 순으로
+    예상 적중 합이 target에 닿을 때까지 호출
+    """
+    stats = _load_stats(db, "keyword")
+    plan = QueryPlan("keyword", default_display)
+    for category, keywords in keywords_by_category.items():
+        if not keywords:
+            continue
+        # 통계 부족 쿼리 먼저 (원래 순서), 나머지는 적중 높은 순
+        unknown = [k for k in keywords if k not in stats or (stats[k].runs or 0) < MIN_RUNS]
+        known = sorted(
+            (k for k in keywords if k not in unknown),
+            key=lambda k: stats[k].avg_hits or 0.0,
+            reverse=True,
+        )
+        expected = 0.0
+        for keyword in unknown + known:
+            row = stats.get(keyword)
+            if expected < target or _needs_sample(row):
+                plan.add(keyword, _display_for(row, default_display), category)
+                expected += (row.avg_hits or 0.0) if row is not None else 0.0
+            else:
+                plan.skip(keyword, category)
+    return plan
+
+
+def _decayed(old: Optional[float], value: float, first: bool) -> float:
+    if first or old is None:
+        return float(value)
+    return (1 - DECAY) * old + DECAY * value
+
+
+def record_query_yields(db: Session, plan: QueryPlan, by_query: Mapping[str, Counter]) -> None:
+    """
+    실행 결과를 쿼리별 통계에 반영하고 commit
+
+    by_query: PipelineStats.by_query (source/filter/similar/write/write:<category> 통과 수)
+    """
+    stats = _load_stats(db, plan.kind)
+    now = datetime.now(timezone.utc)
+
+    for query in plan.queries:
+        row = stats.get(query)
+        if row is None:
+            row = NewsQueryStat(kind=plan.kind, query=query, runs=0, skipped_runs=0)
+            db.add(row)
+        counts = by_query.get(query) or Counter()
+        category = plan.category.get(query)
+        saved = counts["write"]
+        hits = counts[f"write:{category}"] if category else saved
+        first = not row.runs
+
+        row.category = category
+        row.avg_fetched = _decayed(row.avg_fetched, counts["source"], first)
+        row.avg_fresh = _decayed(row.avg_fresh, counts["filter"], first)
+        row.avg_fill = _decayed(row.avg_fill, counts["filter"] / plan.display[query], first)
+        row.avg_unique = _decayed(row.avg_unique, counts["similar"], first)
+        row.avg_saved = _decayed(row.avg_saved, saved, first)
+        row.avg_hits = _decayed(row.avg_hits, hits, first)
+        row.last_saved = saved
+        row.display = plan.display[query]
+        row.runs = (row.runs or 0) + 1
+        row.skipped_runs = 0
+        row.last_run_at = now
+
+    for query in plan.skipped:
+        row = stats.get(query)
+        if row is not None:
+            row.skipped_runs = (row.skipped_runs or 0) + 1
+
+    db.commit()
@@ -0,0 +1,160 @@
+"""네이버 뉴스 검색 증분 수집 (쿼리별 pubDate 워터마크)
+
+sort=date 결과를 start=로 넘기며 읽다가, 지난 수집에서 본 가장 최근 pubDate(워터마크)에
+닿으면 멈춘다. 워터마크 직전 OVERLAP 구간은 URL 집합으로 걸러서
+같은 초에 나온 기사나 늦게 색인된 기사를 놓치지도, 다시 넣지도 않게 한다.
+
+워터마크는 logs/news_watermarks.json에 저장하고,
+파일이 없으면(재배포 등) 호출부가 넘긴 DB 기준 시각으로 시작한다.
+"""
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_PATH = Path("logs") / "news_watermarks.json"
+KST_TZ = timezone(timedelta(hours=9))
+
+PAGE_SIZE = 100       # 네이버 검색 API display 최대값
+MAX_START = 1000      # 네이버 검색 API start 최대값
+OVERLAP = timedelta(minutes=10)  # 워터마크 이전이라도 URL 집합으로 다시 확인하는 구간
+
+_lock = threading.Lock()
+
+
+def parse_pub_date(pub_raw: Optional[str]) -> Optional[datetime]:
+    """pubDate(RFC 822) → KST aware datetime (실패 시 None)"""
+    if not pub_raw:
+        return None
+    try:
+        pub_dt = parsedate_to_datetime(pub_raw)
+    except Exception:
+        return None
+    if pub_dt.tzinfo:
+        return pub_dt.astimezone(KST_TZ)
+    return pub_dt.replace(tzinfo=KST_TZ)
+
+
+def item_url(item: Dict[str, Any]) -> Optional[str]:
+    return item.get("originallink") or item.get("link")
+
+
+def _load_all() -> Dict[str, Dict]:
+    if not WATERMARK_PATH.exists():
+        return {}
+    try:
+        return json.loads(WATERMARK_PATH.read_text())
+    except Exception:
+        return {}
+
+
+def load_watermark(query: str) -> Tuple[Optional[datetime], set]:
+    """(최근 pubDate, OVERLAP 구간 URL 집합)"""
+    with _lock:
+        state = _load_all().get(query) or {}
+    try:
+        pub = datetime.fromisoformat(state["pub"]) if state.get("pub") else None
+    except ValueError:
+        pub = None
+    return pub, set(state.get("urls") or [])
+
+
+def save_watermark(query: str, pub: datetime, urls: set) -> None:
+    with _lock:
+        state = _load_all()
+        state[query] = {"pub": pub.isoformat(), "urls": sorted(urls)}
+        try:
+            WATERMARK_PATH.parent.mkdir(parents=True, exist_ok=True)
+            WATERMARK_PATH.write_text(json.dumps(state, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"뉴스 워터마크 저장 실패 ({query}): {e}")
+
+
+class IncrementalFetch:
+    """증분 수집 결과 (새 항목 + 저장 성공 후 반영할 다음 워터마크)"""
+
+    def __init__(self, query: str, items: List[Dict[str, Any]], pages: int,
+                 next_pub: Optional[datetime], next_urls: set, reached_watermark: bool):
+        self.query = query
+        self.items = items
+        self.pages = pages
+        self.next_pub = next_pub
+        self.next_urls = next_urls
+        self.reached_watermark = reached_watermark
+
+    def commit(self) -> None:
+        """수집분 저장이 끝난 뒤 호출 (실패 시 호출하지 않으면 다음 실행이 같은 구간을 다시 읽음)"""
+        if self.next_pub is not None:
+            save_watermark(self.query, self.next_pub, self.next_urls)
+
+
+def fetch_incremental(
+    query: str,
+    fetch_page: Callable[[int], List[Dict[str, Any]]],
+    floor: Optional[datetime] = None,
+    seed: Optional[datetime] = None,
+) -> IncrementalFetch:
+    """
+    워터마크 이후의 새 항목만 조회
+
+    Args:
+        fetch_page: start → 해당 페이지 items (sort=date, display=PAGE_SIZE)
+        floor: 이보다 오래된 기사에서 멈춤 (예: 24시간 전)
+        seed: 저장된 워터마크가 없을 때 쓸 기준 시각 (예: DB의 최근 published_at)
+
+    pubDate를 읽을 수 없는 항목은 그대로 넘겨 호출부 통계(bad_pubdate)에 잡히게 한다.
+    """
+    watermark, seen_urls = load_watermark(query)
+    if watermark is None:
+        watermark = seed
+    stop_before = watermark - OVERLAP if watermark else None
+    if floor and (stop_before is None or floor > stop_before):
+        stop_before = floor
+
+    new_items: List[Dict[str, Any]] = []
+    newest = watermark
+    pages = 0
+    reached = False
+    start = 1
+    while start <= MAX_START:
+        items = fetch_page(start)
+        pages += 1
+        if not items:
+            break
+
+        for item in items:
+            pub_dt = parse_pub_date(item.get("pubDate"))
+            if pub_dt is None:
+                new_items.append(item)
+                continue
+            if stop_before and pub_dt < stop_before:
+                reached = True
+                continue
+            if item_url(item) in seen_urls:
+                continue
+            new_items.append(item)
+            if newest is None or pub_dt > newest:
+                newest = pub_dt
+
+        if reached or len(items) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+
+    # 다음 워터마크: 가장 최근 pubDate + 그 OVERLAP 구간 URL (이전 집합 중 구간 안의 것 포함)
+    next_urls = set()
+    if newest is not None:
+        window_start = newest - OVERLAP
+        for item in new_items:
+            pub_dt = parse_pub_date(item.get("pubDate"))
+            url = item_url(item)
+            if pub_dt and url and pub_dt >= window_start:
+                next_urls.add(url)
+        if watermark and watermark >= window_start:
+            next_urls |= seen_urls
+
+    return IncrementalFetch(query, new_items, pages, newest, next_urls, reached)
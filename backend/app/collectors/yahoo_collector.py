@@ -1,12 +1,67 @@
 """yfinance로 나스닥 지수, TOP5, 구리 선물 수집"""
 
 import yfinance as yf
+import pandas as pd
 from typing import Tuple, List, Dict, Any, Optional
 
+NASDAQ_INDEX_SYMBOL = "^IXIC"
+COPPER_SYMBOL = "HG=F"
+NASDAQ_TOP5_TICKERS = ["AAPL", "MSFT", "NVDA", "AMZN", "META"]
+
+# 표시 이름 (yfinance .info의 shortName - 종목마다 느린 요청이 추가되므로 미리 저장한 값 사용)
+TICKER_NAMES = {
+    "AAPL": "Apple Inc.",
+    "MSFT": "Microsoft Corporation",
+    "NVDA": "NVIDIA Corporation",
+    "AMZN": "Amazon.com, Inc.",
+    "META": "Meta Platforms, Inc.",
+}
+
+# 주말/휴장일이 끼어도 전일 종가가 남도록 며칠 여유를 두고 요청
+DOWNLOAD_PERIOD = "5d"
+
+
+def download_closes(symbols: List[str], period: str = DOWNLOAD_PERIOD) -> pd.DataFrame:
+    """여러 종목 일봉 종가를 한 번에 조회 (행 = 날짜, 열 = 종목)"""
+    frame = yf.download(
+        symbols,
+        period=period,
+        interval="1d",
+        group_by="column",
+        auto_adjust=False,
+        progress=False,
+    )
+    if frame is None or frame.empty:
+        return pd.DataFrame(columns=symbols)
+
+    closes = frame["Close"]
+    if isinstance(closes, pd.Series):  # 종목 1개면 Series로 옴
+        closes = closes.to_frame(symbols[0])
+    return closes
+
+
+def last_two_closes(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    종목별 마지막 종가/직전 종가/변동 (종목마다 거래일이 달라도 각자의 마지막 2개 값 사용)
+
+    Returns:
+        index = 종목, columns = close, prev_close, change, change_rate
+    """
+    stacked = closes.stack().dropna()
+    # nth()는 pandas 1.x/2.x 반환 인덱스가 달라서 tail(2) + first/last로 계산
+    grouped = stacked.groupby(level=-1, sort=False).tail(2).groupby(level=-1, sort=False)
+    result = pd.DataFrame({
+        "close": grouped.last(),
+        "prev_close": grouped.first().where(grouped.size() == 2),  # 값이 1개뿐이면 직전 종가 없음
+    })
+    result["change"] = result["close"] - result["prev_close"]
+    result["change_rate"] = result["change"] / result["prev_close"] * 100
+    return result
+
 
 def fetch_nasdaq_and_copper() -> Tuple[Optional[float], Optional[List[Dict[str, Any]]], Optional[float]]:
     """
-    Yahoo Finance에서 나스닥 + 구리 데이터 수집
+    Yahoo Finance에서 나스닥 + 구리 데이터 수집 (지수/TOP5/구리 한 번에 요청)
     
     Returns:
         nasdaq_index: 나스닥 지수 (^IXIC)
@@ -18,71 +73,46 @@ def fetch_nasdaq_and_copper() -> Tuple[Optional[float], Optional[List[Dict[str,
     nasdaq_top5 = None
     copper_usd = None
     
+    symbols = [NASDAQ_INDEX_SYMBOL, *NASDAQ_TOP5_TICKERS, COPPER_SYMBOL]
     try:
-        # 1. 나스닥 지수
-        print("  📊 나스닥 지수 수집 중...")
-        nasdaq = yf.Ticker("^IXIC")
-        nasdaq_hist = nasdaq.history(period="1d")
-        
-        if not nasdaq_hist.empty:
-            nasdaq_index = float(nasdaq_hist["Close"].iloc[-1])
-            print(f"    ✅ 나스닥 지수: {nasdaq_index:,.2f}")
-        
-    except Exception as e:
-        print(f"    ❌ 나스닥 지수 오류: {e}")
-    
-    try:
-        # 2. 나스닥 TOP5 (시가총액 상위)
-        print("  📈 나스닥 TOP5 수집 중...")
-        top5_tickers = ["AAPL", "MSFT", "NVDA", "AMZN", "META"]
-        
-        nasdaq_top5 = []
-        
-        for ticker in top5_tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="2d")  # 2일 (전일 대비 계산용)
-                info = stock.info
-                
-                if len(hist) >= 2:
-                    current_price = float(hist["Close"].iloc[-1])
-                    prev_price = float(hist["Close"].iloc[-2])
-                    change = current_price - prev_price
-                    change_rate = (change / prev_price) * 100
-                    
-                    nasdaq_top5.append({
-                        "ticker": ticker,
-                        "name": info.get("shortName", ticker),
-                        "price": f"${current_price:.2f}",
-                        "change": f"${change:+.2f}",
-                        "change_rate": f"{change_rate:+.2f}%"
-                    })
-                    
-                    print(f"    ✅ {ticker}: ${current_price:.2f} ({change_rate:+.2f}%)")
-                    
-            except Exception as e:
-                print(f"    ⚠️ {ticker} 오류: {e}")
-                continue
-        
-        if not nasdaq_top5:
-            nasdaq_top5 = None
-            
+        print("  📊 나스닥 지수/TOP5/구리 선물 수집 중...")
+        quotes = last_two_closes(download_closes(symbols))
     except Exception as e:
-        print(f"    ❌ 나스닥 TOP5 오류: {e}")
-    
-    try:
-        # 3. 구리 선물 (COMEX)
-        print("  🔶 구리 선물 수집 중...")
-        copper = yf.Ticker("HG=F")
-        copper_hist = copper.history(period="1d")
-        
-        if not copper_hist.empty:
-            # $/lb (파운드당 달러)
-            copper_usd = float(copper_hist["Close"].iloc[-1])
-            print(f"    ✅ 구리 선물: ${copper_usd:.4f}/lb")
-        
-    except Exception as e:
-        print(f"    ❌ 구리 선물 오류: {e}")
+        print(f"    ❌ Yahoo Finance 조회 오류: {e}")
+        return nasdaq_index, nasdaq_top5, copper_usd
+
+    # 1. 나스닥 지수
+    if NASDAQ_INDEX_SYMBOL in quotes.index:
+        nasdaq_index = float(quotes.at[NASDAQ_INDEX_SYMBOL, "close"])
+        print(f"    ✅ 나스닥 지수: {nasdaq_index:,.2f}")
+    else:
+        print("    ❌ 나스닥 지수 데이터 없음")
+
+    # 2. 나스닥 TOP5 (시가총액 상위) - 전일 대비 계산 가능한 종목만
+    nasdaq_top5 = []
+    top5 = quotes.reindex(NASDAQ_TOP5_TICKERS).dropna(subset=["close", "prev_close"])
+    for ticker, row in top5.iterrows():
+        nasdaq_top5.append({
+            "ticker": ticker,
+            "name": TICKER_NAMES.get(ticker, ticker),
+            "price": f"${row['close']:.2f}",
+            "change": f"${row['change']:+.2f}",
+            "change_rate": f"{row['change_rate']:+.2f}%"
+        })
+        print(f"    ✅ {ticker}: ${row['close']:.2f} ({row['change_rate']:+.2f}%)")
+
+    missing = [t for t in NASDAQ_TOP5_TICKERS if t not in top5.index]
+    if missing:
+        print(f"    ⚠️ 데이터 부족: {', '.join(missing)}")
+    if not nasdaq_top5:
+        nasdaq_top5 = None
+
+    # 3. 구리 선물 (COMEX, $/lb)
+    if COPPER_SYMBOL in quotes.index:
+        copper_usd = float(quotes.at[COPPER_SYMBOL, "close"])
+        print(f"    ✅ 구리 선물: ${copper_usd:.4f}/lb")
+    else:
+        print("    ❌ 구리 선물 데이터 없음")
     
     return nasdaq_index, nasdaq_top5, copper_usd
 
@@ -48,6 +48,10 @@ class Settings:
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
     ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
 
+    # News retention (이 기간이 지난 날짜는 압축 아카이브로 이동)
+    NEWS_HOT_DAYS: int = int(os.getenv("NEWS_HOT_DAYS", "14"))
+    NEWS_ARCHIVE_DAYS: int = int(os.getenv("NEWS_ARCHIVE_DAYS", "0"))  # 0 = 아카이브 영구 보관
+
     # Lotto (로또봇)
     LOTTO_ADMIN_CHAT_ID: Optional[str] = os.getenv("LOTTO_ADMIN_CHAT_ID")
 
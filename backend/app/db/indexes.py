@@ -0,0 +1,172 @@
+"""핫 쿼리용 인덱스 관리 + 실행 계획 확인
+
+- 모델 __table_args__에 정의한 복합/부분 인덱스는 새 테이블이면 create_all이 만들지만
+  이미 있는 테이블에는 안 만들어지므로 ensure_indexes()가 IF NOT EXISTS로 채운다.
+- HOT_QUERIES: 앱의 자주 쓰는 조회와 같은 모양의 SELECT + 기대 인덱스
+- explain_hot_queries(): PostgreSQL EXPLAIN / SQLite EXPLAIN QUERY PLAN으로
+  각 쿼리가 기대 인덱스를 (index-only 또는 index range scan으로) 쓰는지 확인
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql import Select
+
+from backend.app.db.models import MarketDaily, NewsDaily
+
+logger = logging.getLogger(__name__)
+
+# (테이블, 인덱스 이름) - 모델 __table_args__에 정의된 것
+MANAGED_INDEXES = [
+    (NewsDaily.__table__, "ix_news_date_category_hot"),
+    (NewsDaily.__table__, "ix_news_breaking_hot"),
+    (NewsDaily.__table__, "ix_news_breaking_unsent"),
+    (MarketDaily.__table__, "ix_market_date_id"),
+]
+
+
+def _index(table, name: str):
+    for index in table.indexes:
+        if index.name == name:
+            return index
+    raise KeyError(name)
+
+
+def ensure_indexes(engine: Engine) -> List[str]:
+    """관리 인덱스를 없으면 생성 → 실행한 인덱스 이름"""
+    created = []
+    with engine.connect() as conn:
+        for table, name in MANAGED_INDEXES:
+            try:
+                conn.execute(CreateIndex(_index(table, name), if_not_exists=True))
+                created.append(name)
+            except Exception as e:
+                logger.warning(f"인덱스 생성 실패 ({name}): {e}")
+                conn.rollback()
+        conn.commit()
+    return created
+
+
+class HotQuery(NamedTuple):
+    name: str
+    build: Callable[[date, datetime], Select]
+    indexes: Tuple[str, ...]  # 처리 가능한 인덱스 (앞이 기대 인덱스)
+    allow_sort: bool = False  # 정렬 단계 허용 여부 (인덱스 순서와 ORDER BY가 다른 쿼리)
+    sqlite_indexes: Tuple[str, ...] = ()  # SQLite에서만 추가로 인정하는 인덱스
+
+
+HOT_QUERIES = [
+    # 오늘 요약 / select_top_news / 봇 뉴스 콜백
+    HotQuery(
+        "news_category_top",
+        lambda day, now: select(NewsDaily)
+        .where(NewsDaily.date == day, NewsDaily.category == "economy")
+        .order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())
+        .limit(50),
+        ("ix_news_date_category_hot",),
+    ),
+    # 오늘 요약 / 봇 뉴스 콜백의 속보 TOP1
+    HotQuery(
+        "news_breaking_top1",
+        lambda day, now: select(NewsDaily)
+        .where(NewsDaily.date == day, NewsDaily.is_breaking.is_(True))
+        .order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())
+        .limit(1),
+        ("ix_news_breaking_hot",),
+    ),
+    # job_send_breaking_batch
+    HotQuery(
+        "news_breaking_unsent",
+        lambda day, now: select(NewsDaily)
+        .where(
+            NewsDaily.date == day,
+            NewsDaily.is_breaking.is_(True),
+            NewsDaily.alert_sent.is_(False),
+            NewsDaily.created_at >= now - timedelta(hours=6),
+        )
+        .order_by(NewsDaily.hot_score.desc()),
+        # 통계가 없으면 SQLite는 속보 전체 인덱스를 고르기도 함 (역시 hot_score 순 range scan)
+        ("ix_news_breaking_unsent", "ix_news_breaking_hot"),
+    ),
+    # 날짜별 최신 시장 데이터
+    HotQuery(
+        "market_latest",
+        lambda day, now: select(MarketDaily)
+        .where(MarketDaily.date == day)
+        .order_by(MarketDaily.id.desc())
+        .limit(1),
+        ("ix_market_date_id",),
+        # SQLite 인덱스는 끝에 rowid(= id)가 붙어 (date) 단일 인덱스로도 id 역순 검색이 됨
+        sqlite_indexes=("ix_market_daily_date",),
+    ),
+]
+
+
+def _explain(conn: Connection, stmt: Select) -> List[str]:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "postgresql":
+        return [row[0] for row in conn.execute(text("EXPLAIN " + sql))]
+    if conn.dialect.name == "sqlite":
+        return [row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql))]
+    raise RuntimeError(f"지원하지 않는 DB: {conn.dialect.name}")
+
+
+def check_plan(dialect: str, plan: List[str], query: HotQuery) -> Optional[str]:
+    """기대 인덱스를 쓰면 None, 아니면 실패 사유"""
+    joined = "\n".join(plan)
+    if dialect == "postgresql":
+        uses_index = any(
+            f"using {index} " in line and ("Index Scan" in line or "Index Only Scan" in line)
+            for line in plan
+            for index in query.indexes
+        )
+        if not uses_index:
+            return f"{query.indexes[0]} 인덱스 스캔 없음"
+        if "Seq Scan" in joined:
+            return "Seq Scan 포함"
+        if not query.allow_sort and "Sort" in joined:
+            return "정렬 단계 포함 (인덱스 순서로 ORDER BY 처리 안 됨)"
+        return None
+
+    # SQLite: "SEARCH news_daily USING [COVERING ]INDEX ix_... (date=? ...)"
+    uses_index = any(
+        line.startswith("SEARCH") and f"INDEX {index} " in line + " "
+        for line in plan
+        for index in query.indexes + query.sqlite_indexes
+    )
+    if not uses_index:
+        return f"{query.indexes[0]} 인덱스 검색 없음"
+    if not query.allow_sort and "TEMP B-TREE" in joined:
+        return "정렬용 임시 B-tree 사용 (인덱스 순서로 ORDER BY 처리 안 됨)"
+    return None
+
+
+def explain_hot_queries(engine: Engine, force_index: bool = True) -> Dict[str, dict]:
+    """
+    HOT_QUERIES 실행 계획 확인
+
+    Args:
+        force_index: PostgreSQL에서 enable_seqscan=off (행이 적은 테이블은 planner가
+            인덱스를 안 고르므로, 인덱스로 처리 '가능'한지를 본다)
+
+    Returns:
+        {쿼리 이름: {"indexes", "plan", "error"}}
+    """
+    day = date.today()
+    now = datetime.now()
+    results = {}
+    with engine.connect() as conn:
+        if force_index and conn.dialect.name == "postgresql":
+            conn.execute(text("SET LOCAL enable_seqscan = off"))
+        for query in HOT_QUERIES:
+            plan = _explain(conn, query.build(day, now))
+            results[query.name] = {
+                "indexes": query.indexes,
+                "plan": plan,
+                "error": check_plan(conn.dialect.name, plan, query),
+            }
+        conn.rollback()
+    return results
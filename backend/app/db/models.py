@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, Integer, String, Text, JSON, CheckConstraint, UniqueConstraint, Index
+from sqlalchemy import Boolean, Column, Date, DateTime, Float, Integer, LargeBinary, String, Text, JSON, CheckConstraint, UniqueConstraint, Index, and_
 # from sqlalchemy.orm import declarative_base
 
 from backend.app.db.session import Base
@@ -17,7 +17,7 @@ class NewsDaily(Base):
     __tablename__ = "news_daily"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    date = Column(Date, index=True)
+    date = Column(Date, index=True, nullable=False)  # 파티션 키 (PK (id, date)에 포함)
     source = Column(String(100))
     title = Column(String(500))
     url = Column(String(500))
@@ -41,11 +41,105 @@ class NewsDaily(Base):
     created_at = Column(DateTime, default=utcnow)
     published_at = Column(DateTime, nullable=True)
 
+    # 날짜를 넘어 같은 이슈를 묶는 스토리 (news_stories.id)
+    story_id = Column(Integer, index=True, nullable=True)
+
     __table_args__ = (
         # 같은 날짜의 같은 URL 중복 방지
         UniqueConstraint('date', 'url', name='uix_news_date_url'),
         # topic_key 중복 검색 최적화
         Index('ix_news_date_topic', 'date', 'topic_key'),
+        # 카테고리별 TOP (오늘 요약, select_top_news, 봇 뉴스): date, category → hot_score, created_at 순
+        Index('ix_news_date_category_hot', 'date', 'category', hot_score.desc(), created_at.desc()),
+        # 오늘 속보 TOP1 (is_breaking 행만)
+        Index(
+            'ix_news_breaking_hot', 'date', hot_score.desc(), created_at.desc(),
+            postgresql_where=is_breaking.is_(True),
+            sqlite_where=is_breaking.is_(True),
+        ),
+        # 미전송 속보 배치 (is_breaking AND NOT alert_sent 행만)
+        Index(
+            'ix_news_breaking_unsent', 'date', hot_score.desc(), 'created_at',
+            postgresql_where=and_(is_breaking.is_(True), alert_sent.is_(False)),
+            sqlite_where=and_(is_breaking.is_(True), alert_sent.is_(False)),
+        ),
+    )
+
+
+class NewsArchive(Base):
+    """핫 보관 기간이 지난 날짜의 뉴스 압축본 (날짜당 1행, 랭킹/TOP/전송된 속보만)"""
+    __tablename__ = "news_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(Date, nullable=False)
+    total_count = Column(Integer, default=0)  # 압축 전 그날 기사 수
+    kept_count = Column(Integer, default=0)   # 아카이브에 남긴 기사 수
+    payload = Column(LargeBinary, nullable=False)  # zlib 압축 JSON 목록
+    archived_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('date', name='uix_news_archive_date'),
+    )
+
+
+class NewsStory(Base):
+    """여러 날/배치에 걸친 같은 이슈(스토리) 묶음"""
+    __tablename__ = "news_stories"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    signature_title = Column(String(500), nullable=False)  # 처음 묶인 기사 제목 (대표)
+    latest_title = Column(String(500), nullable=True)      # 가장 최근에 묶인 기사 제목
+    topic_keys = Column(JSON, nullable=True)  # 최근 멤버 topic_key 목록
+    entities = Column(JSON, nullable=True)    # 멤버 핵심 키워드 합집합
+    item_count = Column(Integer, default=0)
+
+    first_seen = Column(DateTime, default=utcnow)
+    last_seen = Column(DateTime, default=utcnow, index=True)
+    last_ranked_date = Column(Date, nullable=True)   # 마지막으로 TOP에 든 날짜
+    last_alerted_at = Column(DateTime, nullable=True)  # 마지막 속보 배치 전송 시각
+
+
+class NewsStoryKey(Base):
+    """스토리 역색인 (topic_key / 인물 이슈 키 / MinHash 밴드 → 스토리)"""
+    __tablename__ = "news_story_keys"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    key = Column(String(120), nullable=False)
+    story_id = Column(Integer, nullable=False, index=True)
+    last_seen = Column(DateTime, default=utcnow, index=True)
+
+    __table_args__ = (
+        UniqueConstraint('key', 'story_id', name='uix_news_story_key'),
+        Index('ix_news_story_key_seen', 'key', 'last_seen'),
+    )
+
+
+class NewsQueryStat(Base):
+    """뉴스 검색 쿼리(언론사/키워드)별 수확량 (지수 감쇠 평균)"""
+    __tablename__ = "news_query_stats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)    # press / keyword
+    query = Column(String(100), nullable=False)
+    category = Column(String(50), nullable=True)  # 키워드가 채우려는 카테고리
+
+    runs = Column(Integer, default=0)          # 실제 호출한 실행 수
+    skipped_runs = Column(Integer, default=0)  # 연속으로 건너뛴 실행 수
+    display = Column(Integer, nullable=True)   # 마지막 호출 display
+
+    avg_fetched = Column(Float, default=0.0)  # 받은 항목
+    avg_fresh = Column(Float, default=0.0)    # 신선 + 허용 언론사
+    avg_fill = Column(Float, default=0.0)     # 신선 항목 / display (페이지가 찼는지)
+    avg_unique = Column(Float, default=0.0)   # 중복 제거 통과
+    avg_saved = Column(Float, default=0.0)    # 새로 저장
+    avg_hits = Column(Float, default=0.0)     # 새로 저장 중 목표 카테고리
+    last_saved = Column(Integer, default=0)
+
+    last_run_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('kind', 'query', name='uix_news_query_stat'),
     )
 
 
@@ -124,6 +218,8 @@ class MarketDaily(Base):
         # 같은 날짜에 여러 레코드 허용 (시간대별 업데이트 가능)
         # 하지만 날짜 기준 조회 최적화
         Index('ix_market_date_created', 'date', 'created_at'),
+        # 날짜별 최신 행 (date = ? ORDER BY id DESC)
+        Index('ix_market_date_id', 'date', 'id'),
     )
 
 
@@ -284,6 +380,27 @@ class LottoMLPerformance(Base):
     )
 
 
+class LottoEvaluationCache(Base):
+    """백테스트 평가 결과 캐시 (회차 × 가중치 × 모델 버전 × 생성기 버전)"""
+    __tablename__ = "lotto_evaluation_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    draw_no = Column(Integer, nullable=False)
+    weights_hash = Column(String(32), nullable=False)   # 정규화한 가중치 벡터 해시
+    model_version = Column(String(40), nullable=False)  # ML 모델 특성 중요도 해시 (없으면 'none')
+    generator_version = Column(String(20), nullable=False)
+    result = Column(JSON, nullable=False)  # evaluate_single_draw() 반환값
+    created_at = Column(DateTime, default=utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            'draw_no', 'weights_hash', 'model_version', 'generator_version',
+            name='uix_lotto_eval_cache_key',
+        ),
+        Index('ix_lotto_eval_cache_model_draw', 'model_version', 'generator_version', 'draw_no'),
+    )
+
+
 class NotificationLog(Base):
     """알림 전송 로그"""
     __tablename__ = "notification_log"
@@ -0,0 +1,304 @@
+"""뉴스 보관 정책 (핫 테이블 + 압축 아카이브)
+
+news_daily에는 최근 NEWS_HOT_DAYS일만 두고, 그보다 오래된 날짜는
+- 그날 카테고리별 hot_score 상위(랭킹) / is_top / 전송된 속보만 골라
+- zlib 압축 JSON으로 news_archive에 날짜당 1행으로 남긴 뒤
+- 날짜 단위로 한 번에 지운다 (행 단위 삭제 없음).
+
+PostgreSQL은 news_daily를 date 범위 파티션 테이블(하루 1파티션 + DEFAULT)로 바꿔 두면
+(news_retention.py --partition, 1회) 지난 날짜를 파티션 DROP TABLE 한 번으로 지운다.
+SQLite(또는 변환 전 PostgreSQL)는 아카이브로 옮긴 뒤 날짜별 DELETE 한 문장으로 지운다.
+어느 쪽이든 작업량은 전체 행 수가 아니라 날짜(파티션) 수 + 아카이브에 남기는 행 수에 비례한다.
+"""
+import json
+import logging
+import re
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from backend.app.config import settings
+from backend.app.db.models import NewsArchive, NewsDaily
+
+logger = logging.getLogger(__name__)
+
+KST_TZ = timezone(timedelta(hours=9))
+MIN_HOT_DAYS = 3               # 전일 핫 점수 반영/스토리 반복 판정보다 짧게 줄이지 않음
+ARCHIVE_TOP_PER_CATEGORY = 10  # select_top_news TOP 10과 같게
+PARTITION_AHEAD_DAYS = 3       # 미리 만들어 둘 미래 파티션 수
+PARTITION_PREFIX = "news_daily_p"
+DEFAULT_PARTITION = "news_daily_default"
+
+ARCHIVE_FIELDS = (
+    "id", "title", "url", "source", "category", "hot_score", "is_top", "is_breaking",
+    "alert_sent", "topic_key", "story_id", "keywords", "sentiment", "published_at", "created_at",
+)
+
+_news = NewsDaily.__table__
+_archive = NewsArchive.__table__
+_COLUMNS = ", ".join(column.name for column in _news.columns)
+
+
+def _today() -> date:
+    return datetime.now(KST_TZ).date()
+
+
+def hot_cutoff(today: Optional[date] = None, hot_days: Optional[int] = None) -> date:
+    """핫 보관 시작 날짜 (이보다 이전 날짜가 아카이브 대상)"""
+    hot_days = max(hot_days or settings.NEWS_HOT_DAYS, MIN_HOT_DAYS)
+    return (today or _today()) - timedelta(days=hot_days - 1)
+
+
+# ---- 아카이브 인코딩 ----
+
+def pack_items(items: List[dict]) -> bytes:
+    return zlib.compress(json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode(), 9)
+
+
+def unpack_items(payload: bytes) -> List[dict]:
+    return json.loads(zlib.decompress(payload).decode())
+
+
+def load_archived_news(db: Session, day: date) -> List[dict]:
+    """아카이브된 날짜의 기사 목록 (카테고리, 랭킹 순) - 없으면 빈 목록"""
+    archive = db.query(NewsArchive).filter(NewsArchive.date == day).first()
+    return unpack_items(archive.payload) if archive else []
+
+
+def _to_item(row) -> dict:
+    item = {}
+    for field in ARCHIVE_FIELDS:
+        value = row._mapping[field]
+        item[field] = value.isoformat() if isinstance(value, datetime) else value
+    return item
+
+
+def _archive_day(conn: Connection, day: date) -> Tuple[int, int]:
+    """그날 랭킹/TOP/전송된 속보만 압축해 news_archive에 저장 (있으면 합침) → (남긴 수, 그날 전체 수)"""
+    rank = func.row_number().over(
+        partition_by=_news.c.category,
+        order_by=(_news.c.hot_score.desc(), _news.c.created_at.desc()),
+    ).label("rank")
+    ranked = select(*(_news.c[field] for field in ARCHIVE_FIELDS), rank).where(_news.c.date == day).subquery()
+    rows = conn.execute(
+        select(ranked)
+        .where(or_(
+            ranked.c.rank <= ARCHIVE_TOP_PER_CATEGORY,
+            ranked.c.is_top.is_(True),
+            and_(ranked.c.is_breaking.is_(True), ranked.c.alert_sent.is_(True)),
+        ))
+        .order_by(ranked.c.category, ranked.c.rank)
+    ).all()
+    total = conn.execute(select(func.count()).select_from(_news).where(_news.c.date == day)).scalar() or 0
+    items = [_to_item(row) for row in rows]
+
+    existing = conn.execute(
+        select(_archive.c.payload, _archive.c.total_count).where(_archive.c.date == day)
+    ).first()
+    if existing is None:
+        conn.execute(_archive.insert().values(
+            date=day, total_count=total, kept_count=len(items), payload=pack_items(items),
+        ))
+        return len(items), total
+
+    # 아카이브 후 늦게 들어온 행 (예: DEFAULT 파티션) → 기존 목록 뒤에 중복 없이 추가
+    merged = unpack_items(existing.payload)
+    seen = {item.get("url") or item.get("title") for item in merged}
+    for item in items:
+        key = item.get("url") or item.get("title")
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    conn.execute(_archive.update().where(_archive.c.date == day).values(
+        total_count=(existing.total_count or 0) + total,
+        kept_count=len(merged),
+        payload=pack_items(merged),
+        archived_at=datetime.now(timezone.utc),
+    ))
+    return len(items), total
+
+
+# ---- PostgreSQL 파티션 ----
+
+def _partition_name(day: date) -> str:
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def _bounds(day: date) -> str:
+    return f"FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+
+
+def is_partitioned(conn: Connection) -> bool:
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.execute(
+        text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('news_daily')")
+    ).first() is not None
+
+
+def list_partitions(conn: Connection) -> Dict[date, str]:
+    """{날짜: 하루 파티션 이름} (DEFAULT 파티션 제외)"""
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass('news_daily')"
+    ))
+    partitions = {}
+    for (name,) in rows:
+        match = re.fullmatch(PARTITION_PREFIX + r"(\d{8})", name)
+        if match:
+            partitions[datetime.strptime(match.group(1), "%Y%m%d").date()] = name
+    return partitions
+
+
+def _default_partition_days(conn: Connection) -> List[date]:
+    rows = conn.execute(text(f"SELECT DISTINCT date FROM {DEFAULT_PARTITION}"))
+    return sorted(row[0] for row in rows)
+
+
+def _create_partition(conn: Connection, day: date) -> str:
+    """하루 파티션 생성 (DEFAULT 파티션에 먼저 들어간 그날 행은 옮긴 뒤 ATTACH)"""
+    name = _partition_name(day)
+    conn.execute(text(f"CREATE TABLE {name} (LIKE news_daily INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE date = :day RETURNING {_COLUMNS}) "
+            f"INSERT INTO {name} ({_COLUMNS}) SELECT {_COLUMNS} FROM moved"
+        ),
+        {"day": day},
+    )
+    conn.execute(text(f"ALTER TABLE news_daily ATTACH PARTITION {name} FOR VALUES {_bounds(day)}"))
+    return name
+
+
+def ensure_partitions(conn: Connection, today: date, cutoff: date) -> List[str]:
+    """오늘~PARTITION_AHEAD_DAYS일 뒤 + DEFAULT에 쌓인 핫 기간 날짜의 파티션 생성 → 만든 이름"""
+    existing = list_partitions(conn)
+    days = {today + timedelta(days=offset) for offset in range(PARTITION_AHEAD_DAYS + 1)}
+    days.update(day for day in _default_partition_days(conn) if day >= cutoff)
+    return [_create_partition(conn, day) for day in sorted(days) if day not in existing]
+
+
+def convert_to_partitioned(conn: Connection, today: date, cutoff: date) -> int:
+    """
+    news_daily를 date 범위 파티션 테이블로 변환 (1회, 한 트랜잭션) → 옮긴 행 수
+
+    핫 기간 날짜만 하루 파티션을 만들고, 그 이전 행은 DEFAULT 파티션에 넣어
+    바로 이어지는 압축에서 아카이브된다. PK는 파티션 키를 포함해야 해서 (id, date).
+    date가 없는 행은 published_at(없으면 created_at) 날짜로 채우고, 그래도 남거나
+    옮긴 행 수가 원래 행 수와 다르면 예외로 전체를 롤백한다 (옛 테이블을 지우기 전).
+    되돌릴 수 없는 작업이라 스케줄러는 호출하지 않고 news_retention.py --partition으로만 실행한다.
+    """
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence('news_daily', 'id')")).scalar()
+    if not sequence:
+        raise RuntimeError("news_daily.id 시퀀스를 찾지 못함")
+
+    conn.execute(text("ALTER TABLE news_daily RENAME TO news_daily_unpartitioned"))
+    conn.execute(text(
+        "UPDATE news_daily_unpartitioned SET date = CAST(COALESCE(published_at, created_at) AS DATE) "
+        "WHERE date IS NULL"
+    ))
+    undated = conn.execute(text("SELECT COUNT(*) FROM news_daily_unpartitioned WHERE date IS NULL")).scalar()
+    if undated:
+        raise RuntimeError(f"date를 채울 수 없는 행 {undated}개 - 변환 중단")
+    source_rows = conn.execute(text("SELECT COUNT(*) FROM news_daily_unpartitioned")).scalar()
+    conn.execute(text("CREATE TABLE news_daily (LIKE news_daily_unpartitioned INCLUDING DEFAULTS) PARTITION BY RANGE (date)"))
+    # id 기본값(nextval)은 그대로 쓰고, 시퀀스가 옛 테이블과 같이 지워지지 않게 소유권 이동
+    conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY news_daily.id"))
+    conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF news_daily DEFAULT"))
+
+    hot_days = {
+        row[0]
+        for row in conn.execute(
+            text("SELECT DISTINCT date FROM news_daily_unpartitioned WHERE date >= :cutoff"), {"cutoff": cutoff}
+        )
+    }
+    hot_days.update(today + timedelta(days=offset) for offset in range(PARTITION_AHEAD_DAYS + 1))
+    for day in sorted(hot_days):
+        conn.execute(text(f"CREATE TABLE {_partition_name(day)} PARTITION OF news_daily FOR VALUES {_bounds(day)}"))
+
+    moved = conn.execute(text(
+        f"INSERT INTO news_daily ({_COLUMNS}) SELECT {_COLUMNS} FROM news_daily_unpartitioned"
+    )).rowcount
+    if moved != source_rows:
+        raise RuntimeError(f"옮긴 행 수 불일치 ({moved}/{source_rows}) - 변환 중단")
+    conn.execute(text("DROP TABLE news_daily_unpartitioned"))
+
+    # 옛 테이블과 이름이 겹치지 않게 제약/인덱스는 DROP 뒤에 생성 (파티션에 자동 전파)
+    conn.execute(text("ALTER TABLE news_daily ADD CONSTRAINT news_daily_pkey PRIMARY KEY (id, date)"))
+    conn.execute(text("ALTER TABLE news_daily ADD CONSTRAINT uix_news_date_url UNIQUE (date, url)"))
+    for index in _news.indexes:
+        conn.execute(CreateIndex(index, if_not_exists=True))
+    return moved
+
+
+# ---- 보관 작업 ----
+
+def pending_days(conn: Connection, cutoff: date) -> List[date]:
+    """핫 테이블에 남아 있는 cutoff 이전 날짜"""
+    if is_partitioned(conn):
+        days = {day for day in list_partitions(conn) if day < cutoff}
+        days.update(day for day in _default_partition_days(conn) if day < cutoff)
+        return sorted(days)
+    rows = conn.execute(select(_news.c.date).where(_news.c.date < cutoff).distinct())
+    return sorted(row[0] for row in rows)
+
+
+def run_news_retention(
+    engine: Engine,
+    today: Optional[date] = None,
+    hot_days: Optional[int] = None,
+    archive_days: Optional[int] = None,
+    convert: bool = False,
+) -> dict:
+    """
+    핫 기간이 지난 날짜를 아카이브로 압축하고 핫 테이블에서 날짜 단위로 삭제
+
+    convert=True(news_retention.py --partition)면 PostgreSQL news_daily를 파티션 테이블로
+    변환한다. 이미 파티션 테이블이면 매번 앞으로 쓸 파티션을 미리 만든다. 날짜마다 아카이브 저장과 삭제를
+    한 트랜잭션으로 처리해 중간에 실패해도 그날 기사가 사라지지 않는다.
+
+    Returns:
+        {"partitioned", "converted", "created_partitions", "archived_days",
+         "kept_items", "removed_items", "pruned_archives"}
+    """
+    today = today or _today()
+    cutoff = hot_cutoff(today, hot_days)
+    archive_days = settings.NEWS_ARCHIVE_DAYS if archive_days is None else archive_days
+    summary = {
+        "partitioned": False, "converted": 0, "created_partitions": [], "archived_days": [],
+        "kept_items": 0, "removed_items": 0, "pruned_archives": 0,
+    }
+
+    with engine.begin() as conn:
+        if convert and engine.dialect.name == "postgresql" and not is_partitioned(conn):
+            summary["converted"] = convert_to_partitioned(conn, today, cutoff)
+            logger.info("news_daily 파티션 변환: rows=%s", summary["converted"])
+        summary["partitioned"] = is_partitioned(conn)
+        if summary["partitioned"]:
+            summary["created_partitions"] = ensure_partitions(conn, today, cutoff)
+        partitions = list_partitions(conn) if summary["partitioned"] else {}
+        days = pending_days(conn, cutoff)
+
+    for day in days:
+        with engine.begin() as conn:
+            kept, total = _archive_day(conn, day)
+            if day in partitions:
+                conn.execute(text(f"DROP TABLE {partitions[day]}"))
+            # 파티션이 없을 때(SQLite/DEFAULT 파티션)는 날짜 범위 한 문장
+            conn.execute(_news.delete().where(_news.c.date == day))
+        summary["archived_days"].append(day)
+        summary["kept_items"] += kept
+        summary["removed_items"] += total
+
+    if archive_days > 0:
+        with engine.begin() as conn:
+            summary["pruned_archives"] = conn.execute(
+                _archive.delete().where(_archive.c.date < today - timedelta(days=archive_days))
+            ).rowcount
+
+    return summary
@@ -1,15 +1,17 @@
 """로또 핸들러 (25줄: 기존 20줄 + ML 5줄)"""
 import json
-import random
 from datetime import datetime
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from backend.app.db.session import SessionLocal
-from backend.app.db.models import LottoStatsCache, LottoRecommendLog, LottoDraw, LottoUserPrediction, LottoMLPerformance
+from backend.app.db.models import LottoRecommendLog, LottoDraw, LottoUserPrediction, LottoMLPerformance
 from backend.app.services.lotto.generator import generate_20_lines
-from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
+from backend.app.services.lotto.line_mask import tally_matches
+from backend.app.services.lotto.line_scoring import line_scores, logic_score_matrix, number_scores, rank_and_select
+from backend.app.services.lotto.stats_snapshot import get_stats_snapshot
 from backend.app.services.lotto.ml_predictor import LottoMLPredictor
 from backend.app.services.lotto.ml_trainer import LottoMLTrainer
+from backend.app.services.lotto.model_registry import get_trainer
 
 
 def calculate_line_score(line: list, ai_weights: dict, scores_logic1: dict, scores_logic2: dict,
@@ -25,60 +27,36 @@ def calculate_line_score(line: list, ai_weights: dict, scores_logic1: dict, scor
     Returns:
         Combined score (sum of weighted individual number scores)
     """
-    total_score = 0.0
-    for num in line:
-        combined_score = (
-            scores_logic1.get(num, 0) * ai_weights.get('logic1', 0.25) +
-            scores_logic2.get(num, 0) * ai_weights.get('logic2', 0.25) +
-            scores_logic3.get(num, 0) * ai_weights.get('logic3', 0.25) +
-            scores_logic4.get(num, 0) * ai_weights.get('logic4', 0.25)
-        )
-        total_score += combined_score
-    return total_score
+    matrix = logic_score_matrix((scores_logic1, scores_logic2, scores_logic3, scores_logic4))
+    return float(line_scores([line], number_scores(ai_weights, matrix))[0])
 
 
 def select_lines_by_count(all_25_lines_flat: list, count: int, ai_weights: dict,
                           scores_logic1: dict, scores_logic2: dict,
-                          scores_logic3: dict, scores_logic4: dict) -> tuple:
+                          scores_logic3: dict, scores_logic4: dict,
+                          score_matrix=None) -> tuple:
     """
     Select N lines from 25 lines using hybrid strategy.
 
     - 5줄, 10줄: Random selection (다양성)
     - 15줄, 20줄, 25줄: Ranked by AI score (최적화)
+    - 이미 고른 줄과 5개 이상 겹치는 줄은 뒤로 미룸 (비트마스크 비교)
 
     Args:
         all_25_lines_flat: List of (name, numbers, logic) tuples
         count: Number of lines to select (5, 10, 15, 20, 25)
         ai_weights: AI weights
         scores_logic1-4: Score dictionaries
+        score_matrix: 통계 스냅샷의 (4 × 46) 로직 점수 행렬 (있으면 dict 변환 생략)
 
     Returns:
         (selected_lines, selection_method, lines_with_scores)
     """
-    # Calculate score for each line
-    lines_with_scores = []
-    for name, numbers, logic in all_25_lines_flat:
-        score = calculate_line_score(numbers, ai_weights, scores_logic1,
-                                     scores_logic2, scores_logic3, scores_logic4)
-        lines_with_scores.append((name, numbers, logic, score))
-
-    # Sort by score (descending)
-    sorted_lines = sorted(lines_with_scores, key=lambda x: x[3], reverse=True)
-
-    # Selection strategy
-    if count in [5, 10]:
-        # Random selection
-        selected = random.sample(sorted_lines, count)
-        selection_method = "랜덤"
-    else:
-        # Ranked selection (top N)
-        selected = sorted_lines[:count]
-        selection_method = "랭킹순"
-
-    # Re-sort selected lines by score for display (descending)
-    selected = sorted(selected, key=lambda x: x[3], reverse=True)
-
-    return selected, selection_method, sorted_lines
+    return rank_and_select(
+        all_25_lines_flat, count, ai_weights,
+        (scores_logic1, scores_logic2, scores_logic3, scores_logic4),
+        matrix=score_matrix,
+    )
 
 
 async def lotto_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -86,12 +64,12 @@ async def lotto_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     db = SessionLocal()
 
     try:
-        cache = db.query(LottoStatsCache).first()
-        if not cache:
+        snapshot = get_stats_snapshot(db)
+        if not snapshot:
             await update.message.reply_text("⚠️ 통계 데이터가 없습니다.")
             return
 
-        next_draw_no = cache.total_draws + 1
+        next_draw_no = snapshot.next_draw_no
 
         # 줄 수 선택 버튼
         keyboard = [
@@ -153,78 +131,46 @@ async def lotto_generate_callback(update: Update, context: ContextTypes.DEFAULT_
         # Parse requested count from callback data
         requested_count = int(query.data.split(":")[1])
 
-        cache = db.query(LottoStatsCache).first()
+        # 디코딩된 통계 스냅샷 (캐시 버전이 바뀐 경우에만 다시 읽음)
+        snapshot = get_stats_snapshot(db)
 
-        if not cache:
+        if not snapshot:
             await query.edit_message_text("⚠️ 통계 데이터가 없습니다.")
             return
-        
-        # 캐시에서 데이터 로드
-        most_common = json.loads(cache.most_common)
-        least_common = json.loads(cache.least_common)
-        ai_scores_data = json.loads(cache.ai_scores)
-        
-        # 전체 회차 데이터 조회 (3가지 로직 계산용)
-        draws = db.query(LottoDraw).order_by(LottoDraw.draw_no).all()
-        draws_dict = [
-            {
-                'draw_no': d.draw_no,
-                'n1': d.n1, 'n2': d.n2, 'n3': d.n3,
-                'n4': d.n4, 'n5': d.n5, 'n6': d.n6,
-                'bonus': d.bonus
-            }
-            for d in draws
-        ]
 
-        # 보너스 번호 출현 빈도 (많이 나온 순)
-        bonus_counts = {}
-        for d in draws_dict:
-            b = d.get('bonus')
-            if b:
-                bonus_counts[b] = bonus_counts.get(b, 0) + 1
-        bonus_top = [num for num, _ in sorted(bonus_counts.items(), key=lambda x: x[1], reverse=True)]
-        
-        # 4가지 로직 점수 계산 (Logic4 추가)
-        scores_logic1 = LottoStatsCalculator.calculate_ai_scores_logic1(draws_dict)
-        scores_logic2 = LottoStatsCalculator.calculate_ai_scores_logic2(draws_dict)
-        scores_logic3 = LottoStatsCalculator.calculate_ai_scores_logic3(draws_dict)
-        scores_logic4 = LottoStatsCalculator.calculate_ai_scores_logic4(draws_dict)
+        draws_dict = snapshot.draws
+        scores_logic1 = snapshot.scores_logic1
+        scores_logic2 = snapshot.scores_logic2
+        scores_logic3 = snapshot.scores_logic3
+        scores_logic4 = snapshot.scores_logic4
 
         # AI 가중치 (ML 모델에서 로드, 없으면 기본값)
         ai_weights = {'logic1': 0.25, 'logic2': 0.25, 'logic3': 0.25, 'logic4': 0.25}
         try:
-            trainer = LottoMLTrainer()
-            if trainer.load_model() and trainer.ai_weights:
+            trainer = get_trainer()
+            if trainer is not None and trainer.ai_weights:
                 ai_weights = trainer.ai_weights
         except Exception:
             pass
         
-        stats = {
-            'most_common': most_common,
-            'least_common': least_common,
-            'scores_logic1': scores_logic1,
-            'scores_logic2': scores_logic2,
-            'scores_logic3': scores_logic3,
-            'patterns': ai_scores_data.get('patterns', {}),
-            'best_patterns': ai_scores_data.get('best_patterns', {}),
-            'bonus_top': bonus_top
-        }
-        
+        stats = snapshot.generator_stats()
+
         user_id = update.effective_user.id
         result = generate_20_lines(user_id, stats, ai_weights)
 
-        next_draw_no = cache.total_draws + 1
+        next_draw_no = snapshot.next_draw_no
 
         # ML 5줄 생성 (기존 20줄과 중복 방지)
         ml_lines = []
         try:
-            trainer = LottoMLTrainer()
-            model_loaded = trainer.load_model()
+            trainer = get_trainer()
+            model_loaded = trainer is not None
 
-            # 모델이 없으면 자동 학습 시도
+            # 모델이 없으면 자동 학습 시도 (저장 시 레지스트리에 반영됨)
             if not model_loaded and len(draws_dict) >= 100:
                 print("⚠️ ML 모델 없음. 자동 학습 시작...")
                 try:
+                    trainer = LottoMLTrainer()
                     train_result = trainer.train(draws_dict, test_size=0.2)
                     print(f"✅ ML 모델 자동 학습 완료 - Acc: {train_result['test_accuracy']:.4f}")
                     model_loaded = True
@@ -310,7 +256,8 @@ async def lotto_generate_callback(update: Update, context: ContextTypes.DEFAULT_
         # Select N lines using hybrid strategy
         selected_lines, selection_method, all_sorted = select_lines_by_count(
             all_25_lines_flat, requested_count, ai_weights,
-            scores_logic1, scores_logic2, scores_logic3, scores_logic4
+            scores_logic1, scores_logic2, scores_logic3, scores_logic4,
+            score_matrix=snapshot.logic_matrix,
         )
 
         # DB 저장 1: 기존 로그 (하위 호환성)
@@ -383,7 +330,7 @@ async def lotto_generate_callback(update: Update, context: ContextTypes.DEFAULT_
         lines.append("━━━━━━━━━━━━━━━━━━━")
         lines.append("")
         lines.append("📊 AI 분석 기반")
-        lines.append(f"- 1~{cache.total_draws}회 전체 패턴 분석")
+        lines.append(f"- 1~{snapshot.total_draws}회 전체 패턴 분석")
         lines.append("- 4가지 로직 종합 (가중치 자동 조정)")
         w1 = ai_weights.get('logic1', 0) * 100
         w2 = ai_weights.get('logic2', 0) * 100
@@ -427,12 +374,12 @@ async def lotto_result_command(update: Update, context: ContextTypes.DEFAULT_TYP
         # Parse draw number from command args
         if not context.args or len(context.args) == 0:
             # Show usage with recent draw buttons
-            cache = db.query(LottoStatsCache).first()
-            if not cache:
+            snapshot = get_stats_snapshot(db)
+            if not snapshot:
                 await update.message.reply_text("⚠️ 데이터가 없습니다.")
                 return
 
-            latest_draw = cache.total_draws
+            latest_draw = snapshot.total_draws
 
             # Recent 4 draws buttons
             keyboard = [
@@ -540,32 +487,19 @@ async def show_lotto_result(message_or_query, draw_no: int) -> None:
         else:
             # Analyze if not already done
             if not user_prediction.analyzed:
-                winning_numbers = {draw.n1, draw.n2, draw.n3, draw.n4, draw.n5, draw.n6}
-
-                match_3 = match_4 = match_5 = match_6 = 0
-                total_matches = 0
-
-                for line_data in user_prediction.lines:
-                    line_numbers = set(line_data['numbers'])
-                    matches = len(line_numbers & winning_numbers)
-                    total_matches += matches
-
-                    if matches == 3:
-                        match_3 += 1
-                    elif matches == 4:
-                        match_4 += 1
-                    elif matches == 5:
-                        match_5 += 1
-                    elif matches == 6:
-                        match_6 += 1
+                winning_numbers = [draw.n1, draw.n2, draw.n3, draw.n4, draw.n5, draw.n6]
+                tally = tally_matches(
+                    (line_data['numbers'] for line_data in user_prediction.lines),
+                    winning_numbers,
+                )
 
                 # Update prediction with results
                 user_prediction.analyzed = True
-                user_prediction.match_3 = match_3
-                user_prediction.match_4 = match_4
-                user_prediction.match_5 = match_5
-                user_prediction.match_6 = match_6
-                user_prediction.total_matches = total_matches
+                user_prediction.match_3 = tally['match_3']
+                user_prediction.match_4 = tally['match_4']
+                user_prediction.match_5 = tally['match_5']
+                user_prediction.match_6 = tally['match_6']
+                user_prediction.total_matches = tally['total_matches']
                 user_prediction.analyzed_at = datetime.now()
                 db.commit()
 
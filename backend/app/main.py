@@ -3,9 +3,12 @@ from pathlib import Path
 import logging
 import threading
 import os
+import re
 from typing import List, Optional
 
-from fastapi import FastAPI, Depends, Query, Header, HTTPException
+from fastapi import FastAPI, BackgroundTasks, Depends, Query, Header, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, ConfigDict
 
@@ -14,6 +17,7 @@ from backend.app.db.models import NewsDaily, MarketDaily
 from backend.app.collectors.market_collector import collect_market_daily
 from backend.app.scheduler.jobs import start_scheduler
 from backend.app.config import settings
+from backend.app.utils.streaming import EXPORT_MEDIA_TYPES, parse_fields, stream_rows
 
 # ---- Cron API 인증 ----
 CRON_SECRET = os.getenv("CRON_SECRET", "")
@@ -67,15 +71,30 @@ def run_db_migrations():
         "ALTER TABLE market_daily ADD COLUMN IF NOT EXISTS sp500_index_change_pct DOUBLE PRECISION",
         # 전체 환율 데이터 (네이버 API 기반)
         "ALTER TABLE market_daily ADD COLUMN IF NOT EXISTS exchange_rates JSONB",
+        # 스토리 색인 (날짜를 넘는 이슈 묶기)
+        "ALTER TABLE news_daily ADD COLUMN IF NOT EXISTS story_id INTEGER",
+        "CREATE INDEX IF NOT EXISTS ix_news_daily_story_id ON news_daily (story_id)",
     ]
 
+    def sqlite_fallback(conn, sql: str) -> bool:
+        """SQLite는 ADD COLUMN IF NOT EXISTS가 없어 컬럼 존재를 직접 확인"""
+        match = re.match(r"ALTER TABLE (\w+) ADD COLUMN IF NOT EXISTS (\w+) (.+)", sql)
+        if engine.dialect.name != "sqlite" or not match:
+            return False
+        table, column, col_type = match.groups()
+        columns = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+        if columns and column not in columns:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}"))
+        return True
+
     try:
         with engine.connect() as conn:
             for sql in migrations:
                 try:
-                    conn.execute(text(sql))
+                    if not sqlite_fallback(conn, sql):
+                        conn.execute(text(sql))
                 except Exception as e:
-                    # 이미 존재하거나 SQLite인 경우 무시
+                    # 이미 존재하는 경우 무시
                     logging.debug(f"Migration skip: {sql[:50]}... - {e}")
             conn.commit()
         logging.info("DB 마이그레이션 체크 완료")
@@ -84,6 +103,18 @@ def run_db_migrations():
 
 run_db_migrations()
 
+# ---- 핫 쿼리 인덱스 (기존 테이블에도 복합/부분 인덱스 생성) ----
+def run_index_migrations():
+    from backend.app.db.indexes import ensure_indexes
+
+    try:
+        ensure_indexes(engine)
+        logging.info("DB 인덱스 체크 완료")
+    except Exception as e:
+        logging.warning(f"DB 인덱스 체크 스킵 (에러): {e}")
+
+run_index_migrations()
+
 app = FastAPI(title="Morning Bot Backend")
 
 
@@ -170,6 +201,49 @@ class TodaySummaryResponse(BaseModel):
     summary_comment: Optional[str] = None
 
 
+# ---- 빠른 응답 경로 (컬럼 projection + orjson) ----
+# DB 값은 이미 응답 스키마 타입과 같으므로 ORM 객체/pydantic 검증 없이
+# 필요한 컬럼만 row로 읽어 dict로 만들고 ORJSONResponse로 바로 인코딩한다.
+# (response_model은 OpenAPI 문서용으로만 유지)
+MARKET_RESPONSE_FIELDS = list(MarketDailyResponse.model_fields)
+MARKET_RESPONSE_COLUMNS = [
+    MarketDaily.__table__.c[name]
+    for name in MARKET_RESPONSE_FIELDS
+    if name in MarketDaily.__table__.c
+]
+NEWS_RESPONSE_FIELDS = list(NewsItemResponse.model_fields)
+# remove_duplicate_news 정렬 키(hot_score, created_at)까지 함께 조회
+NEWS_SELECT_COLUMNS = [NewsDaily.__table__.c[name] for name in NEWS_RESPONSE_FIELDS] + [
+    NewsDaily.hot_score,
+    NewsDaily.created_at,
+]
+
+# 오늘 요약: 시세 원본 컬럼 + 전일 대비를 계산하는 항목
+SUMMARY_MARKET_FIELDS = [
+    "date", "usd_krw", "btc_usdt", "btc_krw", "btc_usd", "btc_change_24h",
+    "gold_usd", "silver_usd", "platinum_usd", "copper_usd", "palladium_usd",
+    "aluminum_usd", "nickel_usd", "zinc_usd", "lead_usd",
+    "kospi_index", "kospi_top5", "nasdaq_index", "indices", "summary_comment",
+]
+SUMMARY_CHANGE_FIELDS = [
+    "usd_krw", "gold_usd", "silver_usd", "platinum_usd", "copper_usd",
+    "palladium_usd", "aluminum_usd", "nickel_usd", "zinc_usd", "lead_usd",
+]
+
+
+def market_row_to_dict(row) -> dict:
+    """MarketDaily row → MarketDailyResponse와 같은 키 순서의 dict"""
+    data = dict.fromkeys(MARKET_RESPONSE_FIELDS)
+    data.update(row._mapping)
+    return data
+
+
+def news_row_to_dict(row) -> dict:
+    """NewsDaily row → NewsItemResponse와 같은 키 순서의 dict"""
+    mapping = row._mapping
+    return {name: mapping[name] for name in NEWS_RESPONSE_FIELDS}
+
+
 # ---- 봇 상태 추적 ----
 _bot_status = {
     "started": False,
@@ -210,6 +284,14 @@ def on_startup() -> None:
     logging.info("✅ 스케줄러 시작 완료")
 
 
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    """공유 HTTP 클라이언트 연결 정리"""
+    from backend.app.utils.http_clients import close_all
+
+    close_all()
+
+
 @app.get("/api/health")
 def health_check(db: Session = Depends(get_db)) -> dict:
     return {"status": "ok"}
@@ -236,157 +318,104 @@ def debug_bot_status(_: None = Depends(verify_cron_secret)) -> dict:
     }
 
 
+@app.get("/api/debug/source-health")
+def debug_source_health(
+    reset: Optional[str] = Query(default=None, description="초기화할 소스(호스트) 이름"),
+    _: None = Depends(verify_cron_secret),
+) -> dict:
+    """외부 소스별 서킷 브레이커 상태 (closed/open/half_open) + HTTP 연결 재사용 지표"""
+    from backend.app.utils.circuit_breaker import find_breaker, get_breaker_states
+    from backend.app.utils.http_clients import client_metrics
+
+    if reset:
+        breaker = find_breaker(reset)
+        if breaker is None:
+            raise HTTPException(status_code=404, detail=f"알 수 없는 소스: {reset}")
+        breaker.reset()
+
+    return {"sources": get_breaker_states(), "http_clients": client_metrics()}
+
+
 # ---- 오늘 요약 ----
-@app.get("/api/today/summary", response_model=TodaySummaryResponse)
+@app.get("/api/today/summary", response_model=TodaySummaryResponse, response_class=ORJSONResponse)
 def get_today_summary(
     date: Optional[date_type] = Query(
         default=None,
         description="조회할 기준 날짜 (YYYY-MM-DD). 미지정 시 오늘 날짜 기준.",
     ),
     db: Session = Depends(get_db),
-) -> TodaySummaryResponse:
+) -> ORJSONResponse:
     target_date = date or date_type.today()
 
-    # 최신 MarketDaily 1건
-    market: Optional[MarketDaily] = (
-        db.query(MarketDaily)
-        .filter(MarketDaily.date == target_date)
+    # 최신 MarketDaily 1건 (필요한 컬럼만)
+    market = db.execute(
+        select(*[MarketDaily.__table__.c[name] for name in SUMMARY_MARKET_FIELDS])
+        .where(MarketDaily.date == target_date)
         .order_by(MarketDaily.id.desc())
-        .first()
-    )
-    
+        .limit(1)
+    ).first()
+
     # 전일 데이터 조회 (전일 대비 계산용)
     from datetime import timedelta
     yesterday = target_date - timedelta(days=1)
-    yesterday_market: Optional[MarketDaily] = (
-        db.query(MarketDaily)
-        .filter(MarketDaily.date == yesterday)
+    yesterday_market = db.execute(
+        select(*[MarketDaily.__table__.c[name] for name in SUMMARY_CHANGE_FIELDS])
+        .where(MarketDaily.date == yesterday)
         .order_by(MarketDaily.id.desc())
-        .first()
-    )
+        .limit(1)
+    ).first()
 
     # 오늘자 Top 뉴스 - 각 카테고리 1개 + 속보 1개 = 총 5개
     from backend.app.utils.dedup import remove_duplicate_news
-    
-    news_list: List[NewsDaily] = []
-    
+
+    news_list = []
+
     # 1. 각 카테고리에서 hot_score 최고 1개씩 (4개)
     for category in ["society", "economy", "culture", "entertainment"]:
-        top1 = (
-            db.query(NewsDaily)
-            .filter(NewsDaily.date == target_date, NewsDaily.category == category)
+        top1 = db.execute(
+            select(*NEWS_SELECT_COLUMNS)
+            .where(NewsDaily.date == target_date, NewsDaily.category == category)
             .order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())
-            .first()
-        )
+            .limit(1)
+        ).first()
         if top1:
             news_list.append(top1)
-    
+
     # 2. 속보 1개 추가 (hot_score 최고)
-    breaking_top1 = (
-        db.query(NewsDaily)
-        .filter(NewsDaily.date == target_date, NewsDaily.is_breaking.is_(True))
+    breaking_top1 = db.execute(
+        select(*NEWS_SELECT_COLUMNS)
+        .where(NewsDaily.date == target_date, NewsDaily.is_breaking.is_(True))
         .order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())
-        .first()
-    )
+        .limit(1)
+    ).first()
     if breaking_top1:
         news_list.append(breaking_top1)
-    
+
     # 3. 추가 중복 제거 (혹시 모를 경우 대비)
     news_list = remove_duplicate_news(news_list)
 
     summary_comment: Optional[str] = market.summary_comment if market else None
 
-    # MarketDailyResponse 생성 + 전일 대비 계산
-    markets_response: Optional[MarketDailyResponse] = None
+    # 시세 + 전일 대비 계산
+    markets_response: Optional[dict] = None
     if market:
-        # 기본 데이터
-        market_dict = {
-            "date": market.date,
-            "usd_krw": market.usd_krw,
-            "btc_usdt": market.btc_usdt,
-            "btc_krw": market.btc_krw,
-            "btc_usd": market.btc_usd,
-            "btc_change_24h": market.btc_change_24h,
-            "gold_usd": market.gold_usd,
-            "silver_usd": market.silver_usd,
-            "platinum_usd": market.platinum_usd,
-            "copper_usd": market.copper_usd,
-            "palladium_usd": market.palladium_usd,
-            "aluminum_usd": market.aluminum_usd,
-            "nickel_usd": market.nickel_usd,
-            "zinc_usd": market.zinc_usd,
-            "lead_usd": market.lead_usd,
-            "kospi_index": market.kospi_index,
-            "kospi_top5": market.kospi_top5,
-            "nasdaq_index": market.nasdaq_index,
-            "indices": market.indices,
-            "summary_comment": market.summary_comment,
-        }
-        
-        # 전일 대비 계산
-        if yesterday_market:
-            # 환율
-            if market.usd_krw and yesterday_market.usd_krw:
-                market_dict["usd_krw_change"] = market.usd_krw - yesterday_market.usd_krw
-                market_dict["usd_krw_change_pct"] = (market_dict["usd_krw_change"] / yesterday_market.usd_krw) * 100
-            
-            # 금
-            if market.gold_usd and yesterday_market.gold_usd:
-                market_dict["gold_usd_change"] = market.gold_usd - yesterday_market.gold_usd
-                market_dict["gold_usd_change_pct"] = (market_dict["gold_usd_change"] / yesterday_market.gold_usd) * 100
-            
-            # 은
-            if market.silver_usd and yesterday_market.silver_usd:
-                market_dict["silver_usd_change"] = market.silver_usd - yesterday_market.silver_usd
-                market_dict["silver_usd_change_pct"] = (market_dict["silver_usd_change"] / yesterday_market.silver_usd) * 100
-            
-            # 백금
-            if market.platinum_usd and yesterday_market.platinum_usd:
-                market_dict["platinum_usd_change"] = market.platinum_usd - yesterday_market.platinum_usd
-                market_dict["platinum_usd_change_pct"] = (market_dict["platinum_usd_change"] / yesterday_market.platinum_usd) * 100
-            
-            # 구리
-            if market.copper_usd and yesterday_market.copper_usd:
-                market_dict["copper_usd_change"] = market.copper_usd - yesterday_market.copper_usd
-                market_dict["copper_usd_change_pct"] = (market_dict["copper_usd_change"] / yesterday_market.copper_usd) * 100
-            
-            # 팔라디움
-            if market.palladium_usd and yesterday_market.palladium_usd:
-                market_dict["palladium_usd_change"] = market.palladium_usd - yesterday_market.palladium_usd
-                market_dict["palladium_usd_change_pct"] = (market_dict["palladium_usd_change"] / yesterday_market.palladium_usd) * 100
-            
-            # 알루미늄
-            if market.aluminum_usd and yesterday_market.aluminum_usd:
-                market_dict["aluminum_usd_change"] = market.aluminum_usd - yesterday_market.aluminum_usd
-                market_dict["aluminum_usd_change_pct"] = (market_dict["aluminum_usd_change"] / yesterday_market.aluminum_usd) * 100
-            
-            # 니켈
-            if market.nickel_usd and yesterday_market.nickel_usd:
-                market_dict["nickel_usd_change"] = market.nickel_usd - yesterday_market.nickel_usd
-                market_dict["nickel_usd_change_pct"] = (market_dict["nickel_usd_change"] / yesterday_market.nickel_usd) * 100
-            
-            # 아연
-            if market.zinc_usd and yesterday_market.zinc_usd:
-                market_dict["zinc_usd_change"] = market.zinc_usd - yesterday_market.zinc_usd
-                market_dict["zinc_usd_change_pct"] = (market_dict["zinc_usd_change"] / yesterday_market.zinc_usd) * 100
-            
-            # 납
-            if market.lead_usd and yesterday_market.lead_usd:
-                market_dict["lead_usd_change"] = market.lead_usd - yesterday_market.lead_usd
-                market_dict["lead_usd_change_pct"] = (market_dict["lead_usd_change"] / yesterday_market.lead_usd) * 100
-        
-        markets_response = MarketDailyResponse(**market_dict)
-
-    top_news_response: List[NewsItemResponse] = [
-        NewsItemResponse.model_validate(n, from_attributes=True) for n in news_list
-    ]
+        markets_response = market_row_to_dict(market)
 
-    return TodaySummaryResponse(
-        date=target_date,
-        markets=markets_response,
-        top_news=top_news_response,
-        summary_comment=summary_comment,
-    )
+        if yesterday_market:
+            for field in SUMMARY_CHANGE_FIELDS:
+                today_value = markets_response[field]
+                prev_value = getattr(yesterday_market, field)
+                if today_value and prev_value:
+                    change = today_value - prev_value
+                    markets_response[f"{field}_change"] = change
+                    markets_response[f"{field}_change_pct"] = (change / prev_value) * 100
+
+    return ORJSONResponse({
+        "date": target_date,
+        "markets": markets_response,
+        "top_news": [news_row_to_dict(n) for n in news_list],
+        "summary_comment": summary_comment,
+    })
 
 
 # ---- 수동 수집용 DEV 엔드포인트 ----
@@ -459,58 +488,106 @@ def collect_news_data(
 
 
 # ---- 시장 데이터 범위 조회 ----
-@app.get("/api/markets", response_model=list[MarketDailyResponse])
+@app.get("/api/markets", response_model=list[MarketDailyResponse], response_class=ORJSONResponse)
 def get_markets(
     from_date: Optional[date_type] = Query(default=None, alias="from", description="조회 시작 날짜"),
     to_date: Optional[date_type] = Query(default=None, alias="to", description="종료 날짜"),
     db: Session = Depends(get_db),
-) -> list[MarketDailyResponse]:
+) -> ORJSONResponse:
     """시장 데이터 목록 조회"""
-    query = db.query(MarketDaily)
+    stmt = select(*MARKET_RESPONSE_COLUMNS)
 
     if from_date:
-        query = query.filter(MarketDaily.date >= from_date)
+        stmt = stmt.where(MarketDaily.date >= from_date)
 
     if to_date:
-        query = query.filter(MarketDaily.date <= to_date)
+        stmt = stmt.where(MarketDaily.date <= to_date)
 
-    markets: List[MarketDaily] = query.order_by(MarketDaily.date.desc()).all()
+    rows = db.execute(stmt.order_by(MarketDaily.date.desc())).all()
 
-    return [
-        MarketDailyResponse.model_validate(m, from_attributes=True)
-        for m in markets
-    ]
+    return ORJSONResponse([market_row_to_dict(row) for row in rows])
+
+
+# ---- 시장 데이터 스트리밍 export (keyset 페이지네이션) ----
+MARKET_EXPORT_FIELDS = list(MarketDaily.__table__.columns.keys())
+
+
+@app.get("/api/markets/export")
+def export_markets(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$", description="출력 형식 (ndjson/csv)"),
+    from_date: Optional[date_type] = Query(default=None, alias="from", description="조회 시작 날짜"),
+    to_date: Optional[date_type] = Query(default=None, alias="to", description="종료 날짜"),
+    after_date: Optional[date_type] = Query(default=None, description="이어받기: 마지막으로 받은 행의 date"),
+    after_id: Optional[int] = Query(default=None, description="이어받기: 마지막으로 받은 행의 id (after_date 필수)"),
+    fields: Optional[str] = Query(default=None, description="반환할 컬럼 (쉼표 구분, 미지정 시 전체)"),
+    limit: Optional[int] = Query(default=None, ge=1, le=100000, description="최대 행 수"),
+) -> StreamingResponse:
+    """
+    시장 데이터 전체 이력을 (date, id) 오름차순으로 스트리밍
+
+    서버 사이드 커서로 읽어서 NDJSON/CSV로 바로 흘려보내므로 이력이 늘어나도
+    메모리 사용량이 일정합니다. 끊기면 마지막 행의 date/id를
+    after_date/after_id로 넘겨 이어받습니다. after_id만 주면 422.
+    """
+    if after_id is not None and after_date is None:
+        raise HTTPException(status_code=422, detail="after_id는 after_date와 함께 지정해야 합니다")
+
+    try:
+        columns = parse_fields(fields, MARKET_EXPORT_FIELDS, required=["date", "id"])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    stmt = select(*[MarketDaily.__table__.c[name] for name in columns])
+
+    if from_date:
+        stmt = stmt.where(MarketDaily.date >= from_date)
+    if to_date:
+        stmt = stmt.where(MarketDaily.date <= to_date)
+
+    if after_date and after_id is not None:
+        stmt = stmt.where(or_(
+            MarketDaily.date > after_date,
+            and_(MarketDaily.date == after_date, MarketDaily.id > after_id),
+        ))
+    elif after_date:
+        stmt = stmt.where(MarketDaily.date > after_date)
+
+    stmt = stmt.order_by(MarketDaily.date.asc(), MarketDaily.id.asc())
+    if limit:
+        stmt = stmt.limit(limit)
+
+    return StreamingResponse(
+        stream_rows(stmt, columns, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+    )
 
 
 # ---- 뉴스 조회 ----
-@app.get("/api/news", response_model=List[NewsItemResponse])
+@app.get("/api/news", response_model=List[NewsItemResponse], response_class=ORJSONResponse)
 def get_news(
     date: Optional[date_type] = Query(default=None, description="조회할 날짜 (YYYY-MM-DD)"),
     category: Optional[str] = Query(default=None, description="카테고리 필터 (general/economy/breaking)"),
     db: Session = Depends(get_db),
-) -> List[NewsItemResponse]:
+) -> ORJSONResponse:
     """뉴스 목록 조회"""
-    query = db.query(NewsDaily)
+    stmt = select(*NEWS_SELECT_COLUMNS)
 
     if date:
-        query = query.filter(NewsDaily.date == date)
+        stmt = stmt.where(NewsDaily.date == date)
 
     if category:
-        query = query.filter(NewsDaily.category == category)
+        stmt = stmt.where(NewsDaily.category == category)
+
+    news = db.execute(stmt.order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())).all()
 
-    news: List[NewsDaily] = query.order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc()).all()
-    
     # 중복 제거 (1+2+3 조합)
     from backend.app.utils.dedup import remove_duplicate_news
     news = remove_duplicate_news(news)
-    
+
     # TOP 10만 반환
     news = news[:10]
 
-    return [
-        NewsItemResponse.model_validate(n, from_attributes=True)
-        for n in news
-    ]
+    return ORJSONResponse([news_row_to_dict(n) for n in news])
 
 
 # ---- Cron API 엔드포인트 (cron-job.org용) ----
@@ -588,9 +665,11 @@ def cron_lotto_ml_eval(_: None = Depends(verify_cron_secret)) -> dict:
 
 @app.get("/api/admin/lotto-init")
 def admin_lotto_init(
-    start: int = Query(default=1, description="시작 회차"),
-    end: int = Query(default=None, description="종료 회차 (미지정 시 최신까지)"),
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    start: Optional[int] = Query(default=None, description="시작 회차 (미지정 시 1 또는 중단된 백필 범위)"),
+    end: Optional[int] = Query(default=None, description="종료 회차 (미지정 시 최신까지)"),
+    concurrency: int = Query(default=4, ge=1, le=8, description="동시 요청 수"),
+    rate: float = Query(default=3.0, gt=0, le=10, description="초당 회차 요청 수"),
     _: None = Depends(verify_cron_secret)
 ) -> dict:
     """
@@ -599,150 +678,39 @@ def admin_lotto_init(
     사용법: GET /api/admin/lotto-init?start=1&end=1209
     헤더: X-Cron-Secret: {your_secret}
 
-    주의: 전체 1200+회 수집 시 약 10-20분 소요
+    백그라운드로 실행되며 즉시 반환한다.
+    진행 상황은 /api/admin/lotto-status 의 backfill 항목에서 확인.
+    start/end 미지정 시 중단된 백필이 있으면 그 범위로 이어서 수집한다.
     """
-    from backend.app.collectors.lotto.api_client import LottoAPIClient
-    from backend.app.db.models import LottoDraw, LottoStatsCache
-    from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
-    import json
-    from datetime import datetime
-    import logging
-
-    logger = logging.getLogger(__name__)
-
-    try:
-        # 1. 현재 DB 상태 확인
-        latest_db_row = db.query(LottoDraw).order_by(LottoDraw.draw_no.desc()).first()
-        current_latest = latest_db_row.draw_no if latest_db_row else 0
-        total_in_db = db.query(LottoDraw).count()
-
-        # 2. API 클라이언트 초기화
-        api_client = LottoAPIClient(delay=0.3)
-
-        # 3. 최신 회차 확인
-        if end is None:
-            end = api_client.get_latest_draw_no()
-            if end == 0:
-                return {
-                    "status": "error",
-                    "message": "최신 회차 확인 실패 (API 차단 가능)",
-                    "current_db_latest": current_latest,
-                    "total_in_db": total_in_db
-                }
-
-        # 4. 수집 대상 회차 결정
-        missing_draws = []
-        for draw_no in range(start, end + 1):
-            exists = db.query(LottoDraw).filter(LottoDraw.draw_no == draw_no).first()
-            if not exists:
-                missing_draws.append(draw_no)
-
-        if not missing_draws:
-            return {
-                "status": "success",
-                "message": "이미 모든 데이터가 존재합니다",
-                "current_db_latest": current_latest,
-                "total_in_db": total_in_db,
-                "requested_range": f"{start}~{end}"
-            }
-
-        # 5. 데이터 수집
-        collected = 0
-        failed = []
-
-        for draw_no in missing_draws:
-            draw_info = api_client.get_lotto_draw(draw_no, retries=2)
-
-            if draw_info is None:
-                failed.append(draw_no)
-                continue
-
-            new_draw = LottoDraw(
-                draw_no=draw_no,
-                draw_date=draw_info['date'],
-                n1=draw_info['n1'],
-                n2=draw_info['n2'],
-                n3=draw_info['n3'],
-                n4=draw_info['n4'],
-                n5=draw_info['n5'],
-                n6=draw_info['n6'],
-                bonus=draw_info['bonus']
-            )
-            db.add(new_draw)
-            collected += 1
-
-            # 100개마다 커밋 (메모리 관리)
-            if collected % 100 == 0:
-                db.commit()
-                logger.info(f"로또 초기화 진행 중: {collected}개 저장됨")
-
-        db.commit()
-
-        # 6. 통계 캐시 갱신
-        draws = db.query(LottoDraw).order_by(LottoDraw.draw_no).all()
-        draws_dict = [
-            {
-                'draw_no': d.draw_no,
-                'n1': d.n1, 'n2': d.n2, 'n3': d.n3,
-                'n4': d.n4, 'n5': d.n5, 'n6': d.n6,
-                'bonus': d.bonus
-            }
-            for d in draws
-        ]
+    from backend.app.services.lotto.backfill import reserve_backfill, resume_range, run_backfill
 
-        calculator = LottoStatsCalculator()
-        most_common, least_common = calculator.calculate_most_least(draws_dict)
-        ai_scores = calculator.calculate_ai_scores(draws_dict)
-
-        cache = db.query(LottoStatsCache).first()
-        if cache:
-            cache.updated_at = datetime.now()
-            cache.total_draws = len(draws_dict)
-            cache.most_common = json.dumps(most_common)
-            cache.least_common = json.dumps(least_common)
-            cache.ai_scores = json.dumps(ai_scores)
-        else:
-            cache = LottoStatsCache(
-                updated_at=datetime.now(),
-                total_draws=len(draws_dict),
-                most_common=json.dumps(most_common),
-                least_common=json.dumps(least_common),
-                ai_scores=json.dumps(ai_scores)
-            )
-            db.add(cache)
-
-        db.commit()
-
-        # 7. ML 모델 학습 (데이터가 100개 이상일 때)
-        ml_result = None
-        if len(draws_dict) >= 100:
-            try:
-                from backend.app.services.lotto.ml_trainer import LottoMLTrainer
-                trainer = LottoMLTrainer()
-                ml_result = trainer.train(draws_dict, test_size=0.2)
-                logger.info(f"ML 모델 학습 완료: Acc={ml_result['test_accuracy']:.4f}")
-            except Exception as e:
-                logger.warning(f"ML 모델 학습 실패: {e}")
+    resumed = False
+    if start is None and end is None:
+        previous = resume_range()
+        if previous:
+            start, end = previous["start"], previous["end"]
+            resumed = True
+    start = start or 1
 
+    if not reserve_backfill(start, end):
         return {
-            "status": "success",
-            "message": f"{collected}개 회차 수집 완료",
-            "collected": collected,
-            "failed_draws": failed[:20] if failed else [],  # 처음 20개만
-            "failed_count": len(failed),
-            "total_in_db_after": len(draws_dict),
-            "stats_cache_updated": True,
-            "ml_trained": ml_result is not None,
-            "ml_accuracy": ml_result['test_accuracy'] if ml_result else None
+            "status": "running",
+            "message": "이미 백필이 실행 중입니다",
         }
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"로또 초기화 실패: {e}", exc_info=True)
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    background_tasks.add_task(
+        run_backfill,
+        start=start,
+        end=end,
+        concurrency=concurrency,
+        rate_per_sec=rate,
+    )
+    return {
+        "status": "started",
+        "message": "백필을 백그라운드에서 시작했습니다",
+        "requested_range": f"{start}~{end or 'latest'}",
+        "resumed": resumed,
+    }
 
 
 @app.get("/api/admin/lotto-status")
@@ -752,6 +720,8 @@ def admin_lotto_status(
 ) -> dict:
     """로또 DB 상태 확인 (인증 불필요)"""
     from backend.app.db.models import LottoDraw, LottoStatsCache
+    from backend.app.services.lotto.backfill import get_backfill_progress
+    from backend.app.services.lotto.model_registry import list_versions
 
     total = db.query(LottoDraw).count()
     latest = db.query(LottoDraw).order_by(LottoDraw.draw_no.desc()).first()
@@ -762,7 +732,9 @@ def admin_lotto_status(
         "latest_draw_no": latest.draw_no if latest else None,
         "latest_draw_date": latest.draw_date if latest else None,
         "stats_cache_exists": cache is not None,
-        "stats_cache_updated_at": cache.updated_at.isoformat() if cache else None
+        "stats_cache_updated_at": cache.updated_at.isoformat() if cache else None,
+        "backfill": get_backfill_progress(),
+        "ml_model_versions": list_versions(),
     }
 
 
@@ -793,6 +765,44 @@ def admin_lotto_export(
     }
 
 
+LOTTO_EXPORT_FIELDS = ["draw_no", "draw_date", "n1", "n2", "n3", "n4", "n5", "n6", "bonus"]
+
+
+@app.get("/api/admin/lotto-export/stream")
+def admin_lotto_export_stream(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$", description="출력 형식 (ndjson/csv)"),
+    after_draw_no: int = Query(default=0, ge=0, description="이어받기: 마지막으로 받은 회차"),
+    fields: Optional[str] = Query(default=None, description="반환할 컬럼 (쉼표 구분, 미지정 시 전체)"),
+    limit: Optional[int] = Query(default=None, ge=1, le=100000, description="최대 행 수"),
+    _: None = Depends(verify_cron_secret),
+) -> StreamingResponse:
+    """
+    로또 당첨번호 이력 스트리밍 export (draw_no keyset)
+
+    /api/admin/lotto-export와 같은 데이터를 한 번에 메모리에 올리지 않고
+    회차 오름차순으로 흘려보냅니다. 끊기면 마지막 draw_no를 after_draw_no로 넘깁니다.
+    """
+    from backend.app.db.models import LottoDraw
+
+    try:
+        columns = parse_fields(fields, LOTTO_EXPORT_FIELDS, required=["draw_no"])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    stmt = (
+        select(*[LottoDraw.__table__.c[name] for name in columns])
+        .where(LottoDraw.draw_no > after_draw_no)
+        .order_by(LottoDraw.draw_no.asc())
+    )
+    if limit:
+        stmt = stmt.limit(limit)
+
+    return StreamingResponse(
+        stream_rows(stmt, columns, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+    )
+
+
 from pydantic import BaseModel as PydanticBaseModel
 from typing import List
 
@@ -831,10 +841,8 @@ def admin_lotto_import(
          -d @lotto_data.json \\
          https://YOUR_APP.onrender.com/api/admin/lotto-import
     """
-    from backend.app.db.models import LottoDraw, LottoStatsCache
-    from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
-    import json
-    from datetime import datetime
+    from backend.app.db.models import LottoDraw
+    from backend.app.services.lotto.stats_snapshot import rebuild_stats_cache
     import logging
 
     logger = logging.getLogger(__name__)
@@ -866,39 +874,7 @@ def admin_lotto_import(
         db.commit()
 
         # 통계 캐시 갱신
-        draws = db.query(LottoDraw).order_by(LottoDraw.draw_no).all()
-        draws_dict = [
-            {
-                'draw_no': d.draw_no,
-                'n1': d.n1, 'n2': d.n2, 'n3': d.n3,
-                'n4': d.n4, 'n5': d.n5, 'n6': d.n6,
-                'bonus': d.bonus
-            }
-            for d in draws
-        ]
-
-        calculator = LottoStatsCalculator()
-        most_common, least_common = calculator.calculate_most_least(draws_dict)
-        ai_scores = calculator.calculate_ai_scores(draws_dict)
-
-        cache = db.query(LottoStatsCache).first()
-        if cache:
-            cache.updated_at = datetime.now()
-            cache.total_draws = len(draws_dict)
-            cache.most_common = json.dumps(most_common)
-            cache.least_common = json.dumps(least_common)
-            cache.ai_scores = json.dumps(ai_scores)
-        else:
-            cache = LottoStatsCache(
-                updated_at=datetime.now(),
-                total_draws=len(draws_dict),
-                most_common=json.dumps(most_common),
-                least_common=json.dumps(least_common),
-                ai_scores=json.dumps(ai_scores)
-            )
-            db.add(cache)
-
-        db.commit()
+        draws_dict = rebuild_stats_cache(db)
 
         # ML 모델 학습
         ml_result = None
@@ -930,6 +906,56 @@ def admin_lotto_import(
         }
 
 
+@app.get("/api/admin/lotto-simulate")
+def admin_lotto_simulate(
+    background_tasks: BackgroundTasks,
+    draws: int = Query(default=400_000, ge=1_000, le=2_000_000, description="합성 회차 수"),
+    baseline: int = Query(default=10_000_000, ge=10_000, le=20_000_000, description="무작위 표 평가 수"),
+    seed: Optional[int] = Query(default=None, description="난수 시드"),
+    ml: bool = Query(default=True, description="ML 5줄 포함 여부"),
+    _: None = Depends(verify_cron_secret),
+) -> dict:
+    """
+    현재 전략 줄의 Monte Carlo 시뮬레이션 (무작위 표 대비 유의성)
+
+    백그라운드로 실행되며 즉시 반환한다 (한 번에 하나만 실행).
+    합성 회차에 대한 전략별 일치 분포/평균과 95% 신뢰구간,
+    무작위 기준선 대비 차이(z)는 /api/admin/lotto-simulate/result 에서 확인.
+    """
+    from backend.app.services.lotto.monte_carlo import reserve_simulation, run_simulation_job
+
+    params = {"draws": draws, "baseline": baseline, "seed": seed, "ml": ml}
+    if not reserve_simulation(params):
+        return {
+            "status": "running",
+            "message": "이미 시뮬레이션이 실행 중입니다",
+        }
+
+    background_tasks.add_task(
+        run_simulation_job,
+        n_draws=draws,
+        baseline_evaluations=baseline,
+        seed=seed,
+        include_ml=ml,
+    )
+    return {
+        "status": "started",
+        "message": "시뮬레이션을 백그라운드에서 시작했습니다",
+        "params": params,
+    }
+
+
+@app.get("/api/admin/lotto-simulate/result")
+def admin_lotto_simulate_result(_: None = Depends(verify_cron_secret)) -> dict:
+    """마지막 Monte Carlo 시뮬레이션 상태/결과 (queued/running/success/error/interrupted)"""
+    from backend.app.services.lotto.monte_carlo import get_simulation_result
+
+    result = get_simulation_result()
+    if not result:
+        return {"status": "none", "message": "실행한 시뮬레이션이 없습니다"}
+    return result
+
+
 @app.get("/api/admin/lotto-ml-train")
 def admin_lotto_ml_train(
     db: Session = Depends(get_db),
@@ -7,13 +7,13 @@ import logging
 import json
 from datetime import datetime, time as time_type, timedelta, timezone
 from backend.app.db.session import SessionLocal
-from backend.app.db.models import Subscriber, LottoDraw, LottoStatsCache, NotificationLog
+from backend.app.db.models import Subscriber, LottoDraw, NotificationLog
 from backend.app.collectors.news_collector_v3 import build_daily_top5_v3, collect_breaking_news
 from backend.app.collectors.market_collector import collect_market_daily, calculate_daily_changes
 from backend.app.collectors.koreagoldx_collector import collect_korea_metal_daily
 from backend.app.services.notification_service import send_morning_brief_to_all, send_breaking_batch, send_morning_brief_to_chat
 from backend.app.collectors.lotto.api_client import LottoAPIClient
-from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
+from backend.app.services.lotto.stats_snapshot import rebuild_stats_cache
 from backend.app.services.lotto.performance_evaluator import evaluate_latest_draw
 from backend.app.services.lotto.grid_search_retrainer import check_and_retrain_if_needed
 
@@ -235,7 +235,7 @@ def job_lotto_weekly_update() -> None:
         # 2. API로 최신 회차 확인 시도 (폴백 포함)
         api_client = LottoAPIClient(delay=0.5)
         try:
-            latest_api = api_client.get_latest_draw_no()
+            latest_api = api_client.get_latest_draw_no(known_latest=latest_db)
             if latest_api:
                 logger.info(f"API 최신 회차: {latest_api}회")
             else:
@@ -280,42 +280,9 @@ def job_lotto_weekly_update() -> None:
         else:
             logger.info("신규 회차 없음")
 
-        # 3. 통계 캐시 갱신
+        # 3. 통계 캐시 갱신 (점수표/보너스 순위 포함, 각 프로세스는 버전 변경 시 다시 읽음)
         logger.info("통계 캐시 갱신 중...")
-        draws = db.query(LottoDraw).order_by(LottoDraw.draw_no).all()
-        draws_dict = [
-            {
-                'draw_no': d.draw_no,
-                'n1': d.n1, 'n2': d.n2, 'n3': d.n3,
-                'n4': d.n4, 'n5': d.n5, 'n6': d.n6,
-                'bonus': d.bonus
-            }
-            for d in draws
-        ]
-
-        calculator = LottoStatsCalculator()
-        most_common, least_common = calculator.calculate_most_least(draws_dict)
-        ai_scores = calculator.calculate_ai_scores(draws_dict)
-
-        # 캐시 업데이트
-        cache = db.query(LottoStatsCache).first()
-        if cache:
-            cache.updated_at = datetime.now()
-            cache.total_draws = len(draws_dict)
-            cache.most_common = json.dumps(most_common)
-            cache.least_common = json.dumps(least_common)
-            cache.ai_scores = json.dumps(ai_scores)
-        else:
-            cache = LottoStatsCache(
-                updated_at=datetime.now(),
-                total_draws=len(draws_dict),
-                most_common=json.dumps(most_common),
-                least_common=json.dumps(least_common),
-                ai_scores=json.dumps(ai_scores)
-            )
-            db.add(cache)
-
-        db.commit()
+        draws_dict = rebuild_stats_cache(db)
         logger.info("✅ 통계 캐시 갱신 완료")
 
         # 4. ML 모델 재학습 (신규 회차가 있을 때만)
@@ -332,6 +299,15 @@ def job_lotto_weekly_update() -> None:
         else:
             logger.info("신규 회차 없음, ML 재학습 스킵")
 
+        # 5. 사용자 예측 일괄 분석 (발표된 최신 회차 포함, 미분석분만)
+        try:
+            from backend.app.services.lotto.prediction_analyzer import analyze_predictions_for_draw
+            for draw_no in range(min(latest_db + 1, latest_api), latest_api + 1):
+                analyze_predictions_for_draw(db, draw_no)
+        except Exception as e:
+            logger.error(f"⚠️ 사용자 예측 분석 실패: {e}", exc_info=True)
+            db.rollback()
+
         logger.info(f"=== 로또 업데이트 완료: 신규 {new_count}개, 전체 {len(draws_dict)}회 ===")
 
     except Exception as e:
@@ -359,6 +335,36 @@ def job_lotto_performance_evaluation() -> None:
     except Exception as e:
         logger.error(f"로또 ML 성능 평가 실패: {e}", exc_info=True)
 
+def job_prune_story_index() -> None:
+    """매일 04:30: 오래 안 보인 스토리 역색인 키 정리"""
+    db = SessionLocal()
+    try:
+        from backend.app.utils.story_index import prune_story_index
+
+        deleted = prune_story_index(db)
+        logger.info("Story index pruned: keys=%s", deleted)
+    except Exception as e:
+        logger.error(f"스토리 색인 정리 실패: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def job_news_retention() -> None:
+    """매일 04:40: 핫 기간이 지난 뉴스 날짜를 압축 아카이브로 옮기고 파티션/날짜 단위로 삭제"""
+    try:
+        from backend.app.db.retention import run_news_retention
+        from backend.app.db.session import engine
+
+        summary = run_news_retention(engine)
+        logger.info(
+            "News retention: partitioned=%s converted=%s new_partitions=%s days=%s kept=%s removed=%s pruned_archives=%s",
+            summary["partitioned"], summary["converted"], len(summary["created_partitions"]),
+            len(summary["archived_days"]), summary["kept_items"], summary["removed_items"],
+            summary["pruned_archives"],
+        )
+    except Exception as e:
+        logger.error(f"뉴스 보관 정리 실패: {e}", exc_info=True)
+
 def job_retry_failed_notifications() -> None:
     """실패한 알림 재전송 (매 30분마다)"""
     db = SessionLocal()
@@ -481,11 +487,11 @@ def start_scheduler() -> None:
     
     # 전일대비 계산 + 브리핑 전송은 사용자별 스케줄로만 처리
     
-    # 매시간: 속보 수집만 (매시 55분, 배치 전 5분 확보)
+    # 10분마다: 속보 증분 수집 (워터마크 이후 새 기사만 읽어 API 호출 1회 내외, 배치 전 5분 확보)
     scheduler.add_job(
         job_collect_breaking_news,
         "cron",
-        minute=55,
+        minute="5,15,25,35,45,55",
         id="collect_breaking_news",
         replace_existing=True,
     )
@@ -553,6 +559,26 @@ def start_scheduler() -> None:
         replace_existing=True
     )
 
+    # 스토리 역색인 정리: 매일 04:30
+    scheduler.add_job(
+        job_prune_story_index,
+        "cron",
+        hour=4,
+        minute=30,
+        id="prune_story_index",
+        replace_existing=True,
+    )
+
+    # 뉴스 보관 정리 (아카이브 압축 + 파티션 관리): 매일 04:40 (속보 수집 :35/:45 사이)
+    scheduler.add_job(
+        job_news_retention,
+        "cron",
+        hour=4,
+        minute=40,
+        id="news_retention",
+        replace_existing=True,
+    )
+
     # 시장 데이터 재수집은 비활성화 (하루 1회 수집 유지)
 
     scheduler.start()
@@ -0,0 +1,253 @@
+"""로또 회차 백필 엔진 (누락 회차 병렬 수집 + 체크포인트, 백그라운드 실행)"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.app.collectors.lotto.api_client import LottoAPIClient
+from backend.app.db.models import LottoDraw
+from backend.app.db.session import SessionLocal
+from backend.app.services.lotto.stats_snapshot import rebuild_stats_cache
+from backend.app.utils.background_job import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 파일 (재시작 후 진행 상황/범위 복구용)
+BACKFILL_STATE_PATH = Path("logs") / "lotto_backfill_state.json"
+
+DEFAULT_CONCURRENCY = 4        # 동시 요청 수
+DEFAULT_RATE_PER_SEC = 3.0     # 초당 회차 요청 수 (사이트 부하 방지)
+DEFAULT_BATCH_SIZE = 50        # 일괄 INSERT 단위
+
+_job = BackgroundJob(BACKFILL_STATE_PATH, "백필")
+
+
+class RateLimiter:
+    """스레드 간 공유되는 최소 간격 기반 요청 제한"""
+
+    def __init__(self, rate_per_sec: float):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def find_missing_draws(db: Session, start: int, end: int) -> List[int]:
+    """SELECT draw_no 1회 + 집합 차로 누락 회차 계산"""
+    existing = set(
+        db.scalars(
+            select(LottoDraw.draw_no).where(LottoDraw.draw_no.between(start, end))
+        )
+    )
+    return sorted(set(range(start, end + 1)) - existing)
+
+
+def _update_progress(**changes) -> None:
+    """메모리 진행 상황 갱신 + 체크포인트 저장"""
+    _job.update(**changes)
+
+
+def get_backfill_progress() -> Dict:
+    """
+    현재 백필 진행 상황
+
+    프로세스가 재시작되어 메모리 상태가 없으면 체크포인트 파일을 읽는다.
+    파일상 실행 중이었다면 중단(interrupted)으로 표시한다.
+    """
+    return _job.snapshot()
+
+
+def is_backfill_running() -> bool:
+    return _job.is_running()
+
+
+def reserve_backfill(start: int, end: Optional[int]) -> bool:
+    """
+    백필 실행 슬롯 예약 (동시 실행 방지)
+
+    Returns:
+        bool: 예약 성공 시 True, 이미 실행 중이면 False
+    """
+    return _job.reserve(start=start, end=end)
+
+
+def resume_range() -> Optional[Dict]:
+    """중단된 백필의 회차 범위 (없으면 None)"""
+    state = get_backfill_progress()
+    if state.get("status") != "interrupted" or not state.get("start"):
+        return None
+    return {"start": state["start"], "end": state.get("end")}
+
+
+def _flush(db: Session, rows: List[Dict]) -> int:
+    """수집된 회차 일괄 INSERT (그 사이 다른 작업이 넣은 회차는 제외)"""
+    if not rows:
+        return 0
+    draw_nos = [r["draw_no"] for r in rows]
+    existing = set(db.scalars(select(LottoDraw.draw_no).where(LottoDraw.draw_no.in_(draw_nos))))
+    new_rows = [r for r in rows if r["draw_no"] not in existing]
+    if new_rows:
+        db.execute(insert(LottoDraw), new_rows)
+    db.commit()
+    return len(new_rows)
+
+
+def _refresh_stats_and_model(db: Session) -> Dict:
+    """전체 회차 기준 통계 캐시 갱신 + ML 모델 학습 (100회 이상)"""
+    draws_dict = rebuild_stats_cache(db)
+
+    ml_accuracy = None
+    if len(draws_dict) >= 100:
+        try:
+            from backend.app.services.lotto.ml_trainer import LottoMLTrainer
+            trainer = LottoMLTrainer()
+            ml_result = trainer.train(draws_dict, test_size=0.2)
+            ml_accuracy = ml_result['test_accuracy']
+            logger.info(f"ML 모델 학습 완료: Acc={ml_accuracy:.4f}")
+        except Exception as e:
+            logger.warning(f"ML 모델 학습 실패: {e}")
+
+    return {
+        "total_in_db_after": len(draws_dict),
+        "stats_cache_updated": True,
+        "ml_trained": ml_accuracy is not None,
+        "ml_accuracy": ml_accuracy,
+    }
+
+
+def run_backfill(
+    start: int = 1,
+    end: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_per_sec: float = DEFAULT_RATE_PER_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict:
+    """
+    누락 회차 백필 (BackgroundTasks/스레드에서 실행)
+
+    1. 최신 회차 확인 (end 미지정 시)
+    2. 누락 회차 = 요청 범위 - DB 회차 (쿼리 1회)
+    3. 스레드 풀로 병렬 수집 (전역 rate limit 공유, 스레드별 API 클라이언트)
+    4. batch_size 단위 일괄 INSERT + 체크포인트 저장
+    5. 통계 캐시/ML 모델 갱신 (신규 회차가 있을 때)
+
+    중단되더라도 저장된 회차는 다음 실행에서 누락 목록에서 빠지므로
+    같은 범위로 다시 호출하면 이어서 수집한다.
+    """
+    if not is_backfill_running():
+        reserve_backfill(start, end)
+
+    db = SessionLocal()
+    try:
+        _update_progress(status="running", started_at=datetime.now().isoformat())
+
+        if end is None:
+            db_latest = db.scalar(select(func.max(LottoDraw.draw_no))) or 0
+            end = LottoAPIClient(delay=0.3).get_latest_draw_no(known_latest=db_latest)
+            if end == 0:
+                _update_progress(
+                    status="error",
+                    error="최신 회차 확인 실패 (API 차단 가능)",
+                    finished_at=datetime.now().isoformat(),
+                )
+                return get_backfill_progress()
+
+        missing = find_missing_draws(db, start, end)
+        _update_progress(end=end, total=len(missing), collected=0, failed=[], failed_count=0)
+
+        if not missing:
+            _update_progress(
+                status="success",
+                message="이미 모든 데이터가 존재합니다",
+                finished_at=datetime.now().isoformat(),
+            )
+            return get_backfill_progress()
+
+        logger.info(f"로또 백필 시작: {start}~{end}, 누락 {len(missing)}개")
+
+        limiter = RateLimiter(rate_per_sec)
+        # HTTP 연결은 호스트별 공유 클라이언트를 쓰므로 스레드 간 공유 가능
+        client = LottoAPIClient(delay=0.3)
+
+        def fetch(draw_no: int) -> Optional[Dict]:
+            limiter.wait()
+            return client.get_lotto_draw(draw_no, retries=2)
+
+        collected = 0
+        failed: List[int] = []
+        buffer: List[Dict] = []
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {executor.submit(fetch, draw_no): draw_no for draw_no in missing}
+            for future in as_completed(futures):
+                draw_no = futures[future]
+                try:
+                    draw_info = future.result()
+                except Exception as e:
+                    logger.warning(f"회차 {draw_no} 수집 오류: {e}")
+                    draw_info = None
+
+                if draw_info is None:
+                    failed.append(draw_no)
+                    continue
+
+                buffer.append({
+                    "draw_no": draw_no,
+                    "draw_date": draw_info['date'],
+                    "n1": draw_info['n1'],
+                    "n2": draw_info['n2'],
+                    "n3": draw_info['n3'],
+                    "n4": draw_info['n4'],
+                    "n5": draw_info['n5'],
+                    "n6": draw_info['n6'],
+                    "bonus": draw_info['bonus'],
+                })
+
+                if len(buffer) >= batch_size:
+                    collected += _flush(db, buffer)
+                    buffer = []
+                    _update_progress(
+                        collected=collected,
+                        failed=sorted(failed)[:20],
+                        failed_count=len(failed),
+                    )
+                    logger.info(f"로또 백필 진행 중: {collected}/{len(missing)}개 저장됨")
+
+        collected += _flush(db, buffer)
+        _update_progress(
+            collected=collected,
+            failed=sorted(failed)[:20],  # 처음 20개만
+            failed_count=len(failed),
+        )
+
+        # 신규 회차가 있을 때만 통계/모델 갱신
+        result = _refresh_stats_and_model(db) if collected else {"stats_cache_updated": False}
+        _update_progress(
+            status="success",
+            message=f"{collected}개 회차 수집 완료",
+            finished_at=datetime.now().isoformat(),
+            **result,
+        )
+        logger.info(f"로또 백필 완료: {collected}개 저장, 실패 {len(failed)}개")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"로또 백필 실패: {e}", exc_info=True)
+        _update_progress(status="error", error=str(e), finished_at=datetime.now().isoformat())
+    finally:
+        db.close()
+
+    return get_backfill_progress()
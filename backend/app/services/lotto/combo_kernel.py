@@ -0,0 +1,128 @@
+"""로또 조합 일괄 평가 커널
+
+후보 k개에서 나오는 C(k, 6) 조합 전체를 NumPy 배열로 만들어
+점수/패턴 특성/중복 여부를 한 번에 계산한다.
+- 조합 인덱스는 k별로 1회만 만들어 재사용
+- 중복 판정은 비트마스크(line_mask) 연산
+- 상위 선택은 argpartition
+"""
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from backend.app.services.lotto.line_mask import MAX_NUMBER, popcount_array
+
+LINE_SIZE = 6
+
+_BITS = np.array([1 << n for n in range(MAX_NUMBER + 1)], dtype=np.uint64)
+
+
+@lru_cache(maxsize=None)
+def combo_indices(k: int, r: int = LINE_SIZE) -> np.ndarray:
+    """C(k, r) 인덱스 배열 (itertools.combinations와 같은 순서)"""
+    idx = np.array(list(combinations(range(k), r)), dtype=np.intp).reshape(-1, r)
+    idx.setflags(write=False)
+    return idx
+
+
+def weight_vector(weights: Dict[int, float]) -> np.ndarray:
+    """번호별 점수 dict → 인덱스가 번호인 배열 (없는 번호는 0)"""
+    return np.array([float(weights.get(n, 0)) for n in range(MAX_NUMBER + 1)], dtype=np.float64)
+
+
+class ComboSet:
+    """후보 번호로 만든 6개 조합 전체와 패턴 특성"""
+
+    def __init__(self, candidates: Sequence[int]):
+        cands = np.asarray(list(candidates), dtype=np.int64)
+        # 후보 순서 그대로 (점수 합산 순서를 기존 루프와 맞추기 위함)
+        self.numbers = cands[combo_indices(len(cands))]
+        self.sorted_numbers = np.sort(self.numbers, axis=1)
+        self.masks = np.bitwise_or.reduce(_BITS[self.numbers], axis=1) if len(self.numbers) else np.zeros(0, dtype=np.uint64)
+        self.sums = self.numbers.sum(axis=1)
+        self.odd_counts = (self.numbers % 2).sum(axis=1)
+        self.zone_counts = np.stack(
+            [
+                ((self.numbers >= 1) & (self.numbers <= 15)).sum(axis=1),
+                ((self.numbers >= 16) & (self.numbers <= 30)).sum(axis=1),
+                ((self.numbers >= 31) & (self.numbers <= 45)).sum(axis=1),
+            ],
+            axis=1,
+        )
+        self.has_consecutive = (np.diff(self.sorted_numbers, axis=1) == 1).any(axis=1)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def line(self, index: int) -> List[int]:
+        """조합 1개 (오름차순)"""
+        return [int(n) for n in self.sorted_numbers[index]]
+
+    def scores(self, weights: Dict[int, float]) -> np.ndarray:
+        """조합별 번호 점수 합 (열 순서대로 더해 파이썬 sum과 같은 값)"""
+        w = weight_vector(weights)[self.numbers]
+        total = np.zeros(len(self.numbers), dtype=np.float64)
+        for col in range(w.shape[1]):
+            total = total + w[:, col]
+        return total
+
+    def zone_is(self, target: Sequence[int]) -> np.ndarray:
+        return (self.zone_counts == np.asarray(target)).all(axis=1)
+
+    def exact_duplicate(self, existing_masks: Iterable[int]) -> np.ndarray:
+        """기존 줄과 6개 모두 같은 조합"""
+        existing = np.fromiter((int(m) for m in existing_masks), dtype=np.uint64)
+        return np.isin(self.masks, existing)
+
+    def overlap_at_least(self, existing_masks: Iterable[int], threshold: int) -> np.ndarray:
+        """기존 줄 중 하나라도 threshold개 이상 겹치는 조합"""
+        result = np.zeros(len(self.masks), dtype=bool)
+        for mask in existing_masks:
+            result |= popcount_array(self.masks & np.uint64(mask)) >= threshold
+        return result
+
+
+def best_index(scores: np.ndarray, valid: np.ndarray, floor: float = -np.inf) -> Optional[int]:
+    """
+    유효 조합 중 최고 점수 인덱스 (동점이면 앞선 조합)
+
+    floor 이하 점수만 있으면 None (기존 루프의 best_score 초기값)
+    """
+    candidates = np.flatnonzero(valid)
+    if candidates.size == 0:
+        return None
+    pos = int(np.argmax(scores[candidates]))
+    if not scores[candidates[pos]] > floor:
+        return None
+    return int(candidates[pos])
+
+
+def ranked_indices(scores: np.ndarray, valid: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """
+    유효 조합을 점수 내림차순으로 (동점은 원래 순서)
+
+    k 지정 시 argpartition으로 상위 k개만 정렬한다.
+    k번째 점수와 같은 동점 조합도 모두 포함해 순서가 전체 정렬과 일치한다.
+    """
+    candidates = np.flatnonzero(valid)
+    values = scores[candidates]
+    if k is not None and 0 < k < candidates.size:
+        top = np.argpartition(-values, k - 1)[:k]
+        keep = np.flatnonzero(values >= values[top].min())
+        candidates, values = candidates[keep], values[keep]
+    order = np.argsort(-values, kind="stable")
+    return candidates[order]
+
+
+def iter_ranked(scores: np.ndarray, valid: np.ndarray, first_k: int = 16) -> Iterator[int]:
+    """점수 순 인덱스를 차례로 (상위 first_k개만 먼저 정렬, 더 필요하면 나머지 정렬)"""
+    top = ranked_indices(scores, valid, first_k)
+    for index in top:
+        yield int(index)
+    if top.size < int(valid.sum()):
+        rest = valid.copy()
+        rest[top] = False
+        for index in ranked_indices(scores, rest):
+            yield int(index)
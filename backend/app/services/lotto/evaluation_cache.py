@@ -0,0 +1,176 @@
+"""백테스트 평가 결과 캐시 (메모리 LRU + lotto_evaluation_cache 테이블)
+
+evaluate_single_draw()는 회차 이력, 가중치, ML 모델, 줄 생성 로직이 같으면
+(난수 시드 고정 시) 같은 결과를 낸다. 이 4가지를 키로 결과를 저장해
+grid search/백테스트/주간 재학습이 이미 계산한 칸을 다시 평가하지 않게 한다.
+"""
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from backend.app.db.models import LottoEvaluationCache
+from backend.app.db.session import SessionLocal
+from backend.app.services.lotto.generator import GENERATOR_VERSION
+
+logger = logging.getLogger(__name__)
+
+LRU_MAX_ENTRIES = 4096
+WEIGHT_KEYS = ('logic1', 'logic2', 'logic3', 'logic4')
+NO_MODEL = "none"
+
+EvalKey = Tuple[int, str, str, str]  # (draw_no, weights_hash, model_version, generator_version)
+
+_lock = threading.Lock()
+_lru: "OrderedDict[EvalKey, Dict]" = OrderedDict()
+_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stored": 0}
+
+
+def weights_hash(weights: Dict) -> str:
+    """
+    가중치 벡터 정규화 해시
+
+    logic1~4 순서로 소수 6자리 반올림(없는 로직은 0)해서
+    dict 순서나 부동소수 오차와 무관하게 같은 가중치는 같은 해시가 된다.
+    """
+    vector = [round(float(weights.get(key, 0.0)), 6) for key in WEIGHT_KEYS]
+    extra = sorted(k for k in weights if k not in WEIGHT_KEYS)
+    vector.extend(f"{k}={round(float(weights[k]), 6)}" for k in extra)
+    digest = hashlib.sha1(json.dumps(vector).encode()).hexdigest()
+    return digest[:16]
+
+
+def model_fingerprint(trainer) -> str:
+    """
+    평가 캐시용 모델 버전 (ML 5줄에 영향을 주는 특성 중요도의 해시)
+
+    grid search처럼 ai_weights만 바꿔 저장한 새 버전은 ML 줄이 같으므로
+    같은 값이 되어 기존 캐시를 그대로 쓴다. 가중치는 weights_hash로 따로 구분한다.
+    """
+    if trainer is None or trainer.model is None or trainer.feature_importance is None:
+        return NO_MODEL
+    values = [round(float(v), 10) for v in trainer.feature_importance]
+    return "fi-" + hashlib.sha1(json.dumps(values).encode()).hexdigest()[:16]
+
+
+def evaluation_key(draw_no: int, weights: Dict, trainer) -> EvalKey:
+    return (draw_no, weights_hash(weights), model_fingerprint(trainer), GENERATOR_VERSION)
+
+
+def _remember(key: EvalKey, result: Dict) -> None:
+    """LRU에 저장 (락 안에서 호출)"""
+    _lru[key] = result
+    _lru.move_to_end(key)
+    while len(_lru) > LRU_MAX_ENTRIES:
+        _lru.popitem(last=False)
+
+
+def get_cached(key: EvalKey) -> Optional[Dict]:
+    """캐시된 평가 결과 (메모리 → DB 순, 없으면 None)"""
+    with _lock:
+        result = _lru.get(key)
+        if result is not None:
+            _lru.move_to_end(key)
+            _stats["memory_hits"] += 1
+            return copy.deepcopy(result)
+
+    draw_no, w_hash, model_version, generator_version = key
+    db = SessionLocal()
+    try:
+        result = db.scalar(
+            select(LottoEvaluationCache.result).where(
+                LottoEvaluationCache.draw_no == draw_no,
+                LottoEvaluationCache.weights_hash == w_hash,
+                LottoEvaluationCache.model_version == model_version,
+                LottoEvaluationCache.generator_version == generator_version,
+            )
+        )
+    except Exception as e:
+        # 캐시 조회 실패는 평가를 막지 않는다 (다시 계산)
+        logger.warning(f"평가 캐시 조회 실패 ({draw_no}회): {e}")
+        result = None
+    finally:
+        db.close()
+
+    with _lock:
+        if result is None:
+            _stats["misses"] += 1
+            return None
+        _stats["db_hits"] += 1
+        _remember(key, result)
+    return copy.deepcopy(result)
+
+
+def store(key: EvalKey, result: Dict) -> None:
+    """평가 결과 저장 (같은 키가 이미 있으면 DB는 그대로 둔다)"""
+    result = copy.deepcopy(result)
+    with _lock:
+        _remember(key, result)
+        _stats["stored"] += 1
+
+    draw_no, w_hash, model_version, generator_version = key
+    db = SessionLocal()
+    try:
+        db.add(LottoEvaluationCache(
+            draw_no=draw_no,
+            weights_hash=w_hash,
+            model_version=model_version,
+            generator_version=generator_version,
+            result=result,
+        ))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"평가 캐시 저장 실패 ({draw_no}회): {e}")
+    finally:
+        db.close()
+
+
+def prefetch(draw_nos: Iterable[int], trainer) -> int:
+    """
+    해당 회차들의 캐시 결과를 한 번에 메모리로 로드 (grid search 시작 시)
+
+    Returns:
+        로드한 결과 수 (= 다시 계산하지 않아도 되는 칸 수)
+    """
+    draw_nos = list(draw_nos)
+    if not draw_nos:
+        return 0
+    model_version = model_fingerprint(trainer)
+
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(
+                LottoEvaluationCache.draw_no,
+                LottoEvaluationCache.weights_hash,
+                LottoEvaluationCache.result,
+            ).where(
+                LottoEvaluationCache.model_version == model_version,
+                LottoEvaluationCache.generator_version == GENERATOR_VERSION,
+                LottoEvaluationCache.draw_no.in_(draw_nos),
+            )
+        ).all()
+    except Exception as e:
+        logger.warning(f"평가 캐시 일괄 조회 실패: {e}")
+        rows = []
+    finally:
+        db.close()
+
+    with _lock:
+        for row in rows:
+            _remember((row.draw_no, row.weights_hash, model_version, GENERATOR_VERSION), row.result)
+    return len(rows)
+
+
+def cache_stats() -> Dict:
+    with _lock:
+        return {**_stats, "memory_entries": len(_lru)}
@@ -1,7 +1,15 @@
 """로또 번호 생성 (20줄) - 버그 수정 완료"""
 import random
-from typing import List, Dict, Tuple, Set
-from itertools import combinations
+from typing import List, Dict, Optional, Tuple, Set
+
+import numpy as np
+
+from backend.app.services.lotto.combo_kernel import ComboSet, best_index, iter_ranked
+from backend.app.services.lotto.line_mask import any_overlap_at_least, overlap, to_mask
+
+# 줄 생성 로직(generate_20_lines, ML 5줄 선택) 결과가 바뀌면 올린다 (평가 캐시 키)
+GENERATOR_VERSION = "1"
+
 
 def lucky_number(user_id: int, n: int = 6) -> List[int]:
     """유저ID 기반 행운 번호"""
@@ -70,10 +78,21 @@ def calculate_sum(numbers: List[int]) -> int:
 
 def is_duplicate(line1: List[int], line2: List[int], threshold: int = 5) -> bool:
     """두 조합이 중복인지 확인 (threshold개 이상 겹치면 중복)"""
-    return len(set(line1) & set(line2)) >= threshold
+    return overlap(line1, line2) >= threshold
+
+def generate_20_lines(
+    user_id: int,
+    stats: Dict,
+    ai_weights: Dict = None,
+    rng: Optional[random.Random] = None,
+) -> Dict:
+    """
+    20줄 생성 (버그 수정)
 
-def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dict:
-    """20줄 생성 (버그 수정)"""
+    rng: 줄 생성 난수 (재현이 필요하면 random.Random(seed)를 넘김).
+        전역 random 모듈은 다른 스레드와 공유되므로 시드를 걸지 않는다.
+    """
+    rng = rng or random.Random()
     most = stats['most_common']
     least = stats['least_common']
     scores1 = stats['scores_logic1']
@@ -84,9 +103,9 @@ def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dic
     # ML 가중치 우선 사용 (없으면 기본값)
     if ai_weights is None:
         try:
-            from backend.app.services.lotto.ml_trainer import LottoMLTrainer
-            trainer = LottoMLTrainer()
-            if trainer.load_model():
+            from backend.app.services.lotto.model_registry import get_trainer
+            trainer = get_trainer()
+            if trainer is not None:
                 ai_weights = trainer.get_ai_weights()
             else:
                 ai_weights = {'logic1': 0.33, 'logic2': 0.33, 'logic3': 0.34}
@@ -102,11 +121,13 @@ def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dic
         'ai_core': []
     }
     
-    all_generated = []  # 중복 체크용
+    generated_masks: Set[int] = set()  # 중복 체크용 (비트마스크)
+
+    def _register(line: List[int]) -> None:
+        generated_masks.add(to_mask(line))
 
     def _is_exact_duplicate(candidate: List[int]) -> bool:
-        cset = set(candidate)
-        return any(cset == set(existing) for existing in all_generated)
+        return to_mask(candidate) in generated_masks
 
     def _unique_line(make_line, attempts: int = 8) -> List[int]:
         last = None
@@ -126,7 +147,7 @@ def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dic
                 pool = candidates[:]
             if len(pool) < 5:
                 continue
-            line = sorted([bonus] + random.sample(pool, 5))
+            line = sorted([bonus] + rng.sample(pool, 5))
             if not _is_exact_duplicate(line):
                 return line
         return []
@@ -144,123 +165,109 @@ def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dic
     
     # ① 믹스
     line1 = set()
-    line1.add(random.choice(most))
-    line1.add(random.choice(least))
+    line1.add(rng.choice(most))
+    line1.add(rng.choice(least))
     while len(line1) < 6:
-        line1.add(random.randint(1, 45))
+        line1.add(rng.randint(1, 45))
     line1 = sorted(list(line1))
     result['basic'].append(line1)
-    all_generated.append(line1)
+    _register(line1)
     
     # ② 최다
     line2 = sorted(most[:6])
     result['basic'].append(line2)
-    all_generated.append(line2)
+    _register(line2)
     
     # ③ 최소
     line3 = sorted(least[:6])
     result['basic'].append(line3)
-    all_generated.append(line3)
+    _register(line3)
     
     # ④ 최다믹스
     line4 = set(most[:3])
-    line4.update(random.sample(range(1, 46), 2))
+    line4.update(rng.sample(range(1, 46), 2))
     line4.add(lucky_number(user_id, 1)[0])
     line4 = sorted(list(line4))[:6]
     result['basic'].append(line4)
-    all_generated.append(line4)
+    _register(line4)
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 로직1 3줄
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     top1_10 = get_top_candidates(scores1, 10)
     
-    line5 = _unique_line(lambda: select_by_odd_even_balance(random.sample(top1_10, len(top1_10)), (3, 3)))
+    line5 = _unique_line(lambda: select_by_odd_even_balance(rng.sample(top1_10, len(top1_10)), (3, 3)))
     line5 = _ensure_unique(line5, top1_10)
     result['logic1'].append(line5)
-    all_generated.append(line5)
+    _register(line5)
     
-    line6 = _unique_line(lambda: select_by_zone_balance(random.sample(top1_10, len(top1_10)), (2, 2, 2)))
+    line6 = _unique_line(lambda: select_by_zone_balance(rng.sample(top1_10, len(top1_10)), (2, 2, 2)))
     line6 = _ensure_unique(line6, top1_10)
     result['logic1'].append(line6)
-    all_generated.append(line6)
+    _register(line6)
     
-    line7 = _unique_line(lambda: sorted(random.sample(top1_10, 6)))
+    line7 = _unique_line(lambda: sorted(rng.sample(top1_10, 6)))
     line7 = _ensure_unique(line7, top1_10)
     result['logic1'].append(line7)
-    all_generated.append(line7)
+    _register(line7)
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 로직2 3줄
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     top2_15 = get_top_candidates(scores2, 15)
     
-    line8 = _unique_line(lambda: select_by_odd_even_balance(random.sample(top2_15, len(top2_15)), (3, 3)))
+    line8 = _unique_line(lambda: select_by_odd_even_balance(rng.sample(top2_15, len(top2_15)), (3, 3)))
     line8 = _ensure_unique(line8, top2_15)
     result['logic2'].append(line8)
-    all_generated.append(line8)
+    _register(line8)
     
-    line9 = _unique_line(lambda: select_by_zone_balance(random.sample(top2_15, len(top2_15)), (2, 2, 2)))
+    line9 = _unique_line(lambda: select_by_zone_balance(rng.sample(top2_15, len(top2_15)), (2, 2, 2)))
     line9 = _ensure_unique(line9, top2_15)
     result['logic2'].append(line9)
-    all_generated.append(line9)
+    _register(line9)
     
     # ⑩ 합계 최적화
-    combos = list(combinations(top2_15[:12], 6))
-    best_combo = None
-    best_score = -999
-    for combo in combos:
-        s = calculate_sum(combo)
-        if 130 <= s <= 140:
-            combo_score = sum(scores2.get(n, 0) for n in combo)
-            if combo_score > best_score and not _is_exact_duplicate(list(combo)):
-                best_score = combo_score
-                best_combo = combo
-    
-    if best_combo:
-        line10 = sorted(list(best_combo))
+    combos = ComboSet(top2_15[:12])
+    valid = (combos.sums >= 130) & (combos.sums <= 140) & ~combos.exact_duplicate(generated_masks)
+    best = best_index(combos.scores(scores2), valid, floor=-999)
+    
+    if best is not None:
+        line10 = combos.line(best)
     else:
-        line10 = _unique_line(lambda: sorted(random.sample(top2_15, 6)))
+        line10 = _unique_line(lambda: sorted(rng.sample(top2_15, 6)))
     line10 = _ensure_unique(line10, top2_15)
     
     result['logic2'].append(line10)
-    all_generated.append(line10)
+    _register(line10)
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 로직3 3줄
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     top3_15 = get_top_candidates(scores3, 15)
     
-    line11 = _unique_line(lambda: select_by_odd_even_balance(random.sample(top3_15, len(top3_15)), (3, 3)))
+    line11 = _unique_line(lambda: select_by_odd_even_balance(rng.sample(top3_15, len(top3_15)), (3, 3)))
     line11 = _ensure_unique(line11, top3_15)
     result['logic3'].append(line11)
-    all_generated.append(line11)
+    _register(line11)
     
-    line12 = _unique_line(lambda: select_by_zone_balance(random.sample(top3_15, len(top3_15)), (2, 2, 2)))
+    line12 = _unique_line(lambda: select_by_zone_balance(rng.sample(top3_15, len(top3_15)), (2, 2, 2)))
     line12 = _ensure_unique(line12, top3_15)
     result['logic3'].append(line12)
-    all_generated.append(line12)
+    _register(line12)
     
     # ⑬ 연속 최적화
-    combos = list(combinations(top3_15[:10], 6))
-    best_combo = None
-    best_score = -999
-    for combo in combos:
-        sorted_combo = sorted(combo)
-        if has_consecutive(sorted_combo):
-            combo_score = sum(scores3.get(n, 0) for n in combo)
-            if combo_score > best_score and not _is_exact_duplicate(sorted_combo):
-                best_score = combo_score
-                best_combo = sorted_combo
-    
-    if best_combo:
-        line13 = best_combo
+    combos = ComboSet(top3_15[:10])
+    valid = combos.has_consecutive & ~combos.exact_duplicate(generated_masks)
+    best = best_index(combos.scores(scores3), valid, floor=-999)
+    
+    if best is not None:
+        line13 = combos.line(best)
     else:
-        line13 = _unique_line(lambda: sorted(random.sample(top3_15, 6)))
+        line13 = _unique_line(lambda: sorted(rng.sample(top3_15, 6)))
     line13 = _ensure_unique(line13, top3_15)
     
     result['logic3'].append(line13)
-    all_generated.append(line13)
+    _register(line13)
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 종합 2줄
@@ -279,72 +286,39 @@ def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dic
     line14 = select_by_zone_balance(top_final_12, (2, 2, 2))
     line14 = _ensure_unique(line14, top_final_12)
     result['final'].append(line14)
-    all_generated.append(line14)
+    _register(line14)
     
     line15 = sorted(top_final_12[:6])
     line15 = _ensure_unique(line15, top_final_12)
     result['final'].append(line15)
-    all_generated.append(line15)
+    _register(line15)
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # AI 핵심 5줄 (다양성 보장)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
     ai_core_10 = get_top_candidates(scores_final, 10)
-    core_combos = list(combinations(ai_core_10, 6))
+    core_combos = ComboSet(ai_core_10)
     
-    # 각 조합 평가
-    scored_combos = []
-    for combo in core_combos:
-        combo_list = sorted(list(combo))
-        
-        # 기존 15줄과 중복 체크
-        is_dup = False
-        for existing in all_generated:
-            if is_duplicate(combo_list, existing, 6):  # 6개 모두 같으면
-                is_dup = True
-                break
-        
-        if is_dup:
-            continue
-        
-        # 점수 계산
-        score = sum(scores_final.get(n, 0) for n in combo)
-        
-        # 패턴 보너스
-        odd_cnt = sum(1 for n in combo if n % 2 == 1)
-        if odd_cnt == 3:
-            score += 10
-        
-        z1 = sum(1 for n in combo if 1 <= n <= 15)
-        z2 = sum(1 for n in combo if 16 <= n <= 30)
-        z3 = sum(1 for n in combo if 31 <= n <= 45)
-        if (z1, z2, z3) == (2, 2, 2):
-            score += 10
-        
-        if has_consecutive(combo_list):
-            score += 5
-        
-        s = calculate_sum(combo)
-        if 130 <= s <= 140:
-            score += 10
-        
-        scored_combos.append((combo_list, score))
+    # 각 조합 평가 (기존 15줄과 6개 모두 같은 조합 제외)
+    valid = ~core_combos.exact_duplicate(generated_masks)
+    
+    # 점수 + 패턴 보너스 (홀짝 3:3, 구간 2:2:2, 연속, 합계 130~140)
+    core_scores = core_combos.scores(scores_final)
+    core_scores = core_scores + np.where(core_combos.odd_counts == 3, 10, 0)
+    core_scores = core_scores + np.where(core_combos.zone_is((2, 2, 2)), 10, 0)
+    core_scores = core_scores + np.where(core_combos.has_consecutive, 5, 0)
+    core_scores = core_scores + np.where((core_combos.sums >= 130) & (core_combos.sums <= 140), 10, 0)
     
     # 점수 높은 5줄 선택 (다양성 체크)
-    scored_combos.sort(key=lambda x: x[1], reverse=True)
-    
-    for combo, score in scored_combos:
-        # 이미 선택된 AI 핵심 번호와도 체크
-        is_dup = False
-        for existing in result['ai_core']:
-            if is_duplicate(combo, existing, 5):  # 5개 이상 겹치면
-                is_dup = True
-                break
-        
-        if not is_dup:
+    ai_core_masks = []
+    for index in iter_ranked(core_scores, valid):
+        combo = core_combos.line(index)
+        # 이미 선택된 AI 핵심 번호와도 체크 (5개 이상 겹치면 중복)
+        if not any_overlap_at_least(to_mask(combo), ai_core_masks, 5):
             combo = _ensure_unique(combo, ai_core_10)
             result['ai_core'].append(combo)
+            ai_core_masks.append(to_mask(combo))
         
         if len(result['ai_core']) >= 5:
             break
@@ -352,7 +326,7 @@ def generate_20_lines(user_id: int, stats: Dict, ai_weights: Dict = None) -> Dic
     # 부족하면 채우기
     while len(result['ai_core']) < 5:
         # 랜덤 조합
-        random_combo = sorted(random.sample(ai_core_10, 6))
+        random_combo = sorted(rng.sample(ai_core_10, 6))
         result['ai_core'].append(random_combo)
     
     return result
@@ -5,7 +5,9 @@ from typing import Dict, List, Tuple
 from backend.app.db.session import SessionLocal
 from backend.app.db.models import LottoDraw, LottoMLPerformance
 from backend.app.services.lotto.performance_evaluator import evaluate_single_draw, save_performance_to_db
+from backend.app.services.lotto.evaluation_cache import prefetch
 from backend.app.services.lotto.ml_trainer import LottoMLTrainer
+from backend.app.services.lotto.model_registry import current_version, get_trainer
 import json
 
 
@@ -56,6 +58,14 @@ def grid_search_weights(
         print("⚠️ 유효한 가중치 조합이 없습니다.")
         return None, 0, []
 
+    # 탐색 도중 재학습이 일어나도 모든 조합을 같은 모델 버전으로 평가
+    model_version = current_version()
+
+    # 이전 탐색에서 평가한 (회차, 가중치) 칸은 캐시에서 재사용 → 새 칸만 계산
+    cached_cells = prefetch(test_draws, get_trainer(model_version))
+    print(f"♻️ 캐시된 평가: {cached_cells}칸 / 전체 {len(all_combinations) * len(test_draws)}칸")
+    print()
+
     # 각 조합 테스트
     results = []
 
@@ -67,7 +77,7 @@ def grid_search_weights(
         # 각 회차에 대해 평가
         draw_scores = []
         for draw_no in test_draws:
-            evaluation_result = evaluate_single_draw(draw_no, ai_weights=weights)
+            evaluation_result = evaluate_single_draw(draw_no, ai_weights=weights, model_version=model_version)
             if evaluation_result:
                 draw_scores.append(evaluation_result['performance_score'])
 
@@ -148,7 +158,12 @@ def retrain_with_grid_search(
 
         # 3. 모델에 저장
         if save_to_model:
+            # 현재 모델/특성 중요도는 유지하고 가중치만 교체해 새 버전으로 저장
             trainer = LottoMLTrainer()
+            current = get_trainer()
+            if current is not None:
+                trainer.model = current.model
+                trainer.feature_importance = current.feature_importance
             trainer.ai_weights = best_weights
 
             if trainer.save_model():
@@ -0,0 +1,99 @@
+"""로또 조합 비트마스크 표현
+
+번호 n(1~45)을 bit n으로 두어 한 줄(6개 번호)을 정수 1개로 다룬다.
+- 겹치는 개수: popcount(a & b)
+- 완전 중복: a == b
+- 여러 줄 일괄 처리: uint64 NumPy 배열
+"""
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+MAX_NUMBER = 45
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python 3.9 이하
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+# numpy 2.0 미만 대비 바이트 단위 popcount 테이블
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class LineMask(int):
+    """한 줄을 표현하는 45비트 마스크 (int 하위 클래스라 set/dict 키, 비트 연산 그대로 사용)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_numbers(cls, numbers: Iterable[int]) -> "LineMask":
+        mask = 0
+        for n in numbers:
+            mask |= 1 << int(n)
+        return cls(mask)
+
+    def numbers(self) -> List[int]:
+        """오름차순 번호 목록"""
+        return [n for n in range(1, MAX_NUMBER + 1) if self >> n & 1]
+
+    def overlap(self, other: int) -> int:
+        """겹치는 번호 개수"""
+        return _popcount(self & other)
+
+
+def to_mask(numbers: Iterable[int]) -> LineMask:
+    return LineMask.from_numbers(numbers)
+
+
+def overlap(line1: Iterable[int], line2: Iterable[int]) -> int:
+    """두 줄(번호 목록 또는 마스크)의 겹치는 번호 개수"""
+    a = line1 if isinstance(line1, int) else to_mask(line1)
+    b = line2 if isinstance(line2, int) else to_mask(line2)
+    return _popcount(a & b)
+
+
+def masks_array(lines: Iterable) -> np.ndarray:
+    """여러 줄 → uint64 마스크 배열"""
+    return np.fromiter(
+        (line if isinstance(line, int) else to_mask(line) for line in lines),
+        dtype=np.uint64,
+    )
+
+
+def popcount_array(values: np.ndarray) -> np.ndarray:
+    """uint64 배열의 원소별 popcount"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    as_bytes = np.ascontiguousarray(values, dtype=np.uint64).view(np.uint8).reshape(-1, 8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=1, dtype=np.int64)
+
+
+def overlap_many(mask: int, masks: np.ndarray) -> np.ndarray:
+    """마스크 1개와 마스크 배열의 원소별 겹치는 개수"""
+    return popcount_array(masks & np.uint64(mask))
+
+
+def any_overlap_at_least(mask: int, masks: Iterable[int], threshold: int) -> bool:
+    """threshold개 이상 겹치는 줄이 하나라도 있는지"""
+    return any(_popcount(mask & other) >= threshold for other in masks)
+
+
+def tally_matches(lines: Iterable, winning_numbers: Iterable[int]) -> Dict[str, int]:
+    """
+    당첨 번호 대비 줄별 일치 개수 집계
+
+    Returns:
+        {'match_3', 'match_4', 'match_5', 'match_6', 'total_matches', 'line_count'}
+    """
+    masks = masks_array(lines)
+    counts = overlap_many(to_mask(winning_numbers), masks)
+    hist = np.bincount(counts, minlength=7) if counts.size else np.zeros(7, dtype=np.int64)
+    return {
+        'match_3': int(hist[3]),
+        'match_4': int(hist[4]),
+        'match_5': int(hist[5]),
+        'match_6': int(hist[6]),
+        'total_matches': int(counts.sum()),
+        'line_count': int(counts.size),
+    }
@@ -0,0 +1,133 @@
+"""추천 줄 점수 계산/선택 (배열 연산)
+
+- 로직별 점수 dict → (4 × 46) 점수 행렬 (열 = 번호, 0번 열은 0) - 통계 스냅샷마다 1회
+- 번호별 가중 점수: 가중치 벡터 · 점수 행렬
+- 줄 점수: (줄 수 × 6) 번호 인덱스로 gather 후 합
+- 선택: 점수 순위(동점은 원래 순서) + 비트마스크 중복 필터
+"""
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.app.services.lotto.combo_kernel import weight_vector
+from backend.app.services.lotto.line_mask import MAX_NUMBER, popcount_array
+
+LINE_SIZE = 6
+LOGIC_KEYS = ('logic1', 'logic2', 'logic3', 'logic4')
+DEFAULT_LOGIC_WEIGHT = 0.25
+DIVERSITY_THRESHOLD = 5  # 이미 고른 줄과 5개 이상 겹치면 뒤로 미룸 (generator.is_duplicate와 같은 기준)
+
+# 번호 → 비트 (채움용 0번은 비트 없음)
+_BITS = np.array([0] + [1 << n for n in range(1, MAX_NUMBER + 1)], dtype=np.uint64)
+
+
+def logic_score_matrix(logic_scores: Sequence[Dict[int, float]]) -> np.ndarray:
+    """로직1~4 점수 dict → (4 × 46) 행렬"""
+    matrix = np.stack([weight_vector(scores) for scores in logic_scores])
+    matrix.setflags(write=False)
+    return matrix
+
+
+def number_scores(ai_weights: Dict, matrix: np.ndarray) -> np.ndarray:
+    """번호별 가중 점수 배열 (인덱스 = 번호)"""
+    total = np.zeros(matrix.shape[1], dtype=np.float64)
+    for row, key in enumerate(LOGIC_KEYS[:len(matrix)]):
+        # 로직 순서대로 누적 (기존 번호별 합산과 같은 연산 순서 → 같은 값)
+        total = total + matrix[row] * ai_weights.get(key, DEFAULT_LOGIC_WEIGHT)
+    return total
+
+
+def line_index_array(lines: Sequence[Sequence[int]]) -> np.ndarray:
+    """(줄 수 × 6) 번호 배열 (6개 미만인 줄은 점수 0인 0번으로 채움)"""
+    if all(len(line) == LINE_SIZE for line in lines):
+        return np.array(lines, dtype=np.intp).reshape(len(lines), LINE_SIZE)
+    index = np.zeros((len(lines), LINE_SIZE), dtype=np.intp)
+    for i, line in enumerate(lines):
+        index[i, :len(line)] = line
+    return index
+
+
+def gather_scores(index: np.ndarray, per_number: np.ndarray) -> np.ndarray:
+    """(줄 수 × 6) 번호 배열의 줄별 점수 (줄 안의 번호 순서대로 합산)"""
+    gathered = per_number[index]
+    total = gathered[:, 0].copy()
+    for col in range(1, LINE_SIZE):
+        total += gathered[:, col]
+    return total
+
+
+def line_scores(lines: Sequence[Sequence[int]], per_number: np.ndarray) -> np.ndarray:
+    """줄별 점수"""
+    return gather_scores(line_index_array(lines), per_number)
+
+
+def line_masks(index: np.ndarray) -> np.ndarray:
+    """(줄 수 × 6) 번호 배열 → uint64 마스크 배열"""
+    return np.bitwise_or.reduce(_BITS[index], axis=1)
+
+
+def pick_diverse(order: Sequence[int], masks: np.ndarray, count: int,
+                 threshold: int = DIVERSITY_THRESHOLD) -> List[int]:
+    """
+    order 순서대로 count개 선택 (이미 고른 줄과 threshold개 이상 겹치는 줄은 건너뜀)
+
+    줄 쌍별 겹침 행렬을 한 번에 계산하고, 고른 줄과 가까운 줄을 차단 벡터로 표시한다.
+    건너뛴 줄은 개수가 모자랄 때 원래 순서대로 채운다.
+    """
+    n = len(masks)
+    near = popcount_array(masks[:, None] & masks[None, :]).reshape(n, n) >= threshold
+    blocked = np.zeros(n, dtype=bool)
+    chosen: List[int] = []
+    skipped: List[int] = []
+    for index in order:
+        if len(chosen) == count:
+            break
+        if blocked[index]:
+            skipped.append(index)
+            continue
+        chosen.append(index)
+        blocked |= near[index]
+    chosen.extend(skipped[:count - len(chosen)])
+    return chosen
+
+
+def rank_and_select(lines: Sequence[Tuple[str, List[int], str]], count: int, ai_weights: Dict,
+                    logic_scores: Sequence[Dict[int, float]],
+                    matrix: Optional[np.ndarray] = None) -> Tuple[list, str, list]:
+    """
+    줄 점수 계산 + 하이브리드 선택
+
+    - 5줄, 10줄: 랜덤 순서에서 선택 (다양성)
+    - 15줄 이상: 점수 순위 상위 선택
+
+    Args:
+        matrix: 미리 만든 logic_score_matrix (없으면 logic_scores로 생성)
+
+    Returns:
+        (선택된 줄, 선택 방식, 전체 점수순 줄) - 줄은 (name, numbers, logic, score)
+    """
+    if matrix is None:
+        matrix = logic_score_matrix(logic_scores)
+    index = line_index_array([line[1] for line in lines])
+    score_array = gather_scores(index, number_scores(ai_weights, matrix))
+    ranked = np.argsort(-score_array, kind="stable").tolist()  # 동점은 원래 순서
+    scores = score_array.tolist()
+    masks = line_masks(index)
+
+    if count in (5, 10):
+        order = random.sample(range(len(lines)), len(lines))
+        selection_method = "랜덤"
+    else:
+        order = ranked
+        selection_method = "랭킹순"
+
+    chosen = pick_diverse(order, masks, count)
+    # 표시용으로 점수 내림차순 재정렬
+    chosen.sort(key=lambda i: scores[i], reverse=True)
+
+    def as_tuple(i: int) -> tuple:
+        name, nums, logic = lines[i][:3]
+        return (name, nums, logic, scores[i])
+
+    return [as_tuple(i) for i in chosen], selection_method, [as_tuple(i) for i in ranked]
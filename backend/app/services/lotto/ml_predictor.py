@@ -1,15 +1,19 @@
 """XGBoost 기반 로또 번호 예측 및 5줄 생성"""
 import random
-from typing import List, Dict, Tuple
-from itertools import combinations
+from typing import List, Dict, Optional, Tuple
 from backend.app.services.lotto.ml_trainer import LottoMLTrainer
+from backend.app.services.lotto.model_registry import get_trainer
+from backend.app.services.lotto.combo_kernel import ComboSet, best_index
+from backend.app.services.lotto.line_mask import any_overlap_at_least, to_mask
 
 
 class LottoMLPredictor:
     """ML 기반 로또 번호 예측"""
 
-    def __init__(self, trainer: LottoMLTrainer = None):
-        self.trainer = trainer or LottoMLTrainer()
+    def __init__(self, trainer: LottoMLTrainer = None, rng: Optional[random.Random] = None):
+        self.trainer = trainer or get_trainer() or LottoMLTrainer()
+        # 패턴 줄 선택 난수 (전역 random 대신 인스턴스별)
+        self.rng = rng or random.Random()
 
     def generate_ml_5_lines(
         self,
@@ -57,8 +61,8 @@ class LottoMLPredictor:
             ]
 
         result = []
-        # 중복 방지: 기존 20줄 + ML 내부 생성 줄
-        all_generated = existing_20_lines.copy() if existing_20_lines else []
+        # 중복 방지: 기존 20줄 + ML 내부 생성 줄 (비트마스크)
+        existing_masks = [to_mask(line) for line in existing_20_lines] if existing_20_lines else []
 
         for pattern in user_patterns[:5]:
             line = self._generate_line_by_pattern(
@@ -66,10 +70,10 @@ class LottoMLPredictor:
                 probabilities,
                 top_15,
                 top_20,
-                all_generated
+                existing_masks
             )
             result.append(line)
-            all_generated.append(line)
+            existing_masks.append(to_mask(line))
 
         return result
 
@@ -79,7 +83,7 @@ class LottoMLPredictor:
         probabilities: Dict[int, float],
         top_15: List[int],
         top_20: List[int],
-        existing_lines: List[List[int]]
+        existing_lines: List[int]
     ) -> List[int]:
         """패턴에 따라 1줄 생성"""
         pattern_type = pattern['type']
@@ -113,7 +117,7 @@ class LottoMLPredictor:
             # 기본값: 확률 상위
             return self._select_top_probability(probabilities, existing_lines)
 
-    def _select_top_probability(self, probabilities: Dict[int, float], existing: List[List[int]]) -> List[int]:
+    def _select_top_probability(self, probabilities: Dict[int, float], existing: List[int]) -> List[int]:
         """확률 상위 6개 선택"""
         sorted_numbers = sorted(probabilities.items(), key=lambda x: x[1], reverse=True)
 
@@ -127,7 +131,7 @@ class LottoMLPredictor:
         # 최악의 경우 상위 6개
         return sorted([num for num, _ in sorted_numbers[:6]])
 
-    def _select_balanced_zones(self, candidates: List[int], zones: Tuple[int, int, int], existing: List[List[int]]) -> List[int]:
+    def _select_balanced_zones(self, candidates: List[int], zones: Tuple[int, int, int], existing: List[int]) -> List[int]:
         """구간 밸런스 선택"""
         z1_cnt, z2_cnt, z3_cnt = zones
 
@@ -137,13 +141,13 @@ class LottoMLPredictor:
 
         for _ in range(10):  # 10번 시도
             selected = []
-            selected.extend(random.sample(z1, min(z1_cnt, len(z1))))
-            selected.extend(random.sample(z2, min(z2_cnt, len(z2))))
-            selected.extend(random.sample(z3, min(z3_cnt, len(z3))))
+            selected.extend(self.rng.sample(z1, min(z1_cnt, len(z1))))
+            selected.extend(self.rng.sample(z2, min(z2_cnt, len(z2))))
+            selected.extend(self.rng.sample(z3, min(z3_cnt, len(z3))))
 
             # 부족하면 채우기
             while len(selected) < 6:
-                selected.append(random.choice(candidates))
+                selected.append(self.rng.choice(candidates))
 
             line = sorted(list(set(selected)))[:6]
 
@@ -152,7 +156,7 @@ class LottoMLPredictor:
 
         return sorted(candidates[:6])
 
-    def _select_odd_even_balanced(self, candidates: List[int], ratio: Tuple[int, int], existing: List[List[int]]) -> List[int]:
+    def _select_odd_even_balanced(self, candidates: List[int], ratio: Tuple[int, int], existing: List[int]) -> List[int]:
         """홀짝 밸런스 선택"""
         odd_cnt, even_cnt = ratio
 
@@ -161,11 +165,11 @@ class LottoMLPredictor:
 
         for _ in range(10):
             selected = []
-            selected.extend(random.sample(odds, min(odd_cnt, len(odds))))
-            selected.extend(random.sample(evens, min(even_cnt, len(evens))))
+            selected.extend(self.rng.sample(odds, min(odd_cnt, len(odds))))
+            selected.extend(self.rng.sample(evens, min(even_cnt, len(evens))))
 
             while len(selected) < 6:
-                selected.append(random.choice(candidates))
+                selected.append(self.rng.choice(candidates))
 
             line = sorted(list(set(selected)))[:6]
 
@@ -174,60 +178,28 @@ class LottoMLPredictor:
 
         return sorted(candidates[:6])
 
-    def _select_consecutive_optimal(self, candidates: List[int], probabilities: Dict[int, float], existing: List[List[int]]) -> List[int]:
+    def _select_consecutive_optimal(self, candidates: List[int], probabilities: Dict[int, float], existing: List[int]) -> List[int]:
         """연속 번호 최적화"""
-        combos = list(combinations(candidates[:12], 6))
+        combos = ComboSet(candidates[:12])
 
-        best_combo = None
-        best_score = -1
+        # 연속 번호가 있고 기존 줄과 5개 이상 겹치지 않는 조합 중 확률 점수 최고
+        valid = combos.has_consecutive & ~combos.overlap_at_least(existing, 5)
+        best = best_index(combos.scores(probabilities), valid, floor=-1)
 
-        for combo in combos:
-            sorted_combo = sorted(combo)
+        return combos.line(best) if best is not None else sorted(candidates[:6])
 
-            # 연속 번호가 있는지 확인
-            has_consecutive = any(
-                sorted_combo[i+1] - sorted_combo[i] == 1
-                for i in range(len(sorted_combo) - 1)
-            )
-
-            if not has_consecutive:
-                continue
-
-            # 확률 점수 계산
-            score = sum(probabilities.get(n, 0) for n in combo)
-
-            if score > best_score and not self._is_duplicate(sorted_combo, existing):
-                best_score = score
-                best_combo = sorted_combo
-
-        return best_combo if best_combo else sorted(candidates[:6])
-
-    def _select_sum_range(self, candidates: List[int], probabilities: Dict[int, float], min_sum: int, max_sum: int, existing: List[List[int]]) -> List[int]:
+    def _select_sum_range(self, candidates: List[int], probabilities: Dict[int, float], min_sum: int, max_sum: int, existing: List[int]) -> List[int]:
         """합계 범위 선택"""
-        combos = list(combinations(candidates[:15], 6))
-
-        best_combo = None
-        best_score = -1
-
-        for combo in combos:
-            total = sum(combo)
-
-            if not (min_sum <= total <= max_sum):
-                continue
-
-            score = sum(probabilities.get(n, 0) for n in combo)
-            sorted_combo = sorted(combo)
+        combos = ComboSet(candidates[:15])
 
-            if score > best_score and not self._is_duplicate(sorted_combo, existing):
-                best_score = score
-                best_combo = sorted_combo
+        valid = (combos.sums >= min_sum) & (combos.sums <= max_sum) & ~combos.overlap_at_least(existing, 5)
+        best = best_index(combos.scores(probabilities), valid, floor=-1)
 
-        return best_combo if best_combo else sorted(candidates[:6])
+        return combos.line(best) if best is not None else sorted(candidates[:6])
 
-    def _is_duplicate(self, line: List[int], existing_lines: List[List[int]], threshold: int = 5) -> bool:
-        """중복 확인 (threshold개 이상 겹치면 중복)"""
-        line_set = set(line)
-        return any(len(line_set & set(existing)) >= threshold for existing in existing_lines)
+    def _is_duplicate(self, line: List[int], existing_masks: List[int], threshold: int = 5) -> bool:
+        """중복 확인 (threshold개 이상 겹치면 중복, 기존 줄은 비트마스크)"""
+        return any_overlap_at_least(to_mask(line), existing_masks, threshold)
 
     def get_ml_scores_for_display(self, draws: List[Dict]) -> Dict:
         """
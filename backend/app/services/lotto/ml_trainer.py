@@ -1,20 +1,28 @@
 """통계 기반 로또 ML 학습 모듈 (XGBoost 대체)"""
+import os
 import pickle
+import tempfile
+from datetime import datetime
 from pathlib import Path
 from collections import defaultdict, Counter
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
 
 
+DEFAULT_MODEL_PATH = str(Path(__file__).parent / "lotto_ml_model.pkl")
+MODEL_VERSIONS_KEEP = 5  # 보관할 이전 버전 수
+
+
 class LottoMLTrainer:
     """로또 ML 모델 학습"""
 
     def __init__(self, model_path: str = None):
-        self.model_path = model_path or str(Path(__file__).parent / "lotto_ml_model.pkl")
+        self.model_path = model_path or DEFAULT_MODEL_PATH
         self.model = None
         self.feature_importance = None
         self.ai_weights = {'logic1': 0.33, 'logic2': 0.33, 'logic3': 0.34}
+        self.version: Optional[str] = None
 
     def extract_features(self, draws: List[Dict], target_draw_no: int, number: int) -> List[float]:
         """
@@ -364,18 +372,72 @@ class LottoMLTrainer:
 
         return predictions
 
-    def save_model(self):
-        """모델 저장"""
+    @staticmethod
+    def versions_dir(model_path: str) -> Path:
+        """이전 버전 보관 디렉터리 (lotto_ml_model_versions/)"""
+        path = Path(model_path)
+        return path.parent / f"{path.stem}_versions"
+
+    def save_model(self) -> bool:
+        """
+        모델 저장 (새 버전 부여)
+
+        임시 파일에 쓴 뒤 os.replace로 교체해 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 하고,
+        버전별 사본을 남겨 평가에서 특정 버전을 고정할 수 있게 한다.
+        """
+        self.version = datetime.now().strftime("%Y%m%d%H%M%S%f")
         model_data = {
             'model': self.model,
             'feature_importance': self.feature_importance,
-            'ai_weights': self.ai_weights
+            'ai_weights': self.ai_weights,
+            'version': self.version,
         }
+        payload = pickle.dumps(model_data)
 
-        with open(self.model_path, 'wb') as f:
-            pickle.dump(model_data, f)
+        model_dir = os.path.dirname(os.path.abspath(self.model_path))
+        fd, tmp_path = tempfile.mkstemp(dir=model_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.model_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
-        print(f"\n💾 모델 저장 완료: {self.model_path}")
+        try:
+            versions_dir = self.versions_dir(self.model_path)
+            versions_dir.mkdir(exist_ok=True)
+            (versions_dir / f"{self.version}.pkl").write_bytes(payload)
+            for old in sorted(versions_dir.glob("*.pkl"))[:-MODEL_VERSIONS_KEEP]:
+                old.unlink()
+        except OSError as e:
+            print(f"⚠️ 모델 버전 사본 저장 실패: {e}")
+
+        # 같은 프로세스의 레지스트리는 파일 재확인 없이 즉시 교체
+        from backend.app.services.lotto.model_registry import publish
+        publish(self)
+
+        print(f"\n💾 모델 저장 완료: {self.model_path} (v{self.version})")
+        return True
+
+    def _apply_model_data(self, model_data: Dict) -> None:
+        self.model = model_data['model']
+        self.feature_importance = model_data['feature_importance']
+        self.ai_weights = model_data['ai_weights']
+        self.version = model_data.get('version')
+
+    @classmethod
+    def from_file(cls, path: str, model_path: str = None) -> Optional["LottoMLTrainer"]:
+        """pickle 파일에서 모델 로드 (출력 없음, 파일 없으면 None)"""
+        try:
+            with open(path, 'rb') as f:
+                model_data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        trainer = cls(model_path or path)
+        trainer._apply_model_data(model_data)
+        return trainer
 
     def load_model(self):
         """모델 로드"""
@@ -383,9 +445,7 @@ class LottoMLTrainer:
             with open(self.model_path, 'rb') as f:
                 model_data = pickle.load(f)
 
-            self.model = model_data['model']
-            self.feature_importance = model_data['feature_importance']
-            self.ai_weights = model_data['ai_weights']
+            self._apply_model_data(model_data)
 
             print(f"✅ 모델 로드 완료: {self.model_path}")
             return True
@@ -0,0 +1,142 @@
+"""로또 ML 모델 레지스트리 (프로세스 전역, 1회 로드 후 재사용)
+
+- get_trainer(): 모델 파일의 mtime/크기가 바뀌었을 때만 다시 unpickle
+- publish(): 같은 프로세스에서 재학습/저장하면 즉시 새 버전으로 교체
+- 최근 버전 몇 개를 메모리에 남겨 평가 도중 재학습이 일어나도 같은 버전으로 계속 평가
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from backend.app.services.lotto.ml_trainer import (
+    DEFAULT_MODEL_PATH,
+    MODEL_VERSIONS_KEEP,
+    LottoMLTrainer,
+)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_current: Optional[LottoMLTrainer] = None
+_current_stamp: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size)
+_versions: "OrderedDict[str, LottoMLTrainer]" = OrderedDict()
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _remember(trainer: LottoMLTrainer) -> None:
+    """버전 보관 (락 안에서 호출)"""
+    _versions[trainer.version] = trainer
+    _versions.move_to_end(trainer.version)
+    while len(_versions) > MODEL_VERSIONS_KEEP:
+        _versions.popitem(last=False)
+
+
+def _load_current(stamp: Tuple[int, int]) -> Optional[LottoMLTrainer]:
+    trainer = LottoMLTrainer.from_file(DEFAULT_MODEL_PATH)
+    if trainer is None:
+        return None
+    if trainer.version is None:
+        # 버전 정보가 없는 이전 형식 pickle
+        trainer.version = f"mtime-{stamp[0] // 1_000_000_000}"
+    return trainer
+
+
+def get_trainer(version: Optional[str] = None) -> Optional[LottoMLTrainer]:
+    """
+    학습된 모델 (모델 파일이 없으면 None)
+
+    Args:
+        version: 지정 시 해당 버전 (메모리에 없으면 버전 사본 파일에서 로드)
+
+    반환된 객체는 여러 요청이 공유하므로 읽기 전용으로 사용한다.
+    """
+    if version is not None:
+        return get_version(version)
+
+    global _current, _current_stamp
+    stamp = _file_stamp(DEFAULT_MODEL_PATH)
+    with _lock:
+        if stamp is None:
+            return _current
+        if _current is not None and stamp == _current_stamp:
+            return _current
+
+        trainer = _load_current(stamp)
+        if trainer is None:
+            return _current
+        _current, _current_stamp = trainer, stamp
+        _remember(trainer)
+        logger.info(f"ML 모델 로드: v{trainer.version}")
+        return trainer
+
+
+def get_version(version: str) -> Optional[LottoMLTrainer]:
+    """특정 버전 모델 (메모리 → 버전 사본 파일 순으로 조회)"""
+    with _lock:
+        trainer = _versions.get(version)
+        if trainer is not None:
+            return trainer
+
+    path = LottoMLTrainer.versions_dir(DEFAULT_MODEL_PATH) / f"{version}.pkl"
+    trainer = LottoMLTrainer.from_file(str(path), model_path=DEFAULT_MODEL_PATH)
+    if trainer is None:
+        logger.warning(f"ML 모델 버전 없음: v{version}")
+        return None
+    with _lock:
+        _remember(trainer)
+    return trainer
+
+
+def current_version() -> Optional[str]:
+    trainer = get_trainer()
+    return trainer.version if trainer else None
+
+
+def publish(trainer: LottoMLTrainer) -> None:
+    """저장 직후 호출 - 기본 경로 모델이면 현재 모델을 새 버전으로 교체"""
+    if trainer.version is None:
+        return
+    if os.path.abspath(trainer.model_path) != os.path.abspath(DEFAULT_MODEL_PATH):
+        return
+
+    global _current, _current_stamp
+    snapshot = LottoMLTrainer(DEFAULT_MODEL_PATH)
+    snapshot.model = trainer.model
+    snapshot.feature_importance = trainer.feature_importance
+    snapshot.ai_weights = dict(trainer.ai_weights)
+    snapshot.version = trainer.version
+
+    stamp = _file_stamp(DEFAULT_MODEL_PATH)
+    with _lock:
+        _current, _current_stamp = snapshot, stamp
+        _remember(snapshot)
+    logger.info(f"ML 모델 교체: v{snapshot.version}")
+
+
+def list_versions() -> List[Dict]:
+    """메모리/디스크에 있는 모델 버전 목록 (오래된 순)"""
+    current = current_version()
+    on_disk = {
+        p.stem for p in Path(LottoMLTrainer.versions_dir(DEFAULT_MODEL_PATH)).glob("*.pkl")
+    }
+    with _lock:
+        in_memory = set(_versions)
+    return [
+        {
+            "version": v,
+            "current": v == current,
+            "loaded": v in in_memory,
+            "archived": v in on_disk,
+        }
+        for v in sorted(in_memory | on_disk)
+    ]
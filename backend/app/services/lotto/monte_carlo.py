@@ -0,0 +1,334 @@
+"""로또 전략 Monte Carlo 시뮬레이터
+
+실제 회차 백테스트(performance_evaluator)는 표본이 수백 회차뿐이라
+"무작위로 산 표보다 나은가"를 판단할 수 없다. 여기서는
+- 균등 무작위 추첨(합성 회차)을 대량으로 만들어 각 전략 줄의 일치 분포를 구하고
+- 무작위 표 × 무작위 추첨 기준선, 초기하분포 이론값과 비교해 95% 신뢰구간을 보고한다.
+
+모든 표/추첨은 45비트 마스크(line_mask)로 다루고 일치 개수는 popcount로 계산한다.
+"""
+import logging
+import math
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from backend.app.db.session import SessionLocal
+from backend.app.utils.background_job import BackgroundJob
+from backend.app.services.lotto.line_mask import MAX_NUMBER, masks_array, popcount_array
+
+logger = logging.getLogger(__name__)
+
+LINE_SIZE = 6
+MATCH_LEVELS = LINE_SIZE + 1       # 0~6개 일치
+Z_95 = 1.959963984540054
+
+DEFAULT_SYNTHETIC_DRAWS = 400_000          # 25줄 × 40만 회 = 10^7 평가
+DEFAULT_BASELINE_EVALUATIONS = 10_000_000  # 무작위 표 평가 수
+DEFAULT_CHUNK_SIZE = 250_000  # 청크당 임시 배열 (512MB 인스턴스에서 최대 수십 MB 이내)
+
+# 마지막 시뮬레이션 결과 (관리자 API가 백그라운드 실행 후 조회)
+SIMULATION_REPORT_PATH = Path("logs") / "lotto_simulation.json"
+
+STRATEGY_GROUPS = ('basic', 'logic1', 'logic2', 'logic3', 'final', 'ai_core')
+
+# 텔레그램 핸들러/성능 평가와 같은 ML 5줄 패턴
+ML_USER_PATTERNS = [
+    {'type': 'top_probability', 'params': {}},
+    {'type': 'balanced_zones', 'params': {'zones': (2, 2, 2)}},
+    {'type': 'odd_even_balanced', 'params': {'ratio': (3, 3)}},
+    {'type': 'consecutive_optimal', 'params': {}},
+    {'type': 'sum_range', 'params': {'min': 130, 'max': 140}},
+]
+
+# 마지막 시뮬레이션 상태 (SIMULATION_REPORT_PATH에 체크포인트)
+_job = BackgroundJob(SIMULATION_REPORT_PATH, "시뮬레이션")
+
+_BITS = np.left_shift(np.uint64(1), np.arange(MAX_NUMBER + 1, dtype=np.uint64))
+
+
+def random_masks(rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    균등 무작위 6개 조합 n개 (uint64 마스크)
+
+    1~45에서 6개를 뽑아 OR한 뒤 중복 번호가 있는 행(popcount < 6)만 다시 뽑는다.
+    """
+    out = np.empty(n, dtype=np.uint64)
+    pending = np.arange(n)
+    while pending.size:
+        picks = rng.integers(1, MAX_NUMBER + 1, size=(pending.size, LINE_SIZE), dtype=np.intp)
+        masks = np.bitwise_or.reduce(_BITS[picks], axis=1)
+        ok = popcount_array(masks) == LINE_SIZE
+        out[pending[ok]] = masks[ok]
+        pending = pending[~ok]
+    return out
+
+
+def hypergeometric_pmf() -> List[float]:
+    """표 1장이 균등 추첨과 k개 일치할 확률 (k=0~6)"""
+    total = math.comb(MAX_NUMBER, LINE_SIZE)
+    return [
+        math.comb(LINE_SIZE, k) * math.comb(MAX_NUMBER - LINE_SIZE, LINE_SIZE - k) / total
+        for k in range(MATCH_LEVELS)
+    ]
+
+
+def _wilson(successes: float, n: int) -> List[float]:
+    """이항 비율 95% Wilson 구간"""
+    if n == 0:
+        return [0.0, 0.0]
+    p = successes / n
+    denom = 1 + Z_95 ** 2 / n
+    center = (p + Z_95 ** 2 / (2 * n)) / denom
+    half = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 ** 2 / (4 * n * n)) / denom
+    return [max(0.0, center - half), min(1.0, center + half)]
+
+
+def _distribution(hist: np.ndarray) -> Dict[str, float]:
+    total = hist.sum()
+    return {str(k): (float(hist[k] / total) if total else 0.0) for k in range(MATCH_LEVELS)}
+
+
+class _Accumulator:
+    """청크별 합/제곱합 누적 (평균과 표준오차 계산용)"""
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, values: np.ndarray) -> None:
+        values = values.astype(np.float64)
+        self.n += values.size
+        self.total += float(values.sum())
+        self.total_sq += float(np.square(values).sum())
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n if self.n else 0.0
+
+    @property
+    def stderr(self) -> float:
+        if self.n < 2:
+            return 0.0
+        var = (self.total_sq - self.n * self.mean ** 2) / (self.n - 1)
+        return math.sqrt(max(var, 0.0) / self.n)
+
+
+def _mean_ci(acc: _Accumulator, scale: float = 1.0) -> Dict:
+    mean = acc.mean / scale
+    half = Z_95 * acc.stderr / scale
+    return {'mean': mean, 'ci95': [mean - half, mean + half], 'stderr': acc.stderr / scale}
+
+
+def simulate_strategies(
+    strategies: Dict[str, List[List[int]]],
+    n_draws: int = DEFAULT_SYNTHETIC_DRAWS,
+    baseline_evaluations: int = DEFAULT_BASELINE_EVALUATIONS,
+    seed: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict:
+    """
+    전략별 고정 줄을 합성 회차 n_draws개에 대해 평가하고 무작위 기준선과 비교
+
+    Args:
+        strategies: {전략명: [[번호 6개], ...]}
+        n_draws: 합성 회차 수 (전략 평가 수 = 줄 수 × n_draws)
+        baseline_evaluations: 무작위 표 × 무작위 추첨 평가 수
+        seed: 난수 시드 (같은 시드면 같은 결과)
+
+    신뢰구간 단위는 회차다. 같은 회차에 대한 여러 줄의 결과는 독립이 아니므로
+    회차별 줄 평균을 표본으로 보고 평균/3개 이상 비율의 표준오차를 구한다.
+    """
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+
+    groups = {
+        name: masks_array(lines)
+        for name, lines in strategies.items()
+        if lines
+    }
+    hists = {name: np.zeros(MATCH_LEVELS, dtype=np.int64) for name in groups}
+    mean_acc = {name: _Accumulator() for name in groups}
+    hit_acc = {name: _Accumulator() for name in groups}
+
+    # 1. 전략 줄 × 합성 회차
+    remaining = n_draws
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        remaining -= size
+        draws = random_masks(rng, size)
+        for name, line_masks in groups.items():
+            # (줄 수, 회차 수) 일치 개수 행렬
+            counts = popcount_array(draws[None, :] & line_masks[:, None]).reshape(len(line_masks), size)
+            hists[name] += np.bincount(counts.ravel(), minlength=MATCH_LEVELS)
+            mean_acc[name].add(counts.sum(axis=0))
+            hit_acc[name].add((counts >= 3).sum(axis=0))
+
+    # 2. 무작위 표 × 무작위 추첨 기준선
+    base_hist = np.zeros(MATCH_LEVELS, dtype=np.int64)
+    base_acc = _Accumulator()
+    remaining = baseline_evaluations
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        remaining -= size
+        counts = popcount_array(random_masks(rng, size) & random_masks(rng, size))
+        base_hist += np.bincount(counts, minlength=MATCH_LEVELS)
+        base_acc.add(counts)
+
+    base_hits = int(base_hist[3:].sum())
+    baseline = {
+        'evaluations': int(base_acc.n),
+        'distribution': _distribution(base_hist),
+        'mean_matches': _mean_ci(base_acc),
+        'p_3plus': base_hits / base_acc.n if base_acc.n else 0.0,
+        'p_3plus_ci95': _wilson(base_hits, base_acc.n),
+    }
+
+    results = {}
+    for name, line_masks in groups.items():
+        n_lines = len(line_masks)
+        mean = _mean_ci(mean_acc[name], scale=n_lines)
+        hit = _mean_ci(hit_acc[name], scale=n_lines)
+
+        diff = mean['mean'] - baseline['mean_matches']['mean']
+        diff_se = math.sqrt(mean['stderr'] ** 2 + baseline['mean_matches']['stderr'] ** 2)
+        results[name] = {
+            'lines': n_lines,
+            # 번호가 6개 미만인 줄 (중복 번호로 줄이 짧아진 경우 기대 일치가 낮아짐)
+            'short_lines': int((popcount_array(line_masks) < LINE_SIZE).sum()),
+            'evaluations': int(hists[name].sum()),
+            'distribution': _distribution(hists[name]),
+            'mean_matches': mean,
+            'p_3plus': hit['mean'],
+            'p_3plus_ci95': hit['ci95'],
+            'vs_baseline': {
+                'mean_diff': diff,
+                'ci95': [diff - Z_95 * diff_se, diff + Z_95 * diff_se],
+                'z': diff / diff_se if diff_se else 0.0,
+            },
+        }
+
+    pmf = hypergeometric_pmf()
+    elapsed = time.perf_counter() - started
+    total_evaluations = sum(r['evaluations'] for r in results.values()) + baseline['evaluations']
+    logger.info(f"Monte Carlo 시뮬레이션: {total_evaluations:,}건 평가, {elapsed:.2f}초")
+
+    return {
+        'seed': seed,
+        'synthetic_draws': n_draws,
+        'total_evaluations': total_evaluations,
+        'elapsed_sec': round(elapsed, 3),
+        'theoretical': {
+            'distribution': {str(k): p for k, p in enumerate(pmf)},
+            'mean_matches': LINE_SIZE * LINE_SIZE / MAX_NUMBER,
+            'p_3plus': sum(pmf[3:]),
+        },
+        'baseline': baseline,
+        'strategies': results,
+    }
+
+
+def current_strategy_lines(
+    db: Session,
+    include_ml: bool = True,
+    rng: Optional[random.Random] = None,
+) -> Optional[Dict[str, List[List[int]]]]:
+    """
+    현재 통계/모델로 만든 전략별 줄 (generate_20_lines 그룹 + ML 5줄)
+
+    Args:
+        rng: 줄 생성용 난수 생성기 (None이면 매번 다른 줄)
+    """
+    from backend.app.services.lotto.generator import generate_20_lines
+    from backend.app.services.lotto.model_registry import get_trainer
+    from backend.app.services.lotto.stats_snapshot import get_stats_snapshot
+
+    snapshot = get_stats_snapshot(db)
+    if snapshot is None:
+        return None
+
+    trainer = get_trainer()
+    ai_weights = {'logic1': 0.25, 'logic2': 0.25, 'logic3': 0.25, 'logic4': 0.25}
+    if trainer is not None and trainer.ai_weights:
+        ai_weights = trainer.ai_weights
+
+    result = generate_20_lines(0, snapshot.generator_stats(), ai_weights, rng=rng)
+    strategies = {group: result[group] for group in STRATEGY_GROUPS}
+
+    if include_ml and trainer is not None:
+        from backend.app.services.lotto.ml_predictor import LottoMLPredictor
+        existing = [line for group in STRATEGY_GROUPS for line in result[group]]
+        try:
+            strategies['ml'] = LottoMLPredictor(trainer, rng=rng).generate_ml_5_lines(
+                snapshot.draws, ML_USER_PATTERNS, existing
+            )
+        except Exception as e:
+            logger.warning(f"ML 5줄 생성 실패 (시뮬레이션 제외): {e}")
+
+    return strategies
+
+
+def run_current_simulation(
+    db: Session,
+    n_draws: int = DEFAULT_SYNTHETIC_DRAWS,
+    baseline_evaluations: int = DEFAULT_BASELINE_EVALUATIONS,
+    seed: Optional[int] = None,
+    include_ml: bool = True,
+) -> Optional[Dict]:
+    """현재 전략 줄로 시뮬레이션 (통계 캐시가 없으면 None, seed는 줄 생성/추첨 모두 고정)"""
+    rng = random.Random(seed) if seed is not None else None
+    strategies = current_strategy_lines(db, include_ml=include_ml, rng=rng)
+    if strategies is None:
+        return None
+    report = simulate_strategies(strategies, n_draws, baseline_evaluations, seed)
+    report['strategy_lines'] = strategies
+    return report
+
+
+def get_simulation_result() -> Dict:
+    """마지막 시뮬레이션 상태/결과 (재시작 후에는 결과 파일 기준)"""
+    return _job.snapshot()
+
+
+def reserve_simulation(params: Dict) -> bool:
+    """
+    시뮬레이션 실행 슬롯 예약 (동시 실행 방지 - 한 번에 하나만 메모리를 쓰도록)
+
+    Returns:
+        bool: 예약 성공 시 True, 이미 실행 중이면 False
+    """
+    return _job.reserve(params=params)
+
+
+def run_simulation_job(
+    n_draws: int = DEFAULT_SYNTHETIC_DRAWS,
+    baseline_evaluations: int = DEFAULT_BASELINE_EVALUATIONS,
+    seed: Optional[int] = None,
+    include_ml: bool = True,
+) -> None:
+    """BackgroundTasks에서 run_current_simulation 실행 후 결과 저장"""
+    db = SessionLocal()
+    try:
+        _job.update(status="running", started_at=datetime.now().isoformat())
+        report = run_current_simulation(
+            db,
+            n_draws=n_draws,
+            baseline_evaluations=baseline_evaluations,
+            seed=seed,
+            include_ml=include_ml,
+        )
+        if report is None:
+            _job.update(status="error", error="통계 캐시가 없습니다", finished_at=datetime.now().isoformat())
+        else:
+            _job.update(status="success", report=report, finished_at=datetime.now().isoformat())
+    except Exception as e:
+        logger.error(f"로또 시뮬레이션 실패: {e}", exc_info=True)
+        _job.update(status="error", error=str(e), finished_at=datetime.now().isoformat())
+    finally:
+        db.close()
@@ -1,26 +1,65 @@
 """로또 ML 성능 평가 및 백테스팅"""
+import random
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from backend.app.db.session import SessionLocal
 from backend.app.db.models import LottoDraw, LottoMLPerformance, LottoUserPrediction
+from backend.app.services.lotto.evaluation_cache import evaluation_key, get_cached, store
 from backend.app.services.lotto.generator import generate_20_lines
+from backend.app.services.lotto.line_mask import tally_matches
 from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
 from backend.app.services.lotto.ml_predictor import LottoMLPredictor
-from backend.app.services.lotto.ml_trainer import LottoMLTrainer
+from backend.app.services.lotto.model_registry import get_trainer
 import json
 
 
-def evaluate_single_draw(draw_no: int, ai_weights: dict = None) -> Dict:
+def evaluate_single_draw(
+    draw_no: int,
+    ai_weights: dict = None,
+    model_version: Optional[str] = None,
+    use_cache: bool = True,
+) -> Dict:
     """
     단일 회차에 대한 성능 평가
 
     Args:
         draw_no: 평가할 회차 번호
         ai_weights: AI 가중치 (None이면 현재 ML 모델 가중치 사용)
+        model_version: 사용할 ML 모델 버전 (None이면 현재 버전)
+        use_cache: (회차, 가중치, 모델 버전, 생성기 버전) 평가 캐시 사용 여부
 
     Returns:
         평가 결과 딕셔너리
+
+    줄 생성 난수는 회차 번호로 고정해 같은 입력이면 같은 결과가 나오게 한다.
     """
+    trainer = None
+    try:
+        trainer = get_trainer(model_version)
+    except Exception:
+        pass
+
+    if ai_weights is None:
+        ai_weights = {'logic1': 0.25, 'logic2': 0.25, 'logic3': 0.25, 'logic4': 0.25}
+        if trainer is not None and trainer.ai_weights:
+            ai_weights = trainer.ai_weights
+
+    key = evaluation_key(draw_no, ai_weights, trainer)
+    if use_cache:
+        cached = get_cached(key)
+        if cached is not None:
+            return cached
+
+    # 전역 random은 스케줄러/백그라운드 작업과 공유되므로 회차별 로컬 난수 사용
+    result = _evaluate_single_draw(draw_no, ai_weights, trainer, random.Random(draw_no))
+
+    if result is not None and use_cache:
+        store(key, result)
+    return result
+
+
+def _evaluate_single_draw(draw_no: int, ai_weights: dict, trainer, rng: random.Random) -> Optional[Dict]:
+    """draw_no - 1까지의 데이터로 25줄을 만들어 draw_no 당첨번호와 비교"""
     db = SessionLocal()
 
     try:
@@ -77,26 +116,15 @@ def evaluate_single_draw(draw_no: int, ai_weights: dict = None) -> Dict:
             'bonus_top': bonus_top
         }
 
-        # 4. AI 가중치 로드 (또는 제공된 가중치 사용)
-        if ai_weights is None:
-            ai_weights = {'logic1': 0.25, 'logic2': 0.25, 'logic3': 0.25, 'logic4': 0.25}
-            try:
-                trainer = LottoMLTrainer()
-                if trainer.load_model() and trainer.ai_weights:
-                    ai_weights = trainer.ai_weights
-            except Exception:
-                pass
-
-        # 5. 20줄 생성
+        # 4~5. 20줄 생성 (가중치는 evaluate_single_draw에서 결정)
         user_id = 99999  # 평가용 임시 ID
-        result = generate_20_lines(user_id, stats, ai_weights)
+        result = generate_20_lines(user_id, stats, ai_weights, rng=rng)
 
         # 6. ML 5줄 생성
         ml_lines = []
         try:
-            trainer = LottoMLTrainer()
-            if trainer.load_model():
-                predictor = LottoMLPredictor(trainer)
+            if trainer is not None:
+                predictor = LottoMLPredictor(trainer, rng=rng)
 
                 existing_20_lines = []
                 existing_20_lines.extend(result['basic'])
@@ -143,21 +171,14 @@ def evaluate_single_draw(draw_no: int, ai_weights: dict = None) -> Dict:
         }
 
         for logic_name, lines in all_25_lines.items():
-            for line in lines:
-                line_numbers = set(line)
-                matches = len(line_numbers & winning_numbers)
-                total_matches += matches
-                logic_matches[logic_name] += matches
-                logic_counts[logic_name] += 1
-
-                if matches == 3:
-                    match_3 += 1
-                elif matches == 4:
-                    match_4 += 1
-                elif matches == 5:
-                    match_5 += 1
-                elif matches == 6:
-                    match_6 += 1
+            tally = tally_matches(lines, winning_numbers)
+            total_matches += tally['total_matches']
+            logic_matches[logic_name] += tally['total_matches']
+            logic_counts[logic_name] += tally['line_count']
+            match_3 += tally['match_3']
+            match_4 += tally['match_4']
+            match_5 += tally['match_5']
+            match_6 += tally['match_6']
 
         total_lines = sum(logic_counts.values())
         avg_matches_per_line = total_matches / total_lines if total_lines > 0 else 0
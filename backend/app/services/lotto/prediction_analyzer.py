@@ -0,0 +1,133 @@
+"""회차별 사용자 예측 일괄 분석 (당첨번호 발표 후)"""
+import logging
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from backend.app.db.models import LottoDraw, LottoUserPrediction
+from backend.app.services.lotto.line_mask import masks_array, overlap_many, to_mask
+
+logger = logging.getLogger(__name__)
+
+ANALYZE_CHUNK_SIZE = 500  # 한 번에 읽고 UPDATE할 예측 수
+MATCH_KEYS = ('match_3', 'match_4', 'match_5', 'match_6')
+
+
+def _empty_stats() -> Dict[str, int]:
+    return {'lines': 0, 'match_3': 0, 'match_4': 0, 'match_5': 0, 'match_6': 0, 'total_matches': 0}
+
+
+def analyze_predictions_for_draw(
+    db: Session,
+    draw_no: int,
+    chunk_size: int = ANALYZE_CHUNK_SIZE,
+) -> Dict:
+    """
+    해당 회차의 미분석 예측을 청크 단위로 일괄 채점
+
+    - 청크의 모든 줄을 비트마스크 배열로 만들어 당첨 마스크와 한 번에 비교
+    - 예측별 match_3~6/total_matches는 bulk UPDATE로 저장
+    - 같은 패스에서 로직별 적중 통계 집계
+
+    Returns:
+        {'draw_no', 'predictions', 'lines', 'match_3'.., 'total_matches', 'by_logic'}
+    """
+    summary = {'draw_no': draw_no, 'predictions': 0, **_empty_stats(), 'by_logic': {}}
+
+    draw = db.get(LottoDraw, draw_no)
+    if draw is None:
+        logger.info(f"{draw_no}회 당첨번호 없음 - 예측 분석 건너뜀")
+        return summary
+
+    winning_mask = to_mask([draw.n1, draw.n2, draw.n3, draw.n4, draw.n5, draw.n6])
+    by_logic: Dict[str, Dict[str, int]] = {}
+    last_id = 0
+
+    while True:
+        rows = db.execute(
+            select(LottoUserPrediction.id, LottoUserPrediction.lines)
+            .where(
+                LottoUserPrediction.target_draw_no == draw_no,
+                LottoUserPrediction.analyzed.isnot(True),
+                LottoUserPrediction.id > last_id,
+            )
+            .order_by(LottoUserPrediction.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        # 청크의 모든 줄을 평탄화 (owner: 줄이 속한 예측의 행 번호)
+        numbers: List[List[int]] = []
+        owners: List[int] = []
+        logics: List[str] = []
+        for row_index, row in enumerate(rows):
+            for line in row.lines or []:
+                numbers.append(line.get('numbers') or [])
+                owners.append(row_index)
+                logics.append(line.get('logic') or 'unknown')
+
+        counts = overlap_many(winning_mask, masks_array(numbers))
+        owner_arr = np.asarray(owners, dtype=np.int64)
+        n_rows = len(rows)
+
+        per_row = {
+            key: np.bincount(owner_arr, weights=(counts == k), minlength=n_rows).astype(np.int64)
+            for key, k in zip(MATCH_KEYS, (3, 4, 5, 6))
+        }
+        per_row['total_matches'] = np.bincount(owner_arr, weights=counts, minlength=n_rows).astype(np.int64)
+
+        analyzed_at = datetime.now()
+        db.execute(
+            update(LottoUserPrediction),
+            [
+                {
+                    'id': row.id,
+                    'analyzed': True,
+                    'match_3': int(per_row['match_3'][i]),
+                    'match_4': int(per_row['match_4'][i]),
+                    'match_5': int(per_row['match_5'][i]),
+                    'match_6': int(per_row['match_6'][i]),
+                    'total_matches': int(per_row['total_matches'][i]),
+                    'analyzed_at': analyzed_at,
+                }
+                for i, row in enumerate(rows)
+            ],
+        )
+        db.commit()
+
+        # 로직별 집계
+        if logics:
+            labels, inverse = np.unique(np.asarray(logics), return_inverse=True)
+            line_counts = np.bincount(inverse, minlength=len(labels))
+            match_sums = np.bincount(inverse, weights=counts, minlength=len(labels))
+            hits = {
+                key: np.bincount(inverse, weights=(counts == k), minlength=len(labels))
+                for key, k in zip(MATCH_KEYS, (3, 4, 5, 6))
+            }
+            for j, label in enumerate(labels):
+                stats = by_logic.setdefault(str(label), _empty_stats())
+                stats['lines'] += int(line_counts[j])
+                stats['total_matches'] += int(match_sums[j])
+                for key in MATCH_KEYS:
+                    stats[key] += int(hits[key][j])
+
+        summary['predictions'] += n_rows
+        summary['lines'] += int(counts.size)
+        summary['total_matches'] += int(counts.sum())
+        for key in MATCH_KEYS:
+            summary[key] += int(per_row[key].sum())
+
+    for stats in by_logic.values():
+        stats['avg_matches'] = round(stats['total_matches'] / stats['lines'], 4) if stats['lines'] else 0.0
+    summary['by_logic'] = by_logic
+
+    logger.info(
+        f"{draw_no}회 예측 분석: {summary['predictions']}건 / {summary['lines']}줄, "
+        f"3개 {summary['match_3']} · 4개 {summary['match_4']} · 5개 {summary['match_5']} · 6개 {summary['match_6']}"
+    )
+    return summary
@@ -0,0 +1,234 @@
+"""로또 통계 스냅샷 (LottoStatsCache 1행 + 프로세스별 디코딩 캐시)
+
+- 갱신 쪽(주간 업데이트/import/백필)은 rebuild_stats_cache() 하나로 전체 통계를 계산해 저장
+  (최다/최소, 패턴, 4가지 로직 점수표, 보너스 순위)
+- 읽는 쪽(텔레그램 핸들러)은 get_stats_snapshot()으로 디코딩된 스냅샷을 재사용
+  버전(total_draws, updated_at)만 가볍게 조회해 바뀌었을 때만 다시 읽는다
+"""
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.db.models import LottoDraw, LottoStatsCache
+from backend.app.services.lotto.line_scoring import logic_score_matrix
+from backend.app.services.lotto.stats_calculator import LottoStatsCalculator
+
+logger = logging.getLogger(__name__)
+
+LOGIC_KEYS = ('scores_logic1', 'scores_logic2', 'scores_logic3', 'scores_logic4')
+
+_lock = threading.Lock()
+_snapshot: Optional["StatsSnapshot"] = None
+
+
+class StatsSnapshot:
+    """디코딩된 통계 캐시 (읽기 전용으로 공유)"""
+
+    __slots__ = (
+        'version', 'total_draws', 'updated_at', 'most_common', 'least_common',
+        'patterns', 'best_patterns', 'bonus_top', 'draws',
+        'scores_logic1', 'scores_logic2', 'scores_logic3', 'scores_logic4',
+        'logic_matrix',
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @property
+    def next_draw_no(self) -> int:
+        return self.total_draws + 1
+
+    def generator_stats(self) -> Dict:
+        """generate_20_lines()에 넘기는 stats dict"""
+        return {
+            'most_common': self.most_common,
+            'least_common': self.least_common,
+            'scores_logic1': self.scores_logic1,
+            'scores_logic2': self.scores_logic2,
+            'scores_logic3': self.scores_logic3,
+            'patterns': self.patterns,
+            'best_patterns': self.best_patterns,
+            'bonus_top': self.bonus_top,
+        }
+
+
+def _draws_to_dicts(rows) -> List[Dict]:
+    return [
+        {
+            'draw_no': d.draw_no,
+            'n1': d.n1, 'n2': d.n2, 'n3': d.n3,
+            'n4': d.n4, 'n5': d.n5, 'n6': d.n6,
+            'bonus': d.bonus
+        }
+        for d in rows
+    ]
+
+
+def load_draws(db: Session) -> List[Dict]:
+    """전체 회차 (회차 오름차순)"""
+    rows = db.execute(
+        select(
+            LottoDraw.draw_no,
+            LottoDraw.n1, LottoDraw.n2, LottoDraw.n3,
+            LottoDraw.n4, LottoDraw.n5, LottoDraw.n6,
+            LottoDraw.bonus,
+        ).order_by(LottoDraw.draw_no)
+    ).all()
+    return _draws_to_dicts(rows)
+
+
+def bonus_ranking(draws: List[Dict]) -> List[int]:
+    """보너스 번호 출현 빈도 (많이 나온 순)"""
+    bonus_counts = {}
+    for d in draws:
+        b = d.get('bonus')
+        if b:
+            bonus_counts[b] = bonus_counts.get(b, 0) + 1
+    return [num for num, _ in sorted(bonus_counts.items(), key=lambda x: x[1], reverse=True)]
+
+
+def build_stats_payload(draws: List[Dict]) -> Dict:
+    """
+    캐시 행에 저장할 전체 통계 계산
+
+    ai_scores 컬럼에는 기존 확장 형식('scores', 'patterns', 'best_patterns')에
+    4가지 로직 점수표와 보너스 순위를 더해 저장한다.
+    """
+    calculator = LottoStatsCalculator
+    most_common, least_common = calculator.calculate_most_least(draws)
+    patterns = calculator.analyze_historical_patterns(draws)
+    best_patterns = calculator.get_best_patterns(patterns)
+
+    logic_scores = {
+        'scores_logic1': calculator.calculate_ai_scores_logic1(draws),
+        'scores_logic2': calculator.calculate_ai_scores_logic2(draws),
+        'scores_logic3': calculator.calculate_ai_scores_logic3(draws),
+        'scores_logic4': calculator.calculate_ai_scores_logic4(draws),
+    }
+
+    ai_scores = {
+        'scores': logic_scores['scores_logic1'],
+        # 튜플 키/값은 JSON 직렬화를 위해 문자열/리스트로 변환
+        'patterns': {
+            'odd_even_patterns': {str(k): v for k, v in patterns['odd_even_patterns'].items()},
+            'zone_patterns': {str(k): v for k, v in patterns['zone_patterns'].items()},
+            'consecutive_patterns': patterns['consecutive_patterns'],
+            'sum_ranges': {str(k): v for k, v in patterns['sum_ranges'].items()},
+        },
+        'best_patterns': {
+            'best_odd_even': list(best_patterns['best_odd_even']),
+            'best_zone': list(best_patterns['best_zone']),
+            'best_consecutive': best_patterns['best_consecutive'],
+            'best_sum_range': list(best_patterns['best_sum_range']),
+        },
+        'bonus_top': bonus_ranking(draws),
+        **logic_scores,
+    }
+
+    return {
+        'total_draws': len(draws),
+        'most_common': json.dumps(most_common),
+        'least_common': json.dumps(least_common),
+        'ai_scores': json.dumps(ai_scores, ensure_ascii=False),
+    }
+
+
+def rebuild_stats_cache(db: Session, draws: Optional[List[Dict]] = None) -> List[Dict]:
+    """
+    통계 캐시 행 재계산 + 저장 (updated_at 갱신 → 각 프로세스가 다음 조회 때 새로 읽음)
+
+    Returns:
+        계산에 사용한 전체 회차 (ML 학습 등에 재사용)
+    """
+    if draws is None:
+        draws = load_draws(db)
+
+    payload = build_stats_payload(draws)
+    cache = db.query(LottoStatsCache).first()
+    if cache:
+        cache.updated_at = datetime.now()
+        for key, value in payload.items():
+            setattr(cache, key, value)
+    else:
+        db.add(LottoStatsCache(updated_at=datetime.now(), **payload))
+    db.commit()
+    return draws
+
+
+def _decode(value):
+    """JSON 컬럼에 문자열로 저장된 값 디코딩"""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _int_keys(scores: Dict) -> Dict[int, float]:
+    return {int(k): v for k, v in scores.items()}
+
+
+def _load_snapshot(db: Session) -> Optional[StatsSnapshot]:
+    cache = db.query(LottoStatsCache).first()
+    if cache is None:
+        return None
+
+    ai_scores = _decode(cache.ai_scores) or {}
+    draws = load_draws(db)
+
+    fields = {
+        'version': (cache.total_draws, cache.updated_at),
+        'total_draws': cache.total_draws,
+        'updated_at': cache.updated_at,
+        'most_common': _decode(cache.most_common),
+        'least_common': _decode(cache.least_common),
+        'patterns': ai_scores.get('patterns', {}),
+        'best_patterns': ai_scores.get('best_patterns', {}),
+        'draws': draws,
+    }
+
+    if all(key in ai_scores for key in LOGIC_KEYS):
+        for key in LOGIC_KEYS:
+            fields[key] = _int_keys(ai_scores[key])
+        fields['bonus_top'] = ai_scores.get('bonus_top', [])
+    else:
+        # 점수표가 없는 이전 형식 캐시 → 버전당 1회만 계산
+        calculator = LottoStatsCalculator
+        fields['scores_logic1'] = calculator.calculate_ai_scores_logic1(draws)
+        fields['scores_logic2'] = calculator.calculate_ai_scores_logic2(draws)
+        fields['scores_logic3'] = calculator.calculate_ai_scores_logic3(draws)
+        fields['scores_logic4'] = calculator.calculate_ai_scores_logic4(draws)
+        fields['bonus_top'] = bonus_ranking(draws)
+
+    # 추천 줄 점수 계산용 (4 × 46) 행렬
+    fields['logic_matrix'] = logic_score_matrix([fields[key] for key in LOGIC_KEYS])
+    return StatsSnapshot(**fields)
+
+
+def get_stats_snapshot(db: Session) -> Optional[StatsSnapshot]:
+    """
+    현재 통계 스냅샷 (캐시 행이 없으면 None)
+
+    매 호출은 (total_draws, updated_at) 1행만 조회하고,
+    버전이 바뀐 경우에만 JSON 디코딩/회차 조회를 다시 한다.
+    """
+    global _snapshot
+    row = db.execute(select(LottoStatsCache.total_draws, LottoStatsCache.updated_at)).first()
+    if row is None:
+        return None
+    version = (row.total_draws, row.updated_at)
+
+    current = _snapshot
+    if current is not None and current.version == version:
+        return current
+
+    with _lock:
+        if _snapshot is not None and _snapshot.version == version:
+            return _snapshot
+        snapshot = _load_snapshot(db)
+        if snapshot is not None:
+            _snapshot = snapshot
+            logger.info(f"로또 통계 스냅샷 갱신: {snapshot.total_draws}회 ({snapshot.updated_at})")
+        return snapshot
@@ -12,6 +12,7 @@ from typing import Optional
 
 from backend.app.config import settings
 from backend.app.db.models import Subscriber, MarketDaily, NewsDaily, KoreaMetalDaily, NotificationLog
+from backend.app.utils.http_clients import client_for_url
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +49,7 @@ def send_telegram_message_sync(chat_id: str, text: str, max_retries: int = 3) ->
 
     for attempt in range(max_retries):
         try:
-            response = httpx.post(
+            response = client_for_url(url).post(
                 url,
                 json={
                     "chat_id": chat_id,
@@ -585,10 +586,17 @@ def send_breaking_batch(db: Session, news_items: list) -> int:
     if not subscribers:
         return 0
     
-    # 중복 제거 후 배치 메시지 생성
+    # 이전 배치(다른 날 포함)에서 보낸 스토리 제외 + 스토리당 1건, 그 뒤 제목 중복 제거
     from backend.app.utils.dedup import remove_duplicate_news
-    if news_items:
-        news_items = remove_duplicate_news(news_items)
+    from backend.app.utils.story_index import mark_alerted, one_per_story
+    news_items, repeated = one_per_story(db, news_items, seen=lambda story: story.last_alerted_at is not None)
+    if not news_items:
+        for news in repeated:
+            news.alert_sent = True
+        db.commit()
+        logger.info("Breaking batch skipped: all %s items belong to stories already sent", len(repeated))
+        return 0
+    news_items = remove_duplicate_news(news_items)
 
     lines = ["⚡ 긴급 속보 모음 · BREAKING NEWS"]
     lines.append("")
@@ -623,8 +631,10 @@ def send_breaking_batch(db: Session, news_items: list) -> int:
 
     # 전송이 0건이면 alert_sent 갱신하지 않음 (재시도 가능하도록 보존)
     if sent_count > 0:
-        for news in news_items:
+        # 이미 보낸 스토리의 기사도 전송 처리 (다음 배치에 다시 올라오지 않게)
+        for news in news_items + repeated:
             news.alert_sent = True
+        mark_alerted(db, news_items)
         db.commit()
         logger.info("Breaking batch marked sent (items=%s)", len(news_items))
     else:
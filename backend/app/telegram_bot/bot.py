@@ -3,7 +3,6 @@ import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, date, time as time_type, timedelta, timezone
-import httpx
 
 from telegram import (
     Update,
@@ -28,6 +27,7 @@ from backend.app.handlers.lotto.lotto_handler import (
     lotto_result_callback,
     lotto_performance_command
 )
+from backend.app.utils.http_clients import aclose_all, async_client_for_url
 
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -568,10 +568,9 @@ async def fetch_coin_ticker(symbol: str) -> Optional[Dict[str, Any]]:
 
     url = f"{COINPAPRIKA_TICKER_URL}/{coin_id}"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await async_client_for_url(url).get(url, timeout=10.0)
+        resp.raise_for_status()
+        return resp.json()
     except Exception as e:
         logger.exception("Failed to fetch coin ticker: %s", e)
         return None
@@ -581,16 +580,16 @@ async def fetch_all_coins() -> Dict[str, Dict[str, Any]]:
     """모든 지원 코인의 시세를 한 번에 가져옵니다."""
     result = {}
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for symbol, coin_id in SUPPORTED_COINS.items():
-            try:
-                url = f"{COINPAPRIKA_TICKER_URL}/{coin_id}"
-                resp = await client.get(url)
-                resp.raise_for_status()
-                result[symbol] = resp.json()
-            except Exception as e:
-                logger.exception(f"Failed to fetch {symbol}: %s", e)
-                result[symbol] = None
+    client = async_client_for_url(COINPAPRIKA_TICKER_URL)
+    for symbol, coin_id in SUPPORTED_COINS.items():
+        try:
+            url = f"{COINPAPRIKA_TICKER_URL}/{coin_id}"
+            resp = await client.get(url, timeout=10.0)
+            resp.raise_for_status()
+            result[symbol] = resp.json()
+        except Exception as e:
+            logger.exception(f"Failed to fetch {symbol}: %s", e)
+            result[symbol] = None
     
     return result
 
@@ -1911,8 +1910,13 @@ async def handle_text_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text("아래 버튼을 이용해보세요 😊")
 
 
+async def _close_http_clients(application) -> None:
+    """봇 종료 시 공유 async HTTP 클라이언트 정리"""
+    await aclose_all()
+
+
 def _build_application(token: str):
-    application = ApplicationBuilder().token(token).build()
+    application = ApplicationBuilder().token(token).post_shutdown(_close_http_clients).build()
     application.add_error_handler(_on_app_error)
 
     application.add_handler(CommandHandler("start", start))
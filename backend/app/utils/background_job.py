@@ -0,0 +1,76 @@
+"""백그라운드 작업 상태 (한 번에 하나 실행 + logs/ JSON 체크포인트)
+
+관리자 API가 BackgroundTasks로 돌리는 긴 작업(로또 백필, Monte Carlo 시뮬레이션)의
+공통 상태 관리:
+- reserve(): 실행 슬롯 예약 (queued/running이면 거절)
+- update(): 메모리 상태 갱신 + 체크포인트 파일 저장
+- snapshot(): 현재 상태. 프로세스가 재시작되어 메모리 상태가 없으면 파일을 읽고,
+  파일상 실행 중이었다면 중단(interrupted)으로 표시
+"""
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class BackgroundJob:
+    def __init__(self, state_path: Path, label: str):
+        self.state_path = state_path
+        self.label = label  # 로그용 작업 이름
+        self._lock = threading.Lock()
+        self._state: Dict = {}
+
+    def _load(self) -> Dict:
+        if not self.state_path.exists():
+            return {}
+        try:
+            return json.loads(self.state_path.read_text())
+        except Exception:
+            return {}
+
+    def update(self, **changes) -> None:
+        """메모리 상태 갱신 + 체크포인트 저장"""
+        with self._lock:
+            self._state.update(changes)
+            self._state["updated_at"] = datetime.now().isoformat()
+            snapshot = dict(self._state)
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(json.dumps(snapshot, ensure_ascii=False, default=str))
+        except Exception as e:
+            logger.warning(f"{self.label} 체크포인트 저장 실패: {e}")
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            if self._state:
+                return dict(self._state)
+        state = self._load()
+        if state.get("status") in ACTIVE_STATUSES:
+            state["status"] = "interrupted"
+        return state
+
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._state.get("status") in ACTIVE_STATUSES
+
+    def reserve(self, **fields) -> bool:
+        """
+        실행 슬롯 예약 (동시 실행 방지)
+
+        Returns:
+            bool: 예약 성공 시 True, 이미 실행 중이면 False
+        """
+        with self._lock:
+            if self._state.get("status") in ACTIVE_STATUSES:
+                return False
+            self._state.clear()
+            self._state.update(fields)
+            self._state["status"] = "queued"
+            self._state["queued_at"] = datetime.now().isoformat()
+        return True
@@ -0,0 +1,170 @@
+"""외부 소스(호스트)별 서킷 브레이커 레지스트리
+
+상태:
+- closed: 정상 호출
+- open: 최근 실패율이 임계치를 넘으면 cooldown 동안 호출을 건너뛰고 바로 대체 경로 사용
+- half_open: cooldown 후 시험 호출 1건만 허용 → 성공 시 closed, 실패 시 다시 open
+"""
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+WINDOW_SECONDS = 300.0        # 실패율 계산 구간
+MIN_CALLS = 3                 # 판단에 필요한 최소 호출 수
+FAILURE_RATE_THRESHOLD = 0.5  # 이 비율 이상 실패 시 open
+COOLDOWN_SECONDS = 120.0      # open 유지 시간
+
+# 서버가 살아 있어도 차단/과부하로 봐야 하는 상태 코드
+FAILURE_STATUS_CODES = {403, 429}
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = WINDOW_SECONDS,
+        min_calls: int = MIN_CALLS,
+        failure_rate_threshold: float = FAILURE_RATE_THRESHOLD,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+
+        self._lock = threading.Lock()
+        self._calls: Deque[Tuple[float, bool]] = deque()  # (시각, 성공 여부)
+        self._state = CLOSED
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._skipped = 0
+        self._last_error: Optional[str] = None
+
+    def _trim(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """호출 가능 여부 (open이면 False, cooldown 후에는 시험 호출 1건 허용)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == OPEN and now - self._opened_at >= self.cooldown_seconds:
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._skipped += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+                self._opened_at = None
+                self._trial_in_flight = False
+                self._calls.clear()
+            self._calls.append((now, True))
+            self._trim(now)
+
+    def record_failure(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._last_error = error
+            if self._state == HALF_OPEN:
+                self._state = OPEN
+                self._opened_at = now
+                self._trial_in_flight = False
+                return
+            self._calls.append((now, False))
+            self._trim(now)
+            failures = sum(1 for _, ok in self._calls if not ok)
+            if (
+                self._state == CLOSED
+                and len(self._calls) >= self.min_calls
+                and failures / len(self._calls) >= self.failure_rate_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = now
+
+    def record_exception(self, exc: Exception) -> None:
+        """요청 예외 기록 (4xx 응답은 서버가 살아 있으므로 403/429 외에는 성공으로 본다)"""
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+        if status_code is not None and not is_failure_status(status_code):
+            self.record_success()
+        else:
+            self.record_failure(f"{type(exc).__name__}: {exc}"[:200])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._state = CLOSED
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            failures = sum(1 for _, ok in self._calls if not ok)
+            retry_in = None
+            if self._state == OPEN and self._opened_at is not None:
+                retry_in = max(0.0, round(self.cooldown_seconds - (now - self._opened_at), 1))
+            return {
+                "state": self._state,
+                "calls_in_window": len(self._calls),
+                "failures_in_window": failures,
+                "failure_rate": round(failures / len(self._calls), 3) if self._calls else 0.0,
+                "skipped": self._skipped,
+                "retry_in_seconds": retry_in,
+                "last_error": self._last_error,
+            }
+
+
+_registry: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """이름(보통 호스트)별 브레이커 (없으면 생성)"""
+    with _registry_lock:
+        breaker = _registry.get(name)
+        if breaker is None:
+            breaker = _registry[name] = CircuitBreaker(name)
+        return breaker
+
+
+def find_breaker(name: str) -> Optional[CircuitBreaker]:
+    """이미 만들어진 브레이커만 조회 (없으면 None, 새로 만들지 않음)"""
+    with _registry_lock:
+        return _registry.get(name)
+
+
+def breaker_for_url(url: str) -> CircuitBreaker:
+    return get_breaker(urlparse(url).netloc or url)
+
+
+def is_failure_status(status_code: int) -> bool:
+    """브레이커 실패로 셀 HTTP 상태 (5xx, 403, 429)"""
+    return status_code >= 500 or status_code in FAILURE_STATUS_CODES
+
+
+def get_breaker_states() -> Dict[str, Dict]:
+    with _registry_lock:
+        breakers = list(_registry.values())
+    return {b.name: b.snapshot() for b in breakers}
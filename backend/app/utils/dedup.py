@@ -1,7 +1,8 @@
 """뉴스 중복 제거 유틸리티"""
 
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from difflib import SequenceMatcher
+from functools import lru_cache
 import html
 import re
 from urllib.parse import urlparse, urlunparse
@@ -215,97 +216,118 @@ def has_obit_keywords(title: str) -> bool:
     return any(k in title for k in obit_keywords)
 
 
-def is_duplicate_news(news1_title: str, news2_title: str) -> bool:
-    """두 뉴스가 중복인지 판단"""
-    
+class TitleFeatures:
+    """제목 하나에서 중복 판별에 쓰는 값들 (한 번만 계산해 재사용)"""
+
+    __slots__ = (
+        "issue_key", "short_key", "clean", "words", "entities",
+        "persons", "persons_normalized", "primary_topic",
+    )
+
+    def __init__(self, title: str):
+        self.issue_key = extract_issue_key(title)
+        self.short_key = extract_short_topic_key(title)
+        self.clean = re.sub(r"[^가-힣a-zA-Z0-9 ]", "", normalize_title(title).lower())
+        self.words = frozenset(self.clean.split())
+        self.entities = frozenset(extract_key_entities(title))
+        self.persons = frozenset(extract_person_candidates(title))
+        self.persons_normalized = frozenset(extract_person_candidates(normalize_title(title)))
+        self.primary_topic = extract_primary_topic(title)
+
+
+@lru_cache(maxsize=4096)
+def title_features(title: str) -> TitleFeatures:
+    """제목별 특징 (API/봇이 같은 오늘 뉴스를 반복해서 중복 제거하므로 캐시)"""
+    return TitleFeatures(title or "")
+
+
+def _ratio_at_least(current: str, matcher: SequenceMatcher, threshold: float) -> bool:
+    """matcher(seq2 = 비교 대상)에 current를 넣어 ratio >= threshold 여부 (상한값으로 먼저 컷)"""
+    matcher.set_seq1(current)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+def _is_duplicate(f1: TitleFeatures, f2: TitleFeatures, matcher: Optional[SequenceMatcher] = None) -> bool:
+    """is_duplicate_news와 같은 판정 (값싼 비교 먼저, 문자열 유사도는 마지막)"""
+
     # 0. 인물/사건 키가 동일하면 중복
-    issue1 = extract_issue_key(news1_title)
-    issue2 = extract_issue_key(news2_title)
-    if issue1 and issue1 == issue2:
+    if f1.issue_key and f1.issue_key == f2.issue_key:
         return True
 
     # 1. topic_key 비교 (30자)
-    key1 = extract_short_topic_key(news1_title)
-    key2 = extract_short_topic_key(news2_title)
-    
-    if key1 == key2:
-        return True
-    
-    # 2. 유사도 계산 (단어 기반)
-    similarity = calculate_similarity(news1_title, news2_title)
-    if similarity >= 0.5:
+    if f1.short_key == f2.short_key:
         return True
 
-    # 2-1. 문자열 기반 유사도 (문장 거의 동일한 경우)
-    clean1 = re.sub(r"[^가-힣a-zA-Z0-9 ]", "", normalize_title(news1_title).lower())
-    clean2 = re.sub(r"[^가-힣a-zA-Z0-9 ]", "", normalize_title(news2_title).lower())
-    if clean1 and clean2:
-        ratio = SequenceMatcher(None, clean1, clean2).ratio()
-        if ratio >= 0.78:
+    # 2. 유사도 계산 (단어 기반 Jaccard)
+    if f1.words and f2.words:
+        if len(f1.words & f2.words) / len(f1.words | f2.words) >= 0.5:
             return True
-    
+
     # 3. 핵심 키워드 비교
-    entities1 = extract_key_entities(news1_title)
-    entities2 = extract_key_entities(news2_title)
-    
-    if entities1 and entities2:
-        common = set(entities1) & set(entities2)
-        total = set(entities1) | set(entities2)
-        
-        if len(common) / len(total) >= 0.5:
+    if f1.entities and f2.entities:
+        if len(f1.entities & f2.entities) / len(f1.entities | f2.entities) >= 0.5:
             return True
 
-    # 4. 부고/별세 이슈: 인물 후보가 겹치면 중복 처리
-    if has_obit_keywords(news1_title) and has_obit_keywords(news2_title):
-        c1 = extract_person_candidates(news1_title)
-        c2 = extract_person_candidates(news2_title)
-        if c1 and c2 and (c1 & c2):
+    # 4/5. 부고/별세 이슈 또는 동일 인물 반복: 인물 후보가 겹치면 중복 처리
+    if f1.persons and f2.persons and (f1.persons & f2.persons):
+        return True
+
+    # 2-1. 문자열 기반 유사도 (문장 거의 동일한 경우)
+    if f1.clean and f2.clean:
+        if matcher is None:
+            matcher = SequenceMatcher(None, "", f2.clean)
+        if _ratio_at_least(f1.clean, matcher, 0.78):
             return True
 
-    # 5. 동일 인물 반복: 인물 후보가 겹치면 중복 처리
-    c1 = extract_person_candidates(news1_title)
-    c2 = extract_person_candidates(news2_title)
-    if c1 and c2 and (c1 & c2):
-        return True
-    
     return False
 
 
+def is_duplicate_news(news1_title: str, news2_title: str) -> bool:
+    """두 뉴스가 중복인지 판단"""
+    return _is_duplicate(title_features(news1_title), title_features(news2_title))
+
+
 def remove_duplicate_news(news_list: List) -> List:
-    """중복 뉴스 제거 (hot_score 높은 것만 남김)"""
+    """
+    중복 뉴스 제거 (hot_score 높은 것만 남김)
+
+    title/url/hot_score/created_at 속성만 보므로 NewsDaily, 조회 Row,
+    수집 후보(NewsCandidate) 어느 것이든 받는다.
+    """
     
     if not news_list:
         return []
     
     # 1. 먼저 hot_score로 정렬 (높은 순)
     sorted_news = sorted(news_list, key=lambda x: (x.hot_score, x.created_at), reverse=True)
+    features = [title_features(item.title) for item in sorted_news]
     name_counts = {}
-    for item in sorted_news:
-        candidates = extract_person_candidates(normalize_title(item.title))
-        for name in candidates:
+    for feature in features:
+        for name in feature.persons_normalized:
             name_counts[name] = name_counts.get(name, 0) + 1
     frequent_names = {name for name, count in name_counts.items() if count >= 2}
     
-    # 2. 중복 제거
+    # 2. 중복 제거 (남긴 뉴스별 특징 + 문자열 비교기)
     unique_news = []
+    kept = []
     seen_urls = set()
     seen_issue_keys = set()
     
-    for current_news in sorted_news:
-        is_dup = False
-
+    for current_news, feature in zip(sorted_news, features):
         # 인물/사건 키가 동일하면 중복으로 처리
-        issue_key = extract_issue_key(current_news.title)
-        primary_topic = extract_primary_topic(current_news.title)
-        candidates = extract_person_candidates(normalize_title(current_news.title))
-        common_names = candidates & frequent_names
+        issue_key = feature.issue_key
+        common_names = feature.persons_normalized & frequent_names
         if common_names:
             # 여러 이름 중 하나로 묶어서 중복 제거 (인물 기준 최우선)
             name = sorted(common_names)[0]
             issue_key = f"person:{name}"
 
-        if primary_topic:
-            issue_key = issue_key or f"topic:{primary_topic}"
+        if feature.primary_topic:
+            issue_key = issue_key or f"topic:{feature.primary_topic}"
         if issue_key and issue_key in seen_issue_keys:
             continue
 
@@ -314,19 +336,15 @@ def remove_duplicate_news(news_list: List) -> List:
         if current_url and current_url in seen_urls:
             continue
         
-        # 이미 unique_news에 있는 것과 비교
-        for existing_news in unique_news:
-            if is_duplicate_news(current_news.title, existing_news.title):
-                # 중복 발견! (현재는 이미 정렬되어 있으므로 existing이 더 높은 점수)
-                is_dup = True
-                break
+        # 이미 unique_news에 있는 것과 비교 (existing이 더 높은 점수)
+        if any(_is_duplicate(feature, kept_feature, matcher) for kept_feature, matcher in kept):
+            continue
         
-        # 중복이 아니면 추가
-        if not is_dup:
-            unique_news.append(current_news)
-            if current_url:
-                seen_urls.add(current_url)
-            if issue_key:
-                seen_issue_keys.add(issue_key)
+        unique_news.append(current_news)
+        kept.append((feature, SequenceMatcher(None, "", feature.clean)))
+        if current_url:
+            seen_urls.add(current_url)
+        if issue_key:
+            seen_issue_keys.add(issue_key)
     
     return unique_news
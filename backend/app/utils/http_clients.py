@@ -0,0 +1,210 @@
+"""외부 API용 httpx 클라이언트 레지스트리
+
+요청마다 클라이언트를 새로 만들면 TCP/TLS 연결을 매번 다시 맺는다.
+여기서는 호스트(업스트림)별로 오래 유지하는 sync/async 클라이언트를 하나씩 두고
+모든 수집기/알림/봇 호출이 같은 연결 풀을 재사용하게 한다.
+
+- 호스트별 기본 timeout, 연결 풀 크기, HTTP/2(h2 패키지가 있을 때만) 설정
+- 연결 단계 오류는 transport에서 재시도 (응답 상태 기반 재시도는 각 호출부 담당)
+- 요청 수 / 새 연결 수 / TLS 핸드셰이크 수로 연결 재사용률 집계
+"""
+import asyncio
+import importlib.util
+import logging
+import threading
+from typing import Any, Dict, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_MAX_KEEPALIVE = 5
+KEEPALIVE_EXPIRY = 30.0
+CONNECT_RETRIES = 2  # 연결 실패(ConnectError/ConnectTimeout)만 재시도
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 호스트별 설정 (없는 항목은 기본값)
+HOST_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "api.telegram.org": {"http2": True},
+    "api.stock.naver.com": {"http2": True, "max_connections": 16, "max_keepalive_connections": 8},
+    "m.stock.naver.com": {"http2": True},
+    "openapi.naver.com": {"http2": True},
+    "www.dhlottery.co.kr": {"max_connections": 16, "max_keepalive_connections": 8},
+    "dhlottery.co.kr": {"max_connections": 16, "max_keepalive_connections": 8},
+    "www.koreagoldx.co.kr": {"timeout": 12.0},
+    "r.jina.ai": {"timeout": 15.0},
+}
+
+
+class _ReuseMetrics:
+    """호스트별 요청/새 연결 수 (연결 재사용률 계산용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+
+    def on_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def on_trace(self, event_name: str) -> None:
+        # httpcore trace: 새 연결을 맺을 때만 connect_tcp/start_tls 이벤트가 발생
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.tls_handshakes += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reused = max(self.requests - self.new_connections, 0)
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "tls_handshakes": self.tls_handshakes,
+                "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0,
+            }
+
+
+_lock = threading.Lock()
+_clients: Dict[str, httpx.Client] = {}
+_async_clients: Dict[Tuple[asyncio.AbstractEventLoop, str], httpx.AsyncClient] = {}  # (이벤트 루프, 호스트)별
+_metrics: Dict[str, _ReuseMetrics] = {}
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc or url
+
+
+def _settings(host: str) -> Dict[str, Any]:
+    conf = HOST_SETTINGS.get(host, {})
+    return {
+        "timeout": conf.get("timeout", DEFAULT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_connections=conf.get("max_connections", DEFAULT_MAX_CONNECTIONS),
+            max_keepalive_connections=conf.get("max_keepalive_connections", DEFAULT_MAX_KEEPALIVE),
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        "http2": bool(conf.get("http2")) and HTTP2_AVAILABLE,
+    }
+
+
+def _metrics_for(host: str) -> _ReuseMetrics:
+    metrics = _metrics.get(host)
+    if metrics is None:
+        metrics = _metrics[host] = _ReuseMetrics()
+    return metrics
+
+
+def _build_client(host: str) -> httpx.Client:
+    conf = _settings(host)
+    metrics = _metrics_for(host)
+
+    def on_request(request: httpx.Request) -> None:
+        metrics.on_request()
+        request.extensions["trace"] = lambda name, info: metrics.on_trace(name)
+
+    return httpx.Client(
+        timeout=conf["timeout"],
+        transport=httpx.HTTPTransport(
+            retries=CONNECT_RETRIES, limits=conf["limits"], http2=conf["http2"]
+        ),
+        event_hooks={"request": [on_request]},
+    )
+
+
+def _build_async_client(host: str) -> httpx.AsyncClient:
+    conf = _settings(host)
+    metrics = _metrics_for(host)
+
+    async def trace(name: str, info: Dict) -> None:
+        metrics.on_trace(name)
+
+    async def on_request(request: httpx.Request) -> None:
+        metrics.on_request()
+        request.extensions["trace"] = trace
+
+    return httpx.AsyncClient(
+        timeout=conf["timeout"],
+        transport=httpx.AsyncHTTPTransport(
+            retries=CONNECT_RETRIES, limits=conf["limits"], http2=conf["http2"]
+        ),
+        event_hooks={"request": [on_request]},
+    )
+
+
+def client_for_url(url: str) -> httpx.Client:
+    """URL 호스트의 공유 sync 클라이언트 (스레드 간 공유 가능, 닫지 말 것)"""
+    host = host_of(url)
+    client = _clients.get(host)
+    if client is not None and not client.is_closed:
+        return client
+    with _lock:
+        client = _clients.get(host)
+        if client is None or client.is_closed:
+            client = _clients[host] = _build_client(host)
+        return client
+
+
+def async_client_for_url(url: str) -> httpx.AsyncClient:
+    """
+    URL 호스트의 공유 async 클라이언트 (닫지 말 것)
+
+    AsyncClient는 만든 이벤트 루프에서만 쓸 수 있어 루프마다 따로 두고,
+    각 루프의 aclose_all()이 자기 클라이언트를 닫는다.
+    """
+    key = (asyncio.get_running_loop(), host_of(url))
+    with _lock:
+        client = _async_clients.get(key)
+        if client is None or client.is_closed:
+            _prune_closed_loops()
+            client = _async_clients[key] = _build_async_client(key[1])
+        return client
+
+
+def _prune_closed_loops() -> None:
+    """aclose_all 없이 끝난 루프의 클라이언트 제거 (_lock 안에서 호출, 닫힌 루프에서는 aclose 불가)"""
+    stale = [key for key in _async_clients if key[0].is_closed()]
+    for key in stale:
+        del _async_clients[key]
+    if stale:
+        logger.debug(f"닫힌 이벤트 루프의 async 클라이언트 {len(stale)}개 제거")
+
+
+def client_metrics() -> Dict[str, Dict[str, Any]]:
+    """호스트별 연결 재사용 지표"""
+    with _lock:
+        items = list(_metrics.items())
+    return {host: {**metrics.snapshot(), "http2": _settings(host)["http2"]} for host, metrics in items}
+
+
+def close_all() -> None:
+    """sync 클라이언트 종료 (프로세스 종료 시)"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"HTTP 클라이언트 종료 실패: {e}")
+
+
+async def aclose_all() -> None:
+    """현재 이벤트 루프에서 만든 async 클라이언트 종료"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        mine = [key for key in _async_clients if key[0] is loop]
+        clients = [_async_clients.pop(key) for key in mine]
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"HTTP 클라이언트 종료 실패: {e}")
@@ -0,0 +1,264 @@
+"""뉴스 스토리 색인 (날짜/배치를 넘는 같은 이슈 묶기)
+
+remove_duplicate_news는 한 후보 목록 안에서만 중복을 지운다.
+여기서는 저장되는 기사마다 스토리(news_stories)를 정해 NewsDaily.story_id에 남기고,
+랭킹/속보 배치가 스토리당 1건만, 이미 보낸 스토리는 다시 보내지 않게 한다.
+
+배정은 과거 기사와 일일이 비교하지 않고 역색인(news_story_keys)으로 후보 스토리를 찾는다.
+- t:<topic_key 30자>
+- i:<인물 이슈 키>   (person:이름:사건)
+- m<밴드>:<해시>     (제목 단어 MinHash LSH, 8밴드 × 2행 → Jaccard 0.5에서 약 90% 적중)
+후보 스토리의 대표/최근 제목과 비교해 같은 이슈로 확인되면 묶고, 아니면 새 스토리를 만든다.
+STORY_TTL보다 오래 안 보인 키는 prune_story_index로 지운다.
+"""
+import logging
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.app.db.models import NewsDaily, NewsStory, NewsStoryKey
+from backend.app.utils.dedup import title_features
+
+logger = logging.getLogger(__name__)
+
+KST_TZ = timezone(timedelta(hours=9))
+STORY_TTL = timedelta(days=7)    # 이보다 오래 안 보인 스토리는 새 기사와 묶지 않음
+LSH_BANDS = 8
+LSH_ROWS = 2
+MAX_CANDIDATES = 8               # 키 적중 수 상위 몇 개 스토리만 제목 확인
+MAX_TOPIC_KEYS = 20
+MAX_ENTITIES = 20
+KEY_MAX_LENGTH = 120
+SAME_STORY_JACCARD = 0.5
+SAME_STORY_RATIO = 0.78
+
+_SEEDS = [f"{i}:".encode() for i in range(LSH_BANDS * LSH_ROWS)]
+
+
+def _now() -> datetime:
+    """스토리 시각은 published_at과 같이 KST naive"""
+    return datetime.now(KST_TZ).replace(tzinfo=None)
+
+
+def minhash_keys(words: Iterable[str]) -> List[str]:
+    """단어 집합 MinHash → 밴드별 LSH 키 (단어 2개 미만이면 없음)"""
+    encoded = [w.encode() for w in set(words)]
+    if len(encoded) < 2:
+        return []
+    signature = [min(zlib.crc32(seed + w) for w in encoded) for seed in _SEEDS]
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        keys.append(f"m{band}:" + "".join(f"{h:08x}" for h in rows))
+    return keys
+
+
+def story_keys(title: str) -> List[str]:
+    features = title_features(title)
+    keys = []
+    if features.short_key:
+        keys.append(f"t:{features.short_key}")
+    if features.issue_key.startswith("person:"):
+        keys.append(f"i:{features.issue_key}"[:KEY_MAX_LENGTH])
+    keys.extend(minhash_keys(features.words))
+    return keys
+
+
+def same_story(title1: str, title2: str) -> bool:
+    """
+    같은 이슈인지 확인 (remove_duplicate_news보다 엄격)
+
+    날짜를 넘어 묶으므로 '같은 인물 후보 단어 하나'나 '엔티티 일부'처럼
+    하루 안에서만 통하는 느슨한 규칙은 쓰지 않는다.
+    """
+    f1, f2 = title_features(title1), title_features(title2)
+    if f1.short_key and f1.short_key == f2.short_key:
+        return True
+    if f1.issue_key.startswith("person:") and f1.issue_key == f2.issue_key:
+        return True
+    if len(f1.words) >= 3 and len(f2.words) >= 3:
+        if len(f1.words & f2.words) / len(f1.words | f2.words) >= SAME_STORY_JACCARD:
+            return True
+    if f1.clean and f2.clean:
+        matcher = SequenceMatcher(None, f1.clean, f2.clean)
+        if matcher.quick_ratio() >= SAME_STORY_RATIO and matcher.ratio() >= SAME_STORY_RATIO:
+            return True
+    return False
+
+
+def _candidate_stories(db: Session, keys: Sequence[str], since: datetime) -> List[NewsStory]:
+    """키 적중 수가 많은 순으로 후보 스토리 (역색인 조회 1번 + 스토리 조회 1번)"""
+    if not keys:
+        return []
+    hits = (
+        db.query(NewsStoryKey.story_id, func.count(NewsStoryKey.id).label("hits"))
+        .filter(NewsStoryKey.key.in_(keys), NewsStoryKey.last_seen >= since)
+        .group_by(NewsStoryKey.story_id)
+        .order_by(func.count(NewsStoryKey.id).desc(), NewsStoryKey.story_id.desc())
+        .limit(MAX_CANDIDATES)
+        .all()
+    )
+    if not hits:
+        return []
+    order = {story_id: i for i, (story_id, _) in enumerate(hits)}
+    stories = db.query(NewsStory).filter(NewsStory.id.in_(order)).all()
+    return sorted(stories, key=lambda story: order[story.id])
+
+
+def _touch_keys(db: Session, story_id: int, keys: Sequence[str], now: datetime) -> None:
+    existing = {
+        row.key: row
+        for row in db.query(NewsStoryKey).filter(NewsStoryKey.story_id == story_id, NewsStoryKey.key.in_(keys))
+    }
+    for key in dict.fromkeys(keys):
+        row = existing.get(key)
+        if row is None:
+            db.add(NewsStoryKey(key=key, story_id=story_id, last_seen=now))
+        elif row.last_seen is None or row.last_seen < now:
+            row.last_seen = now
+
+
+def _merge(values: List, new: Iterable, limit: int) -> List:
+    merged = list(values or [])
+    for value in new:
+        if value and value not in merged:
+            merged.append(value)
+    return merged[-limit:]
+
+
+def assign_story(db: Session, news, now: datetime = None) -> NewsStory:
+    """기사 하나를 기존 스토리에 묶거나 새 스토리 생성 (news.story_id 설정, flush까지)"""
+    now = now or _now()
+    keys = story_keys(news.title)
+    story = None
+    for candidate in _candidate_stories(db, keys, now - STORY_TTL):
+        if same_story(news.title, candidate.signature_title) or (
+            candidate.latest_title and same_story(news.title, candidate.latest_title)
+        ):
+            story = candidate
+            break
+
+    entities = sorted(title_features(news.title).entities)
+    if story is None:
+        story = NewsStory(
+            signature_title=news.title,
+            latest_title=news.title,
+            topic_keys=[news.topic_key] if news.topic_key else [],
+            entities=entities[:MAX_ENTITIES],
+            item_count=1,
+            first_seen=now,
+            last_seen=now,
+        )
+        db.add(story)
+        db.flush()
+    else:
+        story.latest_title = news.title
+        story.topic_keys = _merge(story.topic_keys, [news.topic_key], MAX_TOPIC_KEYS)
+        story.entities = _merge(story.entities, entities, MAX_ENTITIES)
+        story.item_count = (story.item_count or 0) + 1
+        story.last_seen = max(story.last_seen or now, now)
+
+    _touch_keys(db, story.id, keys, now)
+    # 같은 배치의 다음 기사가 이 스토리의 키를 찾을 수 있게 flush
+    db.flush()
+    news.story_id = story.id
+    return story
+
+
+def assign_stories(db: Session, rows: Sequence[NewsDaily]) -> int:
+    """저장할 행들의 스토리 배정 (실패해도 기사 저장은 막지 않음) → 새 스토리 수"""
+    now = _now()
+    created = 0
+    for row in rows:
+        try:
+            with db.begin_nested():
+                # 백필 시에도 기사 시점 기준으로 TTL/최근 본 시각을 맞춤
+                story = assign_story(db, row, min(row.published_at or now, now))
+            if story.item_count == 1:
+                created += 1
+        except Exception as e:
+            logger.warning(f"스토리 배정 실패 ({row.title[:30]}): {e}")
+    return created
+
+
+def _stories_by_id(db: Session, news_list: Sequence) -> Dict[int, NewsStory]:
+    ids = {getattr(news, "story_id", None) for news in news_list} - {None}
+    if not ids:
+        return {}
+    return {story.id: story for story in db.query(NewsStory).filter(NewsStory.id.in_(ids))}
+
+
+def one_per_story(
+    db: Session,
+    news_list: Sequence,
+    seen: Callable[[NewsStory], bool] = lambda story: False,
+) -> Tuple[List, List]:
+    """
+    스토리당 첫 항목만 남기고, seen(story)인 스토리는 제외
+
+    news_list는 우선순위 순이어야 한다. story_id가 없는 항목(색인 이전 기사)은 그대로 둔다.
+
+    Returns:
+        (남긴 항목, 제외된 항목)
+    """
+    stories = _stories_by_id(db, news_list)
+    kept, dropped = [], []
+    taken = set()
+    for news in news_list:
+        story_id = getattr(news, "story_id", None)
+        story = stories.get(story_id)
+        if story is None:
+            kept.append(news)
+            continue
+        if story_id in taken or seen(story):
+            dropped.append(news)
+            continue
+        taken.add(story_id)
+        kept.append(news)
+    return kept, dropped
+
+
+def ranked_recently(today: date, days: int) -> Callable[[NewsStory], bool]:
+    """오늘 이전 days일 안에 TOP에 들었던 스토리"""
+    since = today - timedelta(days=days)
+    return lambda story: story.last_ranked_date is not None and since <= story.last_ranked_date < today
+
+
+def mark_ranked(db: Session, news_list: Sequence, today: date) -> None:
+    for story in _stories_by_id(db, news_list).values():
+        story.last_ranked_date = today
+
+
+def mark_alerted(db: Session, news_list: Sequence, now: datetime = None) -> None:
+    now = now or _now()
+    for story in _stories_by_id(db, news_list).values():
+        story.last_alerted_at = now
+
+
+def prune_story_index(db: Session, now: datetime = None) -> int:
+    """STORY_TTL보다 오래 안 보인 역색인 키 삭제 (스토리 행은 story_id 참조용으로 유지) → 삭제 수"""
+    now = now or _now()
+    deleted = (
+        db.query(NewsStoryKey)
+        .filter(NewsStoryKey.last_seen < now - STORY_TTL)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def backfill_stories(db: Session, since: date) -> int:
+    """story_id가 없는 since 이후 기사 색인 (발행 순) → 배정한 기사 수"""
+    rows = (
+        db.query(NewsDaily)
+        .filter(NewsDaily.date >= since, NewsDaily.story_id.is_(None))
+        .order_by(NewsDaily.published_at.asc(), NewsDaily.id.asc())
+        .all()
+    )
+    assign_stories(db, rows)
+    db.commit()
+    return len(rows)
@@ -0,0 +1,121 @@
+"""대용량 조회 스트리밍 유틸리티 (keyset 페이지네이션 + NDJSON/CSV 출력)"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy.sql import Select
+
+from backend.app.db.session import SessionLocal
+
+# 서버 사이드 커서에서 한 번에 가져올 행 수
+STREAM_BATCH_SIZE = 500
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def parse_fields(raw: Optional[str], allowed: Sequence[str], required: Sequence[str]) -> List[str]:
+    """
+    `fields=a,b,c` 쿼리를 컬럼 목록으로 변환
+
+    - 미지정 시 allowed 전체
+    - keyset 키(required)는 이어받기를 위해 항상 포함
+    - 알 수 없는 컬럼은 ValueError
+    """
+    if not raw:
+        return list(allowed)
+
+    requested = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)}")
+
+    fields = [f for f in required if f not in requested]
+    fields.extend(requested)
+    return fields
+
+
+def iter_rows(stmt: Select, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    SELECT 결과를 서버 사이드 커서(yield_per)로 한 행씩 반환
+
+    StreamingResponse 본문은 요청 의존성(get_db)이 닫힌 뒤에 실행되므로
+    여기서 별도 세션을 열고 스트림이 끝나면 닫는다.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        for row in result.mappings():
+            yield dict(row)
+    finally:
+        db.close()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_ndjson(rows: Iterable[Dict[str, Any]], batch_size: int = STREAM_BATCH_SIZE) -> Iterator[str]:
+    """행을 NDJSON(한 줄에 JSON 1개)으로 인코딩 (batch_size 단위로 묶어 전송)"""
+    buffer: List[str] = []
+    for row in rows:
+        buffer.append(json.dumps(row, ensure_ascii=False, default=_json_default))
+        if len(buffer) >= batch_size:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=_json_default)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_csv(
+    rows: Iterable[Dict[str, Any]],
+    fields: Sequence[str],
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[str]:
+    """행을 CSV로 인코딩 (헤더 1줄 + batch_size 단위 청크, JSON 컬럼은 문자열로 직렬화)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+
+    count = 0
+    for row in rows:
+        writer.writerow([_csv_cell(row.get(f)) for f in fields])
+        count += 1
+        if count % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining
+
+
+def stream_rows(
+    stmt: Select,
+    fields: Sequence[str],
+    fmt: str,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[str]:
+    """SELECT → 인코딩된 청크 스트림"""
+    rows = iter_rows(stmt, batch_size)
+    if fmt == "csv":
+        return encode_csv(rows, fields, batch_size)
+    return encode_ndjson(rows, batch_size)
@@ -0,0 +1,148 @@
+"""API 응답 직렬화 벤치마크 (ORM + pydantic vs 컬럼 projection + orjson)
+
+임시 SQLite DB에 합성 데이터를 넣고 /api/markets, /api/news 경로를
+기존 방식과 새 방식으로 각각 만들어 소요 시간을 비교한다.
+
+사용법:
+    python backend/scripts/bench_api_serialization.py --markets 2000 --news 2000 --repeat 20
+"""
+import sys
+import os
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+_tmp_dir = tempfile.mkdtemp(prefix="bench_api_")
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp_dir, 'bench.db')}"
+
+import orjson
+from sqlalchemy import select
+
+from backend.app.db.session import SessionLocal, Base, engine
+from backend.app.db.models import MarketDaily, NewsDaily
+from backend.app.main import (
+    MarketDailyResponse,
+    NewsItemResponse,
+    MARKET_RESPONSE_COLUMNS,
+    NEWS_SELECT_COLUMNS,
+    market_row_to_dict,
+    news_row_to_dict,
+)
+from backend.app.utils.dedup import remove_duplicate_news
+
+
+def seed(db, n_markets: int, n_news: int) -> None:
+    """합성 시세/뉴스 데이터 생성"""
+    rng = random.Random(42)
+    base = date(2020, 1, 1)
+    for i in range(n_markets):
+        db.add(MarketDaily(
+            date=base + timedelta(days=i),
+            usd_krw=1300 + rng.random() * 100,
+            btc_usd=60000 + rng.random() * 5000,
+            gold_usd=2000 + rng.random() * 50,
+            silver_usd=25 + rng.random(),
+            kospi_index=2500 + rng.random() * 100,
+            kospi_top5=[{"name": f"종목{j}", "price": 70000 + j, "change_rate": 0.5} for j in range(5)],
+            exchange_rates={"USD": 1350.0, "JPY": 9.1, "EUR": 1450.2},
+            summary_comment="합성 데이터",
+        ))
+    today = date.today()
+    for i in range(n_news):
+        db.add(NewsDaily(
+            date=today,
+            source="bench",
+            title=f"벤치마크 기사 {i} 제목 {rng.randint(0, 10**6)}",
+            url=f"https://example.com/{i}",
+            category=rng.choice(["society", "economy", "culture", "entertainment"]),
+            keywords="벤치,마크",
+            hot_score=rng.random() * 100,
+            created_at=datetime.now(),
+        ))
+    db.commit()
+
+
+def markets_legacy(db) -> bytes:
+    rows = db.query(MarketDaily).order_by(MarketDaily.date.desc()).all()
+    items = [MarketDailyResponse.model_validate(r).model_dump(mode="json") for r in rows]
+    return json.dumps(items, ensure_ascii=False).encode("utf-8")
+
+
+def markets_fast(db) -> bytes:
+    rows = db.execute(select(*MARKET_RESPONSE_COLUMNS).order_by(MarketDaily.date.desc())).all()
+    return orjson.dumps([market_row_to_dict(r) for r in rows])
+
+
+def news_legacy(db) -> bytes:
+    news = (
+        db.query(NewsDaily)
+        .order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())
+        .all()
+    )
+    news = remove_duplicate_news(news)[:10]
+    items = [NewsItemResponse.model_validate(n).model_dump(mode="json") for n in news]
+    return json.dumps(items, ensure_ascii=False).encode("utf-8")
+
+
+def news_fast(db) -> bytes:
+    news = db.execute(
+        select(*NEWS_SELECT_COLUMNS).order_by(NewsDaily.hot_score.desc(), NewsDaily.created_at.desc())
+    ).all()
+    news = remove_duplicate_news(news)[:10]
+    return orjson.dumps([news_row_to_dict(n) for n in news])
+
+
+def timeit(fn, repeat: int) -> float:
+    """repeat회 실행 중 최솟값(ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            fn(db)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            db.close()
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답 직렬화 벤치마크")
+    parser.add_argument("--markets", type=int, default=2000, help="MarketDaily 행 수")
+    parser.add_argument("--news", type=int, default=2000, help="NewsDaily 행 수")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed(db, args.markets, args.news)
+    finally:
+        db.close()
+
+    print("=" * 60)
+    print(f"API 직렬화 벤치마크 (markets={args.markets}, news={args.news}, repeat={args.repeat})")
+    print("=" * 60)
+
+    for name, legacy, fast in [
+        ("/api/markets", markets_legacy, markets_fast),
+        ("/api/news", news_legacy, news_fast),
+    ]:
+        db = SessionLocal()
+        try:
+            same = json.loads(legacy(db)) == json.loads(fast(db))
+        finally:
+            db.close()
+        legacy_ms = timeit(legacy, args.repeat)
+        fast_ms = timeit(fast, args.repeat)
+        print(f"{name:15s} legacy {legacy_ms:8.2f}ms | fast {fast_ms:8.2f}ms | "
+              f"x{legacy_ms / fast_ms:.2f} | 결과 동일: {same}")
+
+
+if __name__ == "__main__":
+    main()
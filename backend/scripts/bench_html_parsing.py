@@ -0,0 +1,237 @@
+"""스크래핑 HTML 파싱 벤치마크 (BeautifulSoup 전체 트리 vs lxml 부분 파싱)
+
+네이버 시가총액 / 동행복권 회차 결과 / KoreaGoldX 시세 페이지 픽스처를
+기존 방식(BeautifulSoup 전체 파싱 + CSS select)과 html_extract 방식으로 각각 파싱해
+페이지당 소요 시간과 최대 메모리(tracemalloc)를 비교하고 결과가 같은지 확인한다.
+(tracemalloc은 파이썬 힙만 집계 → lxml C 트리 메모리는 빠진 값이다)
+
+픽스처는 실제 페이지 구조를 흉내 낸 합성 HTML을 쓰고,
+--fixtures 디렉터리에 저장한 실제 페이지(market_sum.html, lotto_result.html, koreagoldx.html)가
+있으면 그 파일을 대신 쓴다.
+
+사용법:
+    python backend/scripts/bench_html_parsing.py --repeat 50
+    python backend/scripts/bench_html_parsing.py --fixtures ./saved_pages
+"""
+import sys
+import os
+import argparse
+import random
+import re
+import statistics
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from bs4 import BeautifulSoup
+
+from backend.app.collectors.html_extract import parse_lotto_win_result, parse_naver_market_sum
+from backend.app.collectors.koreagoldx_collector import _to_int, parse_koreagoldx
+
+
+# ---------------------------------------------------------------------------
+# 합성 픽스처
+# ---------------------------------------------------------------------------
+
+def _page(body: str, rng: random.Random) -> str:
+    """헤더/메뉴/스크립트가 붙은 페이지 (실제 페이지처럼 대상 영역 밖이 대부분)"""
+    menu = "".join(
+        f'<li class="menu_item"><a href="/m/{i}">메뉴 {i}</a><ul>'
+        + "".join(f'<li><a href="/m/{i}/{j}">하위 {j}</a></li>' for j in range(8))
+        + "</ul></li>"
+        for i in range(40)
+    )
+    script = "var data = [" + ",".join(str(rng.random()) for _ in range(2000)) + "];"
+    footer = "".join(f'<p class="footer_txt">안내 문구 {i} ' + "가나다라 " * 10 + "</p>" for i in range(150))
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>bench</title>'
+        f"<script>{script}</script></head><body>"
+        f'<div id="header"><ul class="gnb">{menu}</ul></div>'
+        f'<div id="content">{body}</div>'
+        f'<div id="footer">{footer}</div></body></html>'
+    )
+
+
+def market_sum_fixture(rng: random.Random) -> str:
+    rows = []
+    for i in range(50):
+        if i % 5 == 0:
+            rows.append('<tr><td colspan="13" class="blank_08"></td></tr>')
+        price = rng.randint(10_000, 900_000)
+        rows.append(
+            "<tr>"
+            f'<td class="no">{i + 1}</td>'
+            f'<td><a href="/item/main.naver?code={i:06d}" class="tltle">종목{i}</a></td>'
+            f'<td class="number">{price:,}</td>'
+            f'<td class="number"><img src="ico_up.gif"><span class="tah p11 red02">\n\t\t{rng.randint(0, 9000):,}\n\t</span></td>'
+            f'<td class="number"><span class="tah p11 red01">\n\t\t+{rng.random() * 5:.2f}%\n\t</span></td>'
+            + "".join(f'<td class="number">{rng.randint(1, 10**7):,}</td>' for _ in range(7))
+            + '<td class="center"><a href="#">토론</a></td>'
+            "</tr>"
+        )
+    header = "<tr>" + "".join(f"<th>컬럼{i}</th>" for i in range(13)) + "</tr>"
+    table = f'<table class="type_2" summary="시가총액"><thead>{header}</thead><tbody>{"".join(rows)}</tbody></table>'
+    side = "".join(f'<table class="type_5"><tr><td>부가 정보 {i}</td></tr></table>' for i in range(30))
+    return _page(f'<div class="box_type_l">{table}</div>{side}', rng)
+
+
+def lotto_result_fixture(rng: random.Random) -> str:
+    numbers = sorted(rng.sample(range(1, 46), 7))
+    bonus = numbers.pop()
+    balls = "".join(f'<span class="ball_645 lrg ball{(n - 1) // 10 + 1}">{n}</span>' for n in numbers)
+    section = (
+        '<div class="win_result">'
+        '<h4><strong>1150회</strong> 당첨결과</h4>'
+        '<p class="desc">(2024년 12월 14일 추첨)</p>'
+        '<div class="nums">'
+        f'<div class="num win"><strong>당첨번호</strong><p>{balls}</p></div>'
+        f'<div class="num bonus"><strong>보너스</strong><p><span class="ball_645 lrg ball1">{bonus}</span></p></div>'
+        '</div></div>'
+    )
+    prize = "".join(
+        f"<tr><td>{rank}등</td><td>{rng.randint(10**6, 10**10):,}원</td><td>{rng.randint(1, 10**5):,}</td></tr>"
+        for rank in range(1, 6)
+    )
+    return _page(section + f'<table class="tbl_data tbl_data_col">{prize}</table>', rng)
+
+
+def koreagoldx_fixture(rng: random.Random) -> str:
+    rows = []
+    for i in range(150):
+        cells = "".join(
+            f'<div class="tabulator-cell" role="gridcell" tabulator-field="{field}">{rng.randint(10**5, 10**6):,}</div>'
+            for field in ("s_pure", "p_pure", "p_18k", "p_14k")
+        )
+        rows.append(
+            f'<div class="tabulator-row tabulator-selectable tabulator-row-{"even" if i % 2 else "odd"}" role="row">'
+            f'<div class="tabulator-cell" role="gridcell" tabulator-field="date">2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}</div>'
+            f"{cells}</div>"
+        )
+    table = (
+        '<div class="tabulator" role="grid"><div class="tabulator-header"></div>'
+        f'<div class="tabulator-tableHolder"><div class="tabulator-table">{"".join(rows)}</div></div></div>'
+    )
+    return _page(table, rng)
+
+
+# ---------------------------------------------------------------------------
+# 기존 방식 (BeautifulSoup 전체 트리)
+# ---------------------------------------------------------------------------
+
+def market_sum_legacy(html: str) -> list:
+    soup = BeautifulSoup(html, "html.parser")
+    top5 = []
+    for row in soup.select("table.type_2 tr"):
+        cols = row.select("td")
+        if len(cols) < 10:
+            continue
+        name = cols[1].get_text(strip=True)
+        if not name:
+            continue
+        top5.append({
+            "name": name,
+            "price": cols[2].get_text(strip=True),
+            "change": cols[3].get_text(strip=True),
+            "change_rate": cols[4].get_text(strip=True),
+        })
+        if len(top5) >= 5:
+            break
+    return top5
+
+
+def lotto_result_legacy(html: str):
+    soup = BeautifulSoup(html, "html.parser")
+    draw_no = soup.select_one(".win_result h4 strong")
+    desc = soup.select_one(".win_result .desc")
+    if not draw_no or not desc:
+        return None
+    date_match = re.search(r"(\d{4})년 (\d{2})월 (\d{2})일", desc.text)
+    numbers = [int(e.text.strip()) for e in soup.select(".win_result .num.win .ball_645")]
+    bonus = int(soup.select_one(".win_result .num.bonus .ball_645").text.strip())
+    return (draw_no.text, date_match.groups() if date_match else None, numbers, bonus)
+
+
+def lotto_result_new(html: str):
+    section = parse_lotto_win_result(html)
+    if not section or section["draw_no_text"] is None or section["desc"] is None:
+        return None
+    date_match = re.search(r"(\d{4})년 (\d{2})월 (\d{2})일", section["desc"])
+    numbers = [int(n) for n in section["numbers"]]
+    return (section["draw_no_text"], date_match.groups() if date_match else None, numbers, int(section["bonus"]))
+
+
+def koreagoldx_legacy(html: str) -> list:
+    soup = BeautifulSoup(html, "lxml")
+    data = []
+    for row in soup.select("div.tabulator-row"):
+        get = lambda f: row.select_one(f'div.tabulator-cell[tabulator-field="{f}"]')
+        date_cell, s_pure, p_pure, p_18k, p_14k = (get(f) for f in ("date", "s_pure", "p_pure", "p_18k", "p_14k"))
+        if not date_cell or not s_pure or not p_pure:
+            continue
+        data.append({
+            "date": date_cell.text.strip(),
+            "buy_3_75g": _to_int(s_pure.text),
+            "sell_3_75g": _to_int(p_pure.text),
+            "sell_18k": _to_int(p_18k.text) if p_18k else None,
+            "sell_14k": _to_int(p_14k.text) if p_14k else None,
+        })
+    return data
+
+
+# ---------------------------------------------------------------------------
+
+def measure(fn, html: str, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(html)
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_ms": statistics.median(times) * 1000, "peak_kb": peak / 1024}
+
+
+def load_fixture(fixtures_dir, name: str, builder, rng: random.Random) -> tuple:
+    if fixtures_dir:
+        path = os.path.join(fixtures_dir, name)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return f.read(), path
+    return builder(rng), "합성"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래핑 HTML 파싱 벤치마크")
+    parser.add_argument("--repeat", type=int, default=30, help="페이지별 반복 횟수")
+    parser.add_argument("--fixtures", default=None, help="실제 페이지 HTML 디렉터리")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    cases = [
+        ("네이버 시가총액", "market_sum.html", market_sum_fixture, market_sum_legacy,
+         lambda html: parse_naver_market_sum(html, limit=5)),
+        ("동행복권 회차", "lotto_result.html", lotto_result_fixture, lotto_result_legacy, lotto_result_new),
+        ("KoreaGoldX 시세", "koreagoldx.html", koreagoldx_fixture, koreagoldx_legacy, parse_koreagoldx),
+    ]
+
+    print(f"{'페이지':<16}{'크기':>9}{'방식':>12}{'중앙값(ms)':>12}{'최대 메모리(KB)':>17}")
+    print("-" * 70)
+    for label, filename, builder, legacy, new in cases:
+        html, source = load_fixture(args.fixtures, filename, builder, rng)
+        same = legacy(html) == new(html)
+        size = f"{len(html.encode()) / 1024:.0f}KB"
+        results = [("BeautifulSoup", measure(legacy, html, args.repeat)),
+                   ("lxml 부분", measure(new, html, args.repeat))]
+        for name, r in results:
+            print(f"{label:<16}{size:>9}{name:>14}{r['median_ms']:>12.2f}{r['peak_kb']:>17.0f}")
+        speedup = results[0][1]["median_ms"] / max(results[1][1]["median_ms"], 1e-9)
+        print(f"{'':<16}{source:>9}  → {speedup:.1f}배, 결과 {'일치' if same else '불일치 ⚠️'}")
+    print()
+
+
+if __name__ == '__main__':
+    main()
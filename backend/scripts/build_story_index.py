@@ -0,0 +1,42 @@
+"""스토리 색인 백필 (story_id가 없는 최근 기사에 스토리 배정)
+
+스토리 색인 도입 전에 저장된 기사나, 배정에 실패한 기사를 발행 순으로 색인한다.
+
+사용법:
+    python backend/scripts/build_story_index.py --days 7
+"""
+import sys
+import os
+import argparse
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from sqlalchemy import func
+
+from backend.app.db.models import NewsDaily, NewsStory
+from backend.app.db.session import SessionLocal
+from backend.app.utils.story_index import backfill_stories
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스토리 색인 백필")
+    parser.add_argument("--days", type=int, default=7, help="오늘 포함 최근 며칠")
+    args = parser.parse_args()
+
+    since = datetime.now(timezone(timedelta(hours=9))).date() - timedelta(days=args.days - 1)
+    db = SessionLocal()
+    try:
+        indexed = backfill_stories(db, since)
+        stories = (
+            db.query(func.count(func.distinct(NewsDaily.story_id)))
+            .filter(NewsDaily.date >= since, NewsDaily.story_id.isnot(None))
+            .scalar()
+        )
+        print(f"✅ {since} 이후 기사 {indexed}개 색인 (스토리 {stories}개, 전체 스토리 {db.query(NewsStory).count()}개)")
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""핫 쿼리 실행 계획 확인 (기대 인덱스를 쓰는지)
+
+오늘 요약/카테고리 TOP/속보 배치/최신 시장 데이터 조회를 EXPLAIN해서
+각각 복합/부분 인덱스로 처리되는지 확인한다. 하나라도 실패하면 종료 코드 1.
+
+사용법:
+    python backend/scripts/check_query_plans.py
+    python backend/scripts/check_query_plans.py --create      # 인덱스 먼저 생성
+    python backend/scripts/check_query_plans.py --no-force    # PostgreSQL planner 기본 선택 그대로
+"""
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from backend.app.db.session import Base, engine
+from backend.app.db.indexes import ensure_indexes, explain_hot_queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 쿼리 실행 계획 확인")
+    parser.add_argument("--create", action="store_true", help="테이블/인덱스가 없으면 먼저 생성")
+    parser.add_argument(
+        "--no-force", action="store_true",
+        help="PostgreSQL에서 enable_seqscan=off 없이 확인 (데이터가 충분한 DB에서)",
+    )
+    args = parser.parse_args()
+
+    if args.create:
+        Base.metadata.create_all(bind=engine)
+        ensure_indexes(engine)
+
+    print(f"DB: {engine.dialect.name}")
+    failed = 0
+    for name, result in explain_hot_queries(engine, force_index=not args.no_force).items():
+        status = "PASS" if result["error"] is None else f"FAIL - {result['error']}"
+        print(f"\n[{name}] 기대 인덱스 {'/'.join(result['indexes'])}: {status}")
+        for line in result["plan"]:
+            print(f"    {line}")
+        if result["error"] is not None:
+            failed += 1
+
+    if failed:
+        print(f"\n❌ {failed}개 쿼리가 기대 인덱스를 쓰지 않음")
+        sys.exit(1)
+    print("\n✅ 모든 핫 쿼리가 인덱스로 처리됨")
+
+
+if __name__ == '__main__':
+    main()
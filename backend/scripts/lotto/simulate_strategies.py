@@ -0,0 +1,81 @@
+"""로또 전략 Monte Carlo 시뮬레이션 (현재 통계/모델 기준)
+
+사용법:
+    python backend/scripts/lotto/simulate_strategies.py --draws 400000 --baseline 10000000 --seed 42
+    python backend/scripts/lotto/simulate_strategies.py --no-ml --json
+"""
+import sys
+import os
+import argparse
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from backend.app.db.session import SessionLocal
+from backend.app.services.lotto.monte_carlo import (
+    DEFAULT_BASELINE_EVALUATIONS,
+    DEFAULT_SYNTHETIC_DRAWS,
+    run_current_simulation,
+)
+
+
+def print_report(report: dict) -> None:
+    theory = report['theoretical']
+    base = report['baseline']
+
+    print("=" * 80)
+    print("🎲 로또 전략 Monte Carlo 시뮬레이션")
+    print("=" * 80)
+    print(f"합성 회차: {report['synthetic_draws']:,}회 / 전체 평가: {report['total_evaluations']:,}건 "
+          f"/ {report['elapsed_sec']:.2f}초 (seed={report['seed']})")
+    print()
+    print(f"이론값(초기하): 줄당 평균 {theory['mean_matches']:.4f}개, 3개 이상 {theory['p_3plus'] * 100:.3f}%")
+    lo, hi = base['mean_matches']['ci95']
+    print(f"무작위 기준선: 줄당 평균 {base['mean_matches']['mean']:.4f}개 [{lo:.4f}, {hi:.4f}], "
+          f"3개 이상 {base['p_3plus'] * 100:.3f}%")
+    print()
+    print(f"{'전략':<10}{'줄':>4}{'평균 일치':>12}{'95% CI':>22}{'3개 이상':>11}{'차이':>10}{'z':>8}")
+    print("-" * 80)
+    for name, r in report['strategies'].items():
+        lo, hi = r['mean_matches']['ci95']
+        warn = f"  ⚠️ 6개 미만 줄 {r['short_lines']}개" if r['short_lines'] else ""
+        print(f"{name:<10}{r['lines']:>4}{r['mean_matches']['mean']:>12.4f}"
+              f"{f'[{lo:.4f}, {hi:.4f}]':>22}{r['p_3plus'] * 100:>10.3f}%"
+              f"{r['vs_baseline']['mean_diff']:>+10.4f}{r['vs_baseline']['z']:>8.2f}{warn}")
+    print()
+    print("|z| < 1.96 이면 무작위 표와 통계적으로 구분되지 않음")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로또 전략 Monte Carlo 시뮬레이션")
+    parser.add_argument("--draws", type=int, default=DEFAULT_SYNTHETIC_DRAWS, help="합성 회차 수")
+    parser.add_argument("--baseline", type=int, default=DEFAULT_BASELINE_EVALUATIONS, help="무작위 표 평가 수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (줄 생성/추첨 모두 고정)")
+    parser.add_argument("--no-ml", action="store_true", help="ML 5줄 제외")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = run_current_simulation(
+            db,
+            n_draws=args.draws,
+            baseline_evaluations=args.baseline,
+            seed=args.seed,
+            include_ml=not args.no_ml,
+        )
+    finally:
+        db.close()
+
+    if report is None:
+        print("❌ 통계 캐시가 없습니다. 먼저 로또 데이터를 수집하세요.")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""뉴스 보관 정리 수동 실행 (스케줄러 job_news_retention과 같은 작업)
+
+핫 기간(NEWS_HOT_DAYS)이 지난 날짜를 news_archive로 압축하고 news_daily에서 날짜 단위로 지운다.
+--partition을 주면 PostgreSQL news_daily를 날짜 파티션 테이블로 변환한다 (1회, 되돌릴 수 없음 - 먼저 백업).
+스케줄러 작업은 변환하지 않고, 이미 파티션 테이블이면 파티션만 관리한다.
+
+사용법:
+    python backend/scripts/news_retention.py --dry-run
+    python backend/scripts/news_retention.py --hot-days 14
+    python backend/scripts/news_retention.py --partition
+    python backend/scripts/news_retention.py --show 2026-09-01
+"""
+import sys
+import os
+import argparse
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from backend.app.db.session import Base, SessionLocal, engine
+from backend.app.db.retention import (
+    hot_cutoff,
+    is_partitioned,
+    load_archived_news,
+    pending_days,
+    run_news_retention,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 보관 정리 (아카이브 압축 + 날짜 단위 삭제)")
+    parser.add_argument("--hot-days", type=int, default=None, help="news_daily에 남길 일수 (기본 NEWS_HOT_DAYS)")
+    parser.add_argument("--archive-days", type=int, default=None, help="아카이브 보관 일수 (0 = 영구, 기본 NEWS_ARCHIVE_DAYS)")
+    parser.add_argument("--partition", action="store_true", help="PostgreSQL news_daily를 날짜 파티션 테이블로 변환")
+    parser.add_argument("--dry-run", action="store_true", help="아카이브 대상 날짜만 출력")
+    parser.add_argument("--show", type=date.fromisoformat, default=None, help="아카이브된 날짜의 기사 출력 (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    if args.show:
+        db = SessionLocal()
+        try:
+            items = load_archived_news(db, args.show)
+        finally:
+            db.close()
+        print(f"{args.show} 아카이브 기사 {len(items)}개")
+        for item in items:
+            print(f"  [{item['category']}] {item['hot_score']:>4} {item['title']}")
+        return
+
+    cutoff = hot_cutoff(hot_days=args.hot_days)
+    if args.dry_run:
+        with engine.connect() as conn:
+            days = pending_days(conn, cutoff)
+            partitioned = is_partitioned(conn)
+        print(f"DB: {engine.dialect.name} (파티션 {'사용' if partitioned else '미사용'}), 핫 기간 시작 {cutoff}")
+        print(f"아카이브 대상 {len(days)}일: {', '.join(str(day) for day in days) or '-'}")
+        return
+
+    summary = run_news_retention(
+        engine, hot_days=args.hot_days, archive_days=args.archive_days, convert=args.partition,
+    )
+    if summary["converted"]:
+        print(f"🔀 news_daily 파티션 변환: {summary['converted']}행 이동")
+    if summary["created_partitions"]:
+        print(f"🧱 새 파티션 {len(summary['created_partitions'])}개: {', '.join(summary['created_partitions'])}")
+    print(
+        f"✅ {len(summary['archived_days'])}일 아카이브 "
+        f"(기사 {summary['removed_items']}개 중 {summary['kept_items']}개 보관), "
+        f"오래된 아카이브 {summary['pruned_archives']}일 삭제"
+    )
+
+
+if __name__ == '__main__':
+    main()